@@ -3,6 +3,7 @@ from .base import (
     visualize_patches,
     webcam_widget,
     plot_graph,
+    plot_graph_stream,
     save_matplotlib_figure,
     visualize_patch_appearance_model,
     visualize_images,
@@ -17,6 +18,7 @@ from .base import (
     visualize_shape_model_3d,
     visualize_morphable_model,
 )
+from .render import render_shapes, render_images, render_fitting_results
 from .menpofitwidgets import *
 
 from ._version import __version__
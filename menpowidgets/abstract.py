@@ -1,5 +1,7 @@
 from ipywidgets import Box, Layout
 
+from .records import freeze_options
+
 
 class MenpoWidget(Box):
     r"""
@@ -50,6 +52,21 @@ class MenpoWidget(Box):
         self._render_function = None
         self.add_render_function(render_function)
 
+    @property
+    def selected_record(self):
+        r"""
+        The `selected_values` as an immutable and hashable
+        `menpowidgets.records.OptionsRecord` (or value). It is computed once
+        per `selected_values` object, i.e. until the widget's options change.
+
+        :type: `menpowidgets.records.OptionsRecord` or `object`
+        """
+        values = self.selected_values
+        if getattr(self, "_record_source", None) is not values:
+            self._record = freeze_options(values)
+            self._record_source = values
+        return self._record
+
     def add_render_function(self, render_function):
         r"""
         Method that adds the provided `render_function()` as a callback handler
@@ -31,13 +31,33 @@ from .options import (
     SaveMayaviFigureOptionsWidget,
     Mesh3DOptionsWidget,
 )
-from .tools import LogoWidget, SwitchWidget
+from .tools import (
+    LogoWidget,
+    SwitchWidget,
+    MeshViewWidget,
+    MontageWidget,
+    ImageFilterWidget,
+)
 from .utils import (
     extract_group_labels_from_landmarks,
     extract_groups_labels_from_image,
+    select_label_colours,
     render_image,
     render_patches,
+    render_mesh_view,
+    loop_thread_callback,
+    png_to_rgb,
 )
+from .cache import cached_image_tile, as_render_cache, image_cache_source
+from .decimation import decimate_curves, decimate_trimesh, GlyphBudget
+from .montage import MontagePages, shape_tile
+from .progressive import ProgressiveRender, draft_view_options, figure_to_jpeg
+from .query import ImageIndex
+from .recording import record_renderer_frame
+from .reductions import channel_reductions
+from .streams import CurveStream
+from .workers import RenderPool, SharedImages
+from .render import render_shape_view, render_image_view, render_image_frame
 from .checks import check_n_parameters
 from .style import map_styles_to_hex_colours
 
@@ -60,8 +80,22 @@ def menpowidgets_src_dir_path():
     return Path(os.path.abspath(__file__)).parent
 
 
+def _show_draft(renderer):
+    # Show the figure as a reduced resolution JPEG instead of drawing it, then
+    # close it so that pyplot does not show it later
+    ipydisplay.display(
+        ipydisplay.Image(data=figure_to_jpeg(renderer.figure), format="jpeg")
+    )
+    plt.close(renderer.figure)
+
+
 def visualize_shapes_2d(
-    shapes, figure_size=(7, 7), browser_style="buttons", custom_info_callback=None
+    shapes,
+    figure_size=(7, 7),
+    browser_style="buttons",
+    custom_info_callback=None,
+    grid_shape=(4, 4),
+    settle_interval=None,
 ):
     r"""
     Widget that allows browsing through a `list` of
@@ -106,6 +140,16 @@ def visualize_shapes_2d(
         If not ``None``, it should be a function that accepts a 2D shape
         and returns a list of custom messages to be printed about it. Each
         custom message will be printed in a separate line.
+    grid_shape : (`int`, `int`), optional
+        The number of rows and columns of the pages of the grid mode, which
+        shows the shapes as thumbnails. Clicking on a thumbnail shows the
+        shape.
+    settle_interval : `float` or ``None``, optional
+        If not ``None``, then the slider browser updates while it is dragged.
+        While the selected shape keeps changing, the shapes are rendered as
+        fast drafts without numbering and legend, and the selected one is
+        rendered at full quality once the selection has been idle for
+        `settle_interval` seconds.
     """
     # Make sure that shapes is a list even with one member
     if not isinstance(shapes, Sized):
@@ -119,61 +163,74 @@ def visualize_shapes_2d(
 
     output = ipywidgets.Output()
 
+    def export_jobs(indices):
+        # Snapshot the selected options, since they may change while exporting
+        values = [
+            shape_options_wid.selected_record,
+            renderer_options_wid.selected_record,
+        ]
+
+        def job(i):
+            return (
+                render_shape_view,
+                dict(
+                    shape=shapes[i],
+                    shape_values=values[0],
+                    renderer_values=values[1],
+                    figure_size=figure_size,
+                ),
+            )
+
+        return (job(i) for i in indices)
+
+    # The selected index and options of the rendered figure
+    last_render = {"key": None}
+
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
         # Get selected shape index
         i = shape_number_wid.selected_values if n_shapes > 1 else 0
 
-        # Create options dictionary
-        options = dict()
-        options.update(shape_options_wid.selected_values["lines"])
-        options.update(shape_options_wid.selected_values["markers"])
-        options["image_view"] = shape_options_wid.selected_values["image_view"]
-        options.update(renderer_options_wid.selected_values["numbering_matplotlib"])
-        options.update(renderer_options_wid.selected_values["axes"])
-
-        # Correct options based on the type of the shape
-        if hasattr(shapes[i], "labels"):
-            # If the shape is a LabelledPointUndirectedGraph ...
-            # ...use the legend options
-            options.update(renderer_options_wid.selected_values["legend"])
-            # ...use with_labels
-            options["with_labels"] = shape_options_wid.selected_values["with_labels"]
-            # ...correct colours
-            line_colour = []
-            marker_face_colour = []
-            marker_edge_colour = []
-            for lbl in options["with_labels"]:
-                idx = shapes[i].labels.index(lbl)
-                line_colour.append(options["line_colour"][idx])
-                marker_face_colour.append(options["marker_face_colour"][idx])
-                marker_edge_colour.append(options["marker_edge_colour"][idx])
-            options["line_colour"] = line_colour
-            options["marker_face_colour"] = marker_face_colour
-            options["marker_edge_colour"] = marker_edge_colour
-        else:
-            # If shape is PointCloud, TriMesh or PointGraph
-            # ...correct colours
-            options["line_colour"] = options["line_colour"][0]
-            options["marker_face_colour"] = options["marker_face_colour"][0]
-            options["marker_edge_colour"] = options["marker_edge_colour"][0]
-
-        # Get figure size
-        new_figure_size = (
-            renderer_options_wid.selected_values["zoom_one"] * figure_size[0],
-            renderer_options_wid.selected_values["zoom_one"] * figure_size[1],
+        # Show the page of thumbnails that includes the shape
+        if grid_switch.selected_values:
+            image_view = shape_options_wid.selected_values["image_view"]
+            montage_wid.show(i, key=image_view)
+            ipydisplay.display(montage_wid)
+            return
+
+        # Render a draft while the selected shape keeps changing
+        draft = progressive.draft
+        if not draft:
+            progressive.cancel()
+
+        # If neither the shape nor the options changed, e.g. after resetting
+        # the options' widgets state, then show the rendered figure again
+        key = (
+            i,
+            shape_options_wid.selected_record,
+            renderer_options_wid.selected_record,
+            draft,
         )
+        if key == last_render["key"]:
+            ipydisplay.display(save_figure_wid.renderer.figure)
+            return
+        last_render["key"] = key
 
         # Render shape with selected options
-        save_figure_wid.renderer = shapes[i].view(
-            figure_id=save_figure_wid.renderer.figure_id,
-            new_figure=False,
-            figure_size=new_figure_size,
-            **options
+        save_figure_wid.renderer = render_shape_view(
+            shapes[i],
+            shape_options_wid.selected_values,
+            renderer_options_wid.selected_values,
+            figure_size=figure_size,
+            renderer=save_figure_wid.renderer,
+            draft=draft,
         )
 
         # Force rendering
-        save_figure_wid.renderer.force_draw()
+        if draft:
+            _show_draft(save_figure_wid.renderer)
+        else:
+            save_figure_wid.renderer.force_draw()
 
         # Update info text widget
         update_info(shapes[i], custom_info_callback=custom_info_callback)
@@ -217,7 +274,9 @@ def visualize_shapes_2d(
         render_function=render_function,
     )
     info_wid = TextPrintWidget(text_per_line=[""])
-    save_figure_wid = SaveMatplotlibFigureOptionsWidget()
+    save_figure_wid = SaveMatplotlibFigureOptionsWidget(
+        n_items=n_shapes, export_jobs_function=export_jobs
+    )
 
     # Group widgets
     # Define function that updates options' widgets state
@@ -231,22 +290,39 @@ def visualize_shapes_2d(
         # Update shape options
         shape_options_wid.set_widget_state(labels=labels, allow_callback=True)
 
+    # Render drafts while the selection keeps changing
+    progressive = ProgressiveRender(update_widgets, settle_interval=settle_interval)
+
     # Shape selection slider
     index = {"min": 0, "max": n_shapes - 1, "step": 1, "index": 0}
     shape_number_wid = AnimationOptionsWidget(
         index,
-        render_function=update_widgets,
+        render_function=progressive,
         index_style=browser_style,
         interval=0.2,
         description="Shape",
         loop_enabled=True,
-        continuous_update=False,
+        continuous_update=settle_interval is not None,
+        record_frame_function=lambda: record_renderer_frame(
+            save_figure_wid, progressive
+        ),
     )
 
+    # Grid mode
+    def make_tile(k, tile_shape):
+        image_view = shape_options_wid.selected_values["image_view"]
+        return shape_tile(shapes[k], tile_shape, image_view=image_view)
+
+    montage_wid = MontageWidget(
+        MontagePages(n_shapes, make_tile, grid_shape=grid_shape),
+        figure_width=figure_size[0],
+    )
+    grid_switch = montage_wid.link_index_widget(shape_number_wid, render_function)
+
     # Header widget
     logo_wid = LogoWidget(style=main_style)
     logo_wid.layout.margin = "0px 10px 0px 0px"
-    header_wid = ipywidgets.HBox([logo_wid, shape_number_wid])
+    header_wid = ipywidgets.HBox([logo_wid, shape_number_wid, grid_switch])
     header_wid.layout.align_items = "center"
     header_wid.layout.margin = "0px 0px 10px 0px"
 
@@ -273,7 +349,15 @@ def visualize_shapes_2d(
     render_function({})
 
 
-def visualize_shapes_3d(shapes, browser_style="buttons", custom_info_callback=None):
+def visualize_shapes_3d(
+    shapes,
+    browser_style="buttons",
+    custom_info_callback=None,
+    backend="mayavi",
+    decimate=True,
+    frame_time_budget=0.1,
+    voxel_downsampling=False,
+):
     r"""
     Widget that allows browsing through a `list` of
     3D shapes. The supported objects are:
@@ -313,6 +397,25 @@ def visualize_shapes_3d(shapes, browser_style="buttons", custom_info_callback=No
         If not ``None``, it should be a function that accepts a 2D shape
         and returns a list of custom messages to be printed about it. Each
         custom message will be printed in a separate line.
+    backend : ``{'mayavi', 'webgl'}``, optional
+        If ``'mayavi'``, the objects are rendered with Mayavi as a snapshot
+        image. If ``'webgl'``, they are rendered in the browser by a
+        `menpowidgets.tools.MeshViewWidget`, which only receives the vertex
+        buffers that changed and handles the camera client-side. Note that
+        the Export tab is only available with Mayavi.
+    decimate : `bool`, optional
+        If ``True``, then the Mayavi glyphs of dense objects are decimated so
+        that a frame is rendered within `frame_time_budget`, based on the
+        rendering throughput measured on the previous frames. The glyph
+        resolution is lowered first and then the points are subsampled with
+        a larger step. The effective decimation is reported in the Info tab.
+    frame_time_budget : `float`, optional
+        The time (in seconds) that rendering a frame should take, if
+        `decimate` is ``True``.
+    voxel_downsampling : `bool`, optional
+        If ``True`` and `decimate` is ``True``, then point clouds without
+        edges are downsampled for display with a voxel grid, i.e. the points
+        of each voxel are merged to their mean, instead of being subsampled.
     """
     # Make sure that shapes is a list even with one member
     if not isinstance(shapes, Sized):
@@ -324,18 +427,29 @@ def visualize_shapes_3d(shapes, browser_style="buttons", custom_info_callback=No
     # Define the styling options
     main_style = "warning"
 
+    # Check the given backend
+    if backend not in ["mayavi", "webgl"]:
+        raise ValueError("backend should be either mayavi or webgl")
+
     output = ipywidgets.Output()
+    mesh_view_wid = MeshViewWidget() if backend == "webgl" else None
+
+    # Decimate the glyphs of dense objects to fit the frame time budget
+    glyph_budget = None
+    if decimate and backend == "mayavi":
+        glyph_budget = GlyphBudget(
+            frame_time_budget=frame_time_budget,
+            voxel_downsampling=voxel_downsampling,
+        )
 
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
-        save_figure_wid.renderer.clear_figure()
+        if backend == "mayavi":
+            save_figure_wid.renderer.clear_figure()
 
         # Get selected shape index
         i = shape_number_wid.selected_values if n_shapes > 1 else 0
 
-        # Update info text widget
-        update_info(shapes[i], custom_info_callback=custom_info_callback)
-
         # Create options dictionary
         options = dict()
         if isinstance(shapes[i], TriMesh):
@@ -376,22 +490,29 @@ def visualize_shapes_3d(shapes, browser_style="buttons", custom_info_callback=No
                     "with_labels"
                 ]
                 # ...correct colours
-                line_colour = []
-                marker_colour = []
-                for lbl in options["with_labels"]:
-                    idx = shapes[i].labels.index(lbl)
-                    line_colour.append(options["line_colour"][idx])
-                    marker_colour.append(options["marker_colour"][idx])
-                options["line_colour"] = line_colour
-                options["marker_colour"] = marker_colour
+                select_label_colours(
+                    options, shapes[i].labels, ["line_colour", "marker_colour"]
+                )
             else:
                 # If shape is PointCloud, TriMesh or PointGraph
                 # ...correct colours
                 options["line_colour"] = options["line_colour"][0]
                 options["marker_colour"] = options["marker_colour"][0]
 
+        # Decimate the glyphs
+        shape = shapes[i]
+        decimation = None
+        if glyph_budget is not None:
+            shape, options, decimation = glyph_budget.decimate(shape, options)
+
+        # Update info text widget
+        update_info(shapes[i], decimation, custom_info_callback=custom_info_callback)
+
         # Render shape with selected options
-        save_figure_wid.renderer = shapes[i].view(
+        if backend == "webgl":
+            render_mesh_view(mesh_view_wid, shape, options)
+            return
+        save_figure_wid.renderer = shape.view(
             figure_id=save_figure_wid.renderer.figure_id,
             new_figure=False,
             alpha=1.0,
@@ -400,10 +521,12 @@ def visualize_shapes_3d(shapes, browser_style="buttons", custom_info_callback=No
 
         # Force rendering
         save_figure_wid.renderer.force_draw()
+        if glyph_budget is not None:
+            glyph_budget.update()
         output.append_display_data(save_figure_wid.renderer.figure)
 
     # Define function that updates the info text
-    def update_info(shape, custom_info_callback=None):
+    def update_info(shape, decimation, custom_info_callback=None):
         min_b, max_b = shape.bounds()
         rang = shape.range()
         cm = shape.centre()
@@ -420,6 +543,8 @@ def visualize_shapes_3d(shapes, browser_style="buttons", custom_info_callback=No
             ),
             "> Norm: {0:.2f}".format(shape.norm()),
         ]
+        if decimation is not None:
+            text_per_line.append("> {}".format(decimation))
         if custom_info_callback is not None:
             # iterate over the list of messages returned by the callback
             # function and append them in the text_per_line.
@@ -440,7 +565,7 @@ def visualize_shapes_3d(shapes, browser_style="buttons", custom_info_callback=No
         options_tabs=["numbering_mayavi"], labels=None, render_function=render_function
     )
     info_wid = TextPrintWidget(text_per_line=[""])
-    save_figure_wid = SaveMayaviFigureOptionsWidget()
+    save_figure_wid = SaveMayaviFigureOptionsWidget() if backend == "mayavi" else None
 
     # Group widgets
     if n_shapes > 1:
@@ -477,15 +602,21 @@ def visualize_shapes_3d(shapes, browser_style="buttons", custom_info_callback=No
         # Header widget
         header_wid = LogoWidget(style=main_style)
         header_wid.layout.margin = "0px 10px 0px 0px"
-    options_box = ipywidgets.Tab(
-        [info_wid, shape_options_wid, renderer_options_wid, save_figure_wid]
-    )
-    tab_titles = ["Info", "Shape", "Renderer", "Export"]
+    tab_children = [info_wid, shape_options_wid, renderer_options_wid]
+    tab_titles = ["Info", "Shape", "Renderer"]
+    if backend == "mayavi":
+        tab_children.append(save_figure_wid)
+        tab_titles.append("Export")
+    options_box = ipywidgets.Tab(tab_children)
     for k, tl in enumerate(tab_titles):
         options_box.set_title(k, tl)
 
     output.layout.align_self = "center"
-    wid = ipywidgets.VBox([header_wid, options_box, output])
+    if backend == "webgl":
+        mesh_view_wid.layout.align_self = "center"
+        wid = ipywidgets.VBox([header_wid, options_box, mesh_view_wid, output])
+    else:
+        wid = ipywidgets.VBox([header_wid, options_box, output])
 
     # Set widget's style
     wid.box_style = main_style
@@ -564,17 +695,11 @@ def visualize_landmarks_2d(
                     "landmarks"
                 ]["with_labels"]
                 # ...correct colours
-                line_colour = []
-                marker_face_colour = []
-                marker_edge_colour = []
-                for lbl in options["with_labels"]:
-                    id = shape.labels.index(lbl)
-                    line_colour.append(options["line_colour"][id])
-                    marker_face_colour.append(options["marker_face_colour"][id])
-                    marker_edge_colour.append(options["marker_edge_colour"][id])
-                options["line_colour"] = line_colour
-                options["marker_face_colour"] = marker_face_colour
-                options["marker_edge_colour"] = marker_edge_colour
+                select_label_colours(
+                    options,
+                    shape.labels,
+                    ["line_colour", "marker_face_colour", "marker_edge_colour"],
+                )
             else:
                 # If shape is PointCloud, TriMesh or PointGraph
                 # ...correct colours
@@ -672,6 +797,7 @@ def visualize_landmarks_2d(
             description="Shape",
             loop_enabled=True,
             continuous_update=False,
+            record_frame_function=lambda: record_renderer_frame(save_figure_wid),
         )
 
         # Header widget
@@ -708,7 +834,13 @@ def visualize_landmarks_2d(
 
 
 def visualize_landmarks_3d(
-    landmarks, browser_style="buttons", custom_info_callback=None
+    landmarks,
+    browser_style="buttons",
+    custom_info_callback=None,
+    backend="mayavi",
+    decimate=True,
+    frame_time_budget=0.1,
+    voxel_downsampling=False,
 ):
     r"""
     Widget that allows browsing through a `list` of
@@ -727,6 +859,25 @@ def visualize_landmarks_3d(
         If not None, it should be a function that accepts a landmark group and
         returns a list of custom messages to be printed per landmark group.
         Each custom message will be printed in a separate line.
+    backend : ``{'mayavi', 'webgl'}``, optional
+        If ``'mayavi'``, the objects are rendered with Mayavi as a snapshot
+        image. If ``'webgl'``, they are rendered in the browser by a
+        `menpowidgets.tools.MeshViewWidget`, which only receives the vertex
+        buffers that changed and handles the camera client-side. Note that
+        the Export tab is only available with Mayavi.
+    decimate : `bool`, optional
+        If ``True``, then the Mayavi glyphs of dense objects are decimated so
+        that a frame is rendered within `frame_time_budget`, based on the
+        rendering throughput measured on the previous frames. The glyph
+        resolution is lowered first and then the points are subsampled with
+        a larger step. The effective decimation is reported in the Info tab.
+    frame_time_budget : `float`, optional
+        The time (in seconds) that rendering a frame should take, if
+        `decimate` is ``True``.
+    voxel_downsampling : `bool`, optional
+        If ``True`` and `decimate` is ``True``, then point clouds without
+        edges are downsampled for display with a voxel grid, i.e. the points
+        of each voxel are merged to their mean, instead of being subsampled.
     """
     # Make sure that landmarks is a list even with one landmark manager member
     if not isinstance(landmarks, list):
@@ -738,11 +889,25 @@ def visualize_landmarks_3d(
     # Define the styling options
     main_style = "info"
 
+    # Check the given backend
+    if backend not in ["mayavi", "webgl"]:
+        raise ValueError("backend should be either mayavi or webgl")
+
     output = ipywidgets.Output()
+    mesh_view_wid = MeshViewWidget() if backend == "webgl" else None
+
+    # Decimate the glyphs of dense objects to fit the frame time budget
+    glyph_budget = None
+    if decimate and backend == "mayavi":
+        glyph_budget = GlyphBudget(
+            frame_time_budget=frame_time_budget,
+            voxel_downsampling=voxel_downsampling,
+        )
 
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
-        save_figure_wid.renderer.clear_figure()
+        if backend == "mayavi":
+            save_figure_wid.renderer.clear_figure()
 
         # get selected index and selected group
         i = landmark_number_wid.selected_values if n_landmarks > 1 else 0
@@ -796,21 +961,30 @@ def visualize_landmarks_3d(
                         "landmarks"
                     ]["with_labels"]
                     # ...correct colours
-                    line_colour = []
-                    marker_colour = []
-                    for lbl in options["with_labels"]:
-                        idx = shape.labels.index(lbl)
-                        line_colour.append(options["line_colour"][idx])
-                        marker_colour.append(options["marker_colour"][idx])
-                    options["line_colour"] = line_colour
-                    options["marker_colour"] = marker_colour
+                    select_label_colours(
+                        options, shape.labels, ["line_colour", "marker_colour"]
+                    )
                 else:
                     # If shape is PointCloud, TriMesh or PointGraph
                     # ...correct colours
                     options["line_colour"] = options["line_colour"][0]
                     options["marker_colour"] = options["marker_colour"][0]
 
+            # Decimate the glyphs
+            if glyph_budget is not None:
+                shape, options, decimation = glyph_budget.decimate(shape, options)
+                if decimation is not None:
+                    update_info(
+                        landmarks[i],
+                        g,
+                        decimation=decimation,
+                        custom_info_callback=custom_info_callback,
+                    )
+
             # Render shape with selected options
+            if backend == "webgl":
+                render_mesh_view(mesh_view_wid, shape, options)
+                return
             save_figure_wid.renderer = shape.view(
                 figure_id=save_figure_wid.renderer.figure_id,
                 new_figure=False,
@@ -820,11 +994,15 @@ def visualize_landmarks_3d(
 
             # Force rendering
             save_figure_wid.renderer.force_draw()
+            if glyph_budget is not None:
+                glyph_budget.update()
+        elif backend == "webgl":
+            mesh_view_wid.set_mesh(np.empty((0, 3)))
         else:
             output.clear_output()
 
     # Define function that updates the info text
-    def update_info(landmarks, group, custom_info_callback=None):
+    def update_info(landmarks, group, decimation=None, custom_info_callback=None):
         if group is not None:
             min_b, max_b = landmarks[group].bounds()
             rang = landmarks[group].range()
@@ -844,6 +1022,8 @@ def visualize_landmarks_3d(
                 ),
                 "> Norm: {0:.2f}".format(landmarks[group].norm()),
             ]
+            if decimation is not None:
+                text_per_line.append("> {}".format(decimation))
             if custom_info_callback is not None:
                 # iterate over the list of messages returned by the callback
                 # function and append them in the text_per_line.
@@ -869,7 +1049,7 @@ def visualize_landmarks_3d(
         render_function=render_function,
     )
     info_wid = TextPrintWidget(text_per_line=[""])
-    save_figure_wid = SaveMayaviFigureOptionsWidget()
+    save_figure_wid = SaveMayaviFigureOptionsWidget() if backend == "mayavi" else None
 
     # Group widgets
     if n_landmarks > 1:
@@ -906,15 +1086,21 @@ def visualize_landmarks_3d(
         # Header widget
         header_wid = LogoWidget(style=main_style)
         header_wid.layout.margin = "0px 10px 0px 0px"
-    options_box = ipywidgets.Tab(
-        children=[info_wid, landmark_options_wid, renderer_options_wid, save_figure_wid]
-    )
-    tab_titles = ["Info", "Landmarks", "Renderer", "Export"]
+    tab_children = [info_wid, landmark_options_wid, renderer_options_wid]
+    tab_titles = ["Info", "Landmarks", "Renderer"]
+    if backend == "mayavi":
+        tab_children.append(save_figure_wid)
+        tab_titles.append("Export")
+    options_box = ipywidgets.Tab(children=tab_children)
     for k, tl in enumerate(tab_titles):
         options_box.set_title(k, tl)
 
     output.layout.align_self = "center"
-    wid = ipywidgets.VBox([header_wid, options_box, output])
+    if backend == "webgl":
+        mesh_view_wid.layout.align_self = "center"
+        wid = ipywidgets.VBox([header_wid, options_box, mesh_view_wid, output])
+    else:
+        wid = ipywidgets.VBox([header_wid, options_box, output])
 
     # Set widget's style
     wid.box_style = main_style
@@ -930,7 +1116,13 @@ def visualize_landmarks_3d(
     print_dynamic("")
 
 
-def visualize_meshes_3d(meshes, browser_style="buttons", custom_info_callback=None):
+def visualize_meshes_3d(
+    meshes,
+    browser_style="buttons",
+    custom_info_callback=None,
+    decimate=True,
+    backend="mayavi",
+):
     r"""
     Widget that allows browsing through a `list` of 3D meshes. The supported
     objects are:
@@ -966,6 +1158,19 @@ def visualize_meshes_3d(meshes, browser_style="buttons", custom_info_callback=No
         If not ``None``, it should be a function that accepts a 3D mesh
         and returns a list of custom messages to be printed about it. Each
         custom message will be printed in a separate line.
+    decimate : `bool`, optional
+        If ``True``, then meshes with more triangles than the figure can show
+        (roughly half the number of pixels of the figure) are rendered
+        decimated with vertex clustering. The decimated meshes are computed
+        lazily and the ones of the few most recently browsed meshes are
+        cached, whereas the full resolution meshes are used when saving the
+        figure from the ``Export`` tab.
+    backend : ``{'mayavi', 'webgl'}``, optional
+        If ``'mayavi'``, the objects are rendered with Mayavi as a snapshot
+        image. If ``'webgl'``, they are rendered in the browser by a
+        `menpowidgets.tools.MeshViewWidget`, which only receives the vertex
+        buffers that changed and handles the camera client-side. Note that
+        the Export tab is only available with Mayavi.
     """
     # Make sure that meshes is a list even with one member
     if not isinstance(meshes, Sized):
@@ -977,22 +1182,61 @@ def visualize_meshes_3d(meshes, browser_style="buttons", custom_info_callback=No
     # Define the styling options
     main_style = "warning"
 
-    output = ipywidgets.Output()
+    # Check the given backend
+    if backend not in ["mayavi", "webgl"]:
+        raise ValueError("backend should be either mayavi or webgl")
 
-    # Define render function
-    @output.capture(clear_output=True, wait=True)
-    def render_function(_):
-        # Clear current figure
-        save_figure_wid.renderer.clear_figure()
+    output = ipywidgets.Output()
+    mesh_view_wid = MeshViewWidget() if backend == "webgl" else None
+
+    # The decimated version of the most recently browsed meshes is kept
+    # together with the number of triangles it was computed for, so that it
+    # only gets recomputed if the size of the figure changes
+    decimated_meshes = OrderedDict()
+    n_decimated_meshes = 4
+
+    def get_n_triangles():
+        # Roughly two pixels of the figure per triangle
+        if backend == "webgl":
+            width, height = mesh_view_wid.width, mesh_view_wid.height
+        else:
+            try:
+                width, height = save_figure_wid.renderer.figure.scene.get_size()
+            except AttributeError:
+                width = save_figure_wid.size_width.value
+                height = save_figure_wid.size_height.value
+        return max(width * height // 2, 1000)
+
+    def get_rendered_mesh(i, full_resolution=False):
+        if not decimate or full_resolution:
+            return meshes[i]
+        n_triangles = get_n_triangles()
+        if decimated_meshes.get(i, (None,))[0] != n_triangles:
+            decimated_meshes[i] = (
+                n_triangles,
+                decimate_trimesh(meshes[i], n_triangles),
+            )
+        decimated_meshes.move_to_end(i)
+        while len(decimated_meshes) > n_decimated_meshes:
+            decimated_meshes.popitem(last=False)
+        return decimated_meshes[i][1]
 
+    def render_mesh(full_resolution=False):
         # Get selected mesh index
         i = mesh_number_wid.selected_values if n_meshes > 1 else 0
+        if backend == "webgl":
+            render_mesh_view(
+                mesh_view_wid,
+                get_rendered_mesh(i, full_resolution),
+                mesh_options_wid.selected_values,
+            )
+            return
 
-        # Update info text widget
-        update_info(meshes[i], custom_info_callback=custom_info_callback)
+        # Clear current figure
+        save_figure_wid.renderer.clear_figure()
 
         # Render instance
-        save_figure_wid.renderer = meshes[i].view(
+        save_figure_wid.renderer = get_rendered_mesh(i, full_resolution).view(
             figure_id=save_figure_wid.renderer.figure_id,
             new_figure=False,
             **mesh_options_wid.selected_values
@@ -1000,10 +1244,32 @@ def visualize_meshes_3d(meshes, browser_style="buttons", custom_info_callback=No
 
         # Force rendering
         save_figure_wid.renderer.force_draw()
-        output.append_display_data(save_figure_wid.renderer.figure)
+
+    # Define render function
+    @output.capture(clear_output=True, wait=True)
+    def render_function(_):
+        # Get selected mesh index
+        i = mesh_number_wid.selected_values if n_meshes > 1 else 0
+
+        # Render instance
+        render_mesh()
+        if backend == "mayavi":
+            output.append_display_data(save_figure_wid.renderer.figure)
+
+        # Update info text widget
+        update_info(
+            meshes[i], get_rendered_mesh(i), custom_info_callback=custom_info_callback
+        )
+
+    # Define function that renders the full resolution mesh before exporting
+    # and the decimated one after it
+    def export_render_function(full_resolution):
+        i = mesh_number_wid.selected_values if n_meshes > 1 else 0
+        if get_rendered_mesh(i) is not meshes[i]:
+            render_mesh(full_resolution)
 
     # Define function that updates the info text
-    def update_info(mesh, custom_info_callback=None):
+    def update_info(mesh, rendered_mesh, custom_info_callback=None):
         min_b, max_b = mesh.bounds()
         rang = mesh.range()
         cm = mesh.centre()
@@ -1020,6 +1286,12 @@ def visualize_meshes_3d(meshes, browser_style="buttons", custom_info_callback=No
             ),
             "> Norm: {0:.2f}".format(mesh.norm()),
         ]
+        if rendered_mesh is not mesh:
+            text_per_line.append(
+                "> Rendered decimated to {} of {} triangles".format(
+                    rendered_mesh.n_tris, mesh.n_tris
+                )
+            )
         if custom_info_callback is not None:
             # iterate over the list of messages returned by the callback
             # function and append them in the text_per_line.
@@ -1036,7 +1308,11 @@ def visualize_meshes_3d(meshes, browser_style="buttons", custom_info_callback=No
         render_function=render_function,
     )
     info_wid = TextPrintWidget(text_per_line=[""])
-    save_figure_wid = SaveMayaviFigureOptionsWidget()
+    save_figure_wid = None
+    if backend == "mayavi":
+        save_figure_wid = SaveMayaviFigureOptionsWidget(
+            export_render_function=export_render_function if decimate else None
+        )
 
     # Group widgets
     if n_meshes > 1:
@@ -1075,13 +1351,21 @@ def visualize_meshes_3d(meshes, browser_style="buttons", custom_info_callback=No
         # Header widget
         header_wid = LogoWidget(style=main_style)
         header_wid.layout.margin = "0px 10px 0px 0px"
-    options_box = ipywidgets.Tab([info_wid, mesh_options_wid, save_figure_wid])
-    tab_titles = ["Info", "Mesh", "Export"]
+    tab_children = [info_wid, mesh_options_wid]
+    tab_titles = ["Info", "Mesh"]
+    if backend == "mayavi":
+        tab_children.append(save_figure_wid)
+        tab_titles.append("Export")
+    options_box = ipywidgets.Tab(tab_children)
     for k, tl in enumerate(tab_titles):
         options_box.set_title(k, tl)
 
     output.layout.align_self = "center"
-    wid = ipywidgets.VBox([header_wid, options_box, output])
+    if backend == "webgl":
+        mesh_view_wid.layout.align_self = "center"
+        wid = ipywidgets.VBox([header_wid, options_box, mesh_view_wid, output])
+    else:
+        wid = ipywidgets.VBox([header_wid, options_box, output])
 
     # Set widget's style
     wid.box_style = main_style
@@ -1098,7 +1382,14 @@ def visualize_meshes_3d(meshes, browser_style="buttons", custom_info_callback=No
 
 
 def visualize_images(
-    images, figure_size=(7, 7), browser_style="buttons", custom_info_callback=None
+    images,
+    figure_size=(7, 7),
+    browser_style="buttons",
+    custom_info_callback=None,
+    grid_shape=(4, 4),
+    cache_dir=None,
+    render_workers=None,
+    settle_interval=None,
 ):
     r"""
     Widget that allows browsing through a `list` of `menpo.image.Image` (or
@@ -1106,6 +1397,13 @@ def visualize_images(
     attributes, e.g. masked or not, landmarked or not, without multiple
     landmark groups and labels etc.
 
+    The header has a filter box that restricts the browsed images to the ones
+    whose metadata match a query, e.g. ``n_channels == 1`` or
+    ``not has('PTS')`` (see `menpowidgets.query.ImageIndex`). The metadata
+    are indexed in the background once the first query is applied, thus until
+    the indexing finishes a query only matches the images that are already
+    indexed.
+
     Parameters
     ----------
     images : `list` of `menpo.image.Image` or subclass
@@ -1119,6 +1417,31 @@ def visualize_images(
         If not None, it should be a function that accepts an image and returns
         a list of custom messages to be printed per image. Each custom message
         will be printed in a separate line.
+    grid_shape : (`int`, `int`), optional
+        The number of rows and columns of the pages of the grid mode, which
+        shows the images as thumbnails with their landmarks. Clicking on a
+        thumbnail shows the image.
+    cache_dir : `str` or `pathlib.Path` or ``None``, optional
+        If not ``None``, then the thumbnails of the grid mode and the figures
+        of the batch export are read from and stored to the persistent render
+        cache of the directory (see `menpowidgets.cache.RenderCache`), so that
+        they are not rendered again after a kernel restart. Only the images
+        that have a ``path`` are cached.
+    render_workers : `int` or ``None``, optional
+        If not ``None``, then the figures are rendered by this number of worker
+        processes and shown as PNG frames, so that the widget stays responsive
+        while heavy figures render. The images are passed to the workers
+        through shared memory and only the latest render request is kept. The
+        workers are stopped and the shared memory is released when the widget
+        is closed. If ``None``, then the figures are rendered in the kernel.
+    settle_interval : `float` or ``None``, optional
+        If not ``None``, then the slider browser updates while it is dragged.
+        While the selected image keeps changing, the images are rendered as
+        fast drafts, i.e. with nearest interpolation, without numbering and
+        legend, and shown as reduced resolution JPEG frames. The selected
+        image is rendered at full quality once the selection has been idle
+        for `settle_interval` seconds. The frames that are rendered out of
+        process are not drafted.
     """
     # Make sure that images is a list even with one member
     if not isinstance(images, Sized):
@@ -1130,63 +1453,145 @@ def visualize_images(
     # Define the styling options
     main_style = "info"
 
+    # Open the persistent render cache
+    render_cache = as_render_cache(cache_dir)
+
+    # Start the out-of-process rendering
+    render_pool = None
+    if render_workers is not None:
+        render_pool = RenderPool(render_workers)
+        shared_images = SharedImages()
+        frame_wid = ipywidgets.Image(format="png")
+
     output = ipywidgets.Output()
 
+    # The indices of the browsed images, i.e. the ones that match the filter
+    browsed = {"indices": np.arange(n_images)}
+
+    def selected_image():
+        return int(browsed["indices"][image_number_wid.selected_values])
+
+    def record_frame():
+        # The frames that are rendered out of process are grabbed from the pool
+        if render_pool is not None:
+            return png_to_rgb(render_pool.wait())
+        return record_renderer_frame(save_figure_wid, progressive)
+
+    @loop_thread_callback
+    def show_frame(future):
+        # Show a frame rendered out of process. It is called by a thread of the
+        # render pool and runs on the kernel's thread, which syncs the widgets.
+        try:
+            frame_wid.value = future.result()
+        except Exception as e:
+            output.append_stderr("{}\n".format(e))
+
+    def render_saved_figure():
+        # Out of process, the saved figure is only rendered in the kernel when
+        # the save button is clicked
+        save_figure_wid.renderer = render_image_view(
+            images[selected_image() if n_images > 1 else 0],
+            landmark_options_wid.selected_values,
+            renderer_options_wid.selected_values,
+            image_options_wid.selected_values,
+            figure_size=figure_size,
+            renderer=save_figure_wid.renderer,
+        )
+        return save_figure_wid.renderer
+
+    def export_jobs(indices):
+        # Snapshot the selected options, since they may change while exporting
+        values = [
+            landmark_options_wid.selected_record,
+            renderer_options_wid.selected_record,
+            image_options_wid.selected_record,
+        ]
+
+        def job(i):
+            # The exported files are cached per source file and options
+            cache_key = None
+            if render_cache is not None:
+                path, content = image_cache_source(images[i])
+                cache_key = (path, (values, figure_size, content))
+            return (
+                render_image_view,
+                dict(
+                    image=images[i],
+                    landmark_values=values[0],
+                    renderer_values=values[1],
+                    image_values=values[2],
+                    figure_size=figure_size,
+                ),
+                cache_key,
+            )
+
+        return (job(i) for i in indices)
+
+    # The selected index and options of the rendered figure
+    last_render = {"key": None}
+
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
         # get selected index and selected group
-        i = image_number_wid.selected_values if n_images > 1 else 0
+        i = selected_image() if n_images > 1 else 0
         g = landmark_options_wid.selected_values["landmarks"]["group"]
 
+        # Show the page of thumbnails that includes the image
+        if n_images > 1 and grid_switch.selected_values:
+            montage_wid.show(image_number_wid.selected_values, key=montage_group())
+            ipydisplay.display(montage_wid)
+            return
+
+        # Render a draft while the selected image keeps changing
+        draft = progressive.draft and render_pool is None
+        if not draft:
+            progressive.cancel()
+
+        # If neither the image nor the options changed, e.g. after resetting
+        # the options' widgets state, then show the rendered figure again
+        key = (
+            i,
+            landmark_options_wid.selected_record,
+            renderer_options_wid.selected_record,
+            image_options_wid.selected_record,
+            draft,
+        )
+        if key == last_render["key"]:
+            if render_pool is not None:
+                ipydisplay.display(frame_wid)
+            else:
+                ipydisplay.display(save_figure_wid.renderer.figure)
+            return
+        last_render["key"] = key
+
         # check if image is masked
         image_is_masked = isinstance(images[i], MaskedImage)
 
-        # Create options dictionary
-        options = dict()
-        options.update(landmark_options_wid.selected_values["lines"])
-        options.update(landmark_options_wid.selected_values["markers"])
-        options.update(renderer_options_wid.selected_values["numbering_matplotlib"])
-        options.update(renderer_options_wid.selected_values["axes"])
-        options.update(renderer_options_wid.selected_values["legend"])
-        options.update(image_options_wid.selected_values)
-        options.update(landmark_options_wid.selected_values["landmarks"])
-
-        # Correct options based on the type of the shape
-        if images[i].has_landmarks and hasattr(images[i].landmarks[g], "labels"):
-            # If the shape is a LabelledPointUndirectedGraph ...
-            # ...correct colours
-            line_colour = []
-            marker_face_colour = []
-            marker_edge_colour = []
-            for lbl in options["with_labels"]:
-                id = images[i].landmarks[g].labels.index(lbl)
-                line_colour.append(options["line_colour"][id])
-                marker_face_colour.append(options["marker_face_colour"][id])
-                marker_edge_colour.append(options["marker_edge_colour"][id])
-            options["line_colour"] = line_colour
-            options["marker_face_colour"] = marker_face_colour
-            options["marker_edge_colour"] = marker_edge_colour
+        # Render image with selected options
+        if render_pool is not None:
+            # The previous frame is shown until the new one is rendered
+            render_pool.submit(
+                show_frame,
+                render_image_frame,
+                shared_images.share(images[i]),
+                landmark_options_wid.selected_record,
+                renderer_options_wid.selected_record,
+                image_options_wid.selected_record,
+                figure_size,
+            )
+            ipydisplay.display(frame_wid)
         else:
-            # If shape is PointCloud, TriMesh or PointGraph
-            # ...correct colours
-            options["line_colour"] = options["line_colour"][0]
-            options["marker_face_colour"] = options["marker_face_colour"][0]
-            options["marker_edge_colour"] = options["marker_edge_colour"][0]
-
-        # Get figure size
-        new_figure_size = (
-            renderer_options_wid.selected_values["zoom_one"] * figure_size[0],
-            renderer_options_wid.selected_values["zoom_one"] * figure_size[1],
-        )
-
-        # Render shape with selected options
-        save_figure_wid.renderer = render_image(
-            image=images[i],
-            renderer=save_figure_wid.renderer,
-            image_is_masked=image_is_masked,
-            figure_size=new_figure_size,
-            **options
-        )
+            save_figure_wid.renderer = render_image_view(
+                images[i],
+                landmark_options_wid.selected_values,
+                renderer_options_wid.selected_values,
+                image_options_wid.selected_values,
+                figure_size=figure_size,
+                renderer=save_figure_wid.renderer,
+                draft=draft,
+            )
+            if draft:
+                _show_draft(save_figure_wid.renderer)
 
         # Update info
         update_info(
@@ -1206,14 +1611,23 @@ def visualize_images(
             ),
             "> Path: '{}'".format(path_str),
         ]
+        if len(browsed["indices"]) < n_images:
+            text_per_line.append(
+                "> Image {} of the list ({} of {} filtered images)".format(
+                    browsed["indices"][image_number_wid.selected_values],
+                    image_number_wid.selected_values + 1,
+                    len(browsed["indices"]),
+                )
+            )
         if image_is_masked:
             text_per_line.append(
                 "> {} masked pixels (attached mask {:.1%} true)".format(
                     img.n_true_pixels(), img.mask.proportion_true()
                 )
             )
+        ranges = channel_reductions(img).channel_ranges()
         text_per_line.append(
-            "> min={:.3f}, max={:.3f}".format(img.pixels.min(), img.pixels.max())
+            "> min={:.3f}, max={:.3f}".format(ranges[:, 0].min(), ranges[:, 1].max())
         )
         if img.has_landmarks:
             text_per_line.append(
@@ -1227,12 +1641,14 @@ def visualize_images(
         info_wid.set_widget_state(text_per_line=text_per_line)
 
     # Create widgets
+    image_index = ImageIndex(images, background=True, lazy=True)
     groups_keys, labels_keys = extract_groups_labels_from_image(images[0])
     first_label = labels_keys[0] if labels_keys else None
     image_options_wid = ImageOptionsWidget(
         n_channels=images[0].n_channels,
         image_is_masked=isinstance(images[0], MaskedImage),
         render_function=render_function,
+        reduction_views=True,
     )
     landmark_options_wid = LandmarkOptionsWidget(
         group_keys=groups_keys,
@@ -1248,13 +1664,26 @@ def visualize_images(
         render_function=render_function,
     )
     info_wid = TextPrintWidget(text_per_line=[""])
-    save_figure_wid = SaveMatplotlibFigureOptionsWidget()
+    save_figure_wid = SaveMatplotlibFigureOptionsWidget(
+        n_items=n_images,
+        export_jobs_function=export_jobs,
+        render_cache=render_cache,
+        renderer_function=render_saved_figure if render_pool is not None else None,
+    )
 
     # Define function that updates options' widgets state
     def update_widgets(change):
-        # Get new groups and labels, then update landmark options
-        i = image_number_wid.selected_values
-        g_keys, l_keys = extract_groups_labels_from_image(images[i])
+        # Get new groups and labels from the index, or from the image if it
+        # is not indexed yet, then update landmark options
+        i = selected_image()
+        if image_index.indexed[i]:
+            g_keys, l_keys = image_index.groups_labels(i)
+            n_channels = int(image_index.n_channels[i])
+            image_is_masked = bool(image_index.masked[i])
+        else:
+            g_keys, l_keys = extract_groups_labels_from_image(images[i])
+            n_channels = images[i].n_channels
+            image_is_masked = isinstance(images[i], MaskedImage)
 
         # Update landmarks options
         landmark_options_wid.set_widget_state(
@@ -1263,27 +1692,69 @@ def visualize_images(
 
         # Update channels options
         image_options_wid.set_widget_state(
-            n_channels=images[i].n_channels,
-            image_is_masked=isinstance(images[i], MaskedImage),
+            n_channels=n_channels,
+            image_is_masked=image_is_masked,
             allow_callback=True,
         )
 
+    # Render drafts while the selection keeps changing
+    progressive = ProgressiveRender(update_widgets, settle_interval=settle_interval)
+
     # Image selection slider
     index = {"min": 0, "max": n_images - 1, "step": 1, "index": 0}
     image_number_wid = AnimationOptionsWidget(
         index,
-        render_function=update_widgets,
+        render_function=progressive,
         index_style=browser_style,
         interval=0.2,
         description="Image",
         loop_enabled=True,
-        continuous_update=False,
+        continuous_update=settle_interval is not None,
+        record_frame_function=record_frame,
     )
 
+    # Grid mode
+    def montage_group():
+        landmarks = landmark_options_wid.selected_values["landmarks"]
+        return landmarks["group"] if landmarks["render_landmarks"] else None
+
+    def make_tile(k, tile_shape):
+        return cached_image_tile(
+            render_cache,
+            images[browsed["indices"][k]],
+            tile_shape,
+            group=montage_group(),
+        )
+
+    montage_wid = MontageWidget(
+        MontagePages(n_images, make_tile, grid_shape=grid_shape),
+        figure_width=figure_size[0],
+    )
+    grid_switch = montage_wid.link_index_widget(image_number_wid, render_function)
+
+    # Filter
+    def filter_images(change):
+        # Browse the matching images, staying on the selected image if it
+        # matches or moving to the next one that does
+        i = selected_image()
+        indices = filter_wid.indices
+        browsed["indices"] = indices
+        montage_wid.set_pages(
+            MontagePages(len(indices), make_tile, grid_shape=grid_shape)
+        )
+        montage_wid.set_index(
+            int(min(np.searchsorted(indices, i), len(indices) - 1)),
+            allow_callback=False,
+        )
+        update_widgets({})
+
+    filter_wid = ImageFilterWidget(image_index, render_function=filter_images)
+    filter_wid.layout.margin = "0px 0px 0px 10px"
+
     # Header widget
     logo_wid = LogoWidget(style=main_style)
     logo_wid.layout.margin = "0px 10px 0px 0px"
-    header_wid = ipywidgets.HBox([logo_wid, image_number_wid])
+    header_wid = ipywidgets.HBox([logo_wid, image_number_wid, grid_switch, filter_wid])
     header_wid.layout.align_items = "center"
     header_wid.layout.margin = "0px 0px 10px 0px"
 
@@ -1311,6 +1782,18 @@ def visualize_images(
     final_box.layout.display = "flex"
     ipydisplay.display(final_box)
 
+    # Stop the workers of this widget when it gets closed
+    if render_pool is not None:
+        final_box.render_pool = render_pool
+        final_box.shared_images = shared_images
+
+        def release_render_pool(change):
+            if change["new"] is None:
+                change["owner"].render_pool.shutdown()
+                change["owner"].shared_images.close()
+
+        final_box.observe(release_render_pool, names="comm")
+
     # Trigger initial visualization
     render_function({})
 
@@ -1501,6 +1984,7 @@ def visualize_patches(
             description="Image",
             loop_enabled=True,
             continuous_update=False,
+            record_frame_function=lambda: record_renderer_frame(save_figure_wid),
         )
 
         # Header widget
@@ -1543,61 +2027,99 @@ def visualize_patches(
     render_function({})
 
 
-def plot_graph(x_axis, y_axis, legend_entries=None, figure_size=(9, 5)):
+def _create_plot_graph_widget(get_curves, legend_entries, figure_size):
     r"""
-    Widget that allows plotting various curves in a graph.
-
-    The widget has options tabs regarding the graph and the renderer (lines,
-    markers, legend, figure, axes, grid) and saving the figure to file.
-
-    Parameters
-    ----------
-    x_axis : `list` of `float`
-        The values of the horizontal axis. Note that these values are common for
-        all the curves.
-    y_axis : `list` of `lists` of `float`
-        A `list` that stores a `list` of values to be plotted for each curve.
-    legend_entries : `list` or `str` or ``None``, optional
-        The `list` of names that will appear on the legend for each curve. If
-        ``None``, then the names format is ``curve {}.format(i)``.
-    figure_size : (`int`, `int`), optional
-        The initial size of the rendered figure.
+    Function that creates and displays the widget of :func:`plot_graph` and
+    :func:`plot_graph_stream`. The curves are given by the `get_curves`
+    function, which is called on every render with the selected horizontal
+    axis limits and figure width (in inches) and returns the horizontal values
+    and the `list` of the values of each curve. The function returns the
+    render function of the widget and a function without arguments that only
+    updates the data of the rendered curves, e.g. after new samples have been
+    appended, keeping the rest of the figure.
     """
     from menpo.visualize import plot_curve
-
-    # Get number of curves to be plotted
-    n_curves = len(y_axis)
+    from menpo.visualize.viewmatplotlib import _parse_axes_limits
 
     # Define the styling options
     main_style = "danger"
 
     output = ipywidgets.Output()
 
-    # Parse options
-    if legend_entries is None:
-        legend_entries = ["curve {}".format(i) for i in range(n_curves)]
+    # The Line2D objects of the rendered curves
+    curve_lines = []
+
+    def get_figure_size():
+        return (
+            plot_wid.selected_values["zoom"][0] * figure_size[0],
+            plot_wid.selected_values["zoom"][1] * figure_size[1],
+        )
 
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
         # plot with selected options
         opts = plot_wid.selected_values.copy()
-        new_figure_size = (
-            plot_wid.selected_values["zoom"][0] * figure_size[0],
-            plot_wid.selected_values["zoom"][1] * figure_size[1],
-        )
+        new_figure_size = get_figure_size()
         del opts["zoom"]
+        x_values, y_values = get_curves(opts["axes_x_limits"], new_figure_size[0])
+        del curve_lines[:]
+        if len(x_values) == 0:
+            # nothing to plot yet
+            return
         save_figure_wid.renderer = plot_curve(
-            x_axis=x_axis,
-            y_axis=y_axis,
+            x_axis=x_values,
+            y_axis=y_values,
             figure_size=new_figure_size,
             figure_id=save_figure_wid.renderer.figure_id,
             new_figure=False,
             **opts
         )
+        curve_lines.extend(
+            save_figure_wid.renderer.figure.gca().lines[-len(y_values) :]
+        )
 
         # show plot
         save_figure_wid.renderer.force_draw()
 
+    def update_function():
+        if len(curve_lines) == 0:
+            render_function({})
+            return
+        opts = plot_wid.selected_values
+        x_values, y_values = get_curves(opts["axes_x_limits"], get_figure_size()[0])
+        if len(x_values) == 0:
+            return
+        for line, y in zip(curve_lines, y_values):
+            line.set_data(x_values, y)
+
+        # update the axes limits as plot_curve does
+        axes_x_limits, axes_y_limits = _parse_axes_limits(
+            np.min(x_values),
+            np.max(x_values),
+            np.min([np.min(y) for y in y_values]),
+            np.max([np.max(y) for y in y_values]),
+            opts["axes_x_limits"],
+            opts["axes_y_limits"],
+        )
+        ax = curve_lines[0].axes
+        ax.relim()
+        ax.autoscale(enable=axes_x_limits is None, axis="x")
+        ax.autoscale(enable=axes_y_limits is None, axis="y")
+        if axes_x_limits is not None:
+            ax.set_xlim(np.sort(axes_x_limits))
+        if axes_y_limits is not None:
+            ax.set_ylim(np.sort(axes_y_limits))
+
+        # show plot
+        figure = ax.figure
+        if plt.fignum_exists(figure.number):
+            # the backend keeps the figure open, so it updates in place
+            figure.canvas.draw_idle()
+        else:
+            output.clear_output(wait=True)
+            with output:
+                ipydisplay.display(figure)
+
     # Create widgets
     plot_wid = PlotMatplotlibOptionsWidget(
         legend_entries=legend_entries, render_function=render_function
@@ -1628,10 +2150,146 @@ def plot_graph(x_axis, y_axis, legend_entries=None, figure_size=(9, 5)):
     final_box.layout.display = "flex"
     ipydisplay.display(final_box)
 
+    return render_function, update_function
+
+
+def plot_graph(x_axis, y_axis, legend_entries=None, figure_size=(9, 5), decimate=True):
+    r"""
+    Widget that allows plotting various curves in a graph.
+
+    The widget has options tabs regarding the graph and the renderer (lines,
+    markers, legend, figure, axes, grid) and saving the figure to file.
+
+    Parameters
+    ----------
+    x_axis : `list` of `float` or ``(n_samples,)`` `ndarray`
+        The values of the horizontal axis. Note that these values are common for
+        all the curves.
+    y_axis : `list` of `lists` of `float` or `list` of `ndarray`
+        A `list` that stores a `list` of values to be plotted for each curve.
+    legend_entries : `list` or `str` or ``None``, optional
+        The `list` of names that will appear on the legend for each curve. If
+        ``None``, then the names format is ``curve {}.format(i)``.
+    figure_size : (`int`, `int`), optional
+        The initial size of the rendered figure.
+    decimate : `bool`, optional
+        If ``True``, then curves with more samples than twice the figure's width
+        in pixels are reduced to the minimum and maximum value per pixel column
+        before rendering. If the horizontal axis limits are set to a range, only
+        the visible samples are decimated, so zooming in reveals the full
+        detail.
+    """
+    # Get number of curves to be plotted
+    n_curves = len(y_axis)
+
+    # Make sure that the values are arrays, so that they can be sliced and
+    # decimated without any further copies
+    x_axis = np.asarray(x_axis)
+    y_axis = [np.asarray(y) for y in y_axis]
+    x_is_sorted = x_axis.size < 2 or bool(np.all(x_axis[1:] >= x_axis[:-1]))
+
+    # Parse options
+    if legend_entries is None:
+        legend_entries = ["curve {}".format(i) for i in range(n_curves)]
+
+    def get_curves(axes_x_limits, figure_width):
+        if not decimate:
+            return x_axis, y_axis
+        n_bins = figure_width * plt.rcParams["figure.dpi"]
+        return decimate_curves(
+            x_axis, y_axis, n_bins, axes_x_limits=axes_x_limits, x_is_sorted=x_is_sorted
+        )
+
+    render_function, _ = _create_plot_graph_widget(
+        get_curves, legend_entries, figure_size
+    )
+
     # Trigger initial visualization
     render_function({})
 
 
+def plot_graph_stream(
+    n_curves=1,
+    legend_entries=None,
+    figure_size=(9, 5),
+    max_length=None,
+    min_redraw_interval=0.5,
+    decimate=True,
+):
+    r"""
+    Widget that allows plotting various curves in a graph, while their values
+    are still being produced, e.g. in order to monitor a running training or
+    evaluation job.
+
+    The widget is the same as the one of :func:`plot_graph`. It returns a
+    `menpowidgets.streams.CurveStream` object, whose ``append(x, y_per_curve)``
+    method adds a sample to all the curves. The samples are stored in growable
+    ring buffers and the rendered curves are updated in place at most once
+    every `min_redraw_interval` seconds. The samples that are appended within
+    the interval get rendered once the kernel is idle, thus the last sample
+    always gets rendered. Outside of a kernel, call the ``redraw()`` method of
+    the returned object after the last sample has been appended.
+
+    Parameters
+    ----------
+    n_curves : `int`, optional
+        The number of curves. It is ignored if `legend_entries` is provided.
+    legend_entries : `list` or `str` or ``None``, optional
+        The `list` of names that will appear on the legend for each curve. If
+        ``None``, then the names format is ``curve {}.format(i)``.
+    figure_size : (`int`, `int`), optional
+        The initial size of the rendered figure.
+    max_length : `int` or ``None``, optional
+        The maximum number of samples that are kept per curve. If ``None``, then
+        all the samples are kept.
+    min_redraw_interval : `float`, optional
+        The minimum time (in seconds) between two redraws caused by appending
+        samples.
+    decimate : `bool`, optional
+        If ``True``, then curves with more samples than twice the figure's width
+        in pixels are reduced to the minimum and maximum value per pixel column
+        while they get appended, so that the cost of a redraw does not grow
+        with the number of samples. If the horizontal axis limits are set to a
+        range, then the visible samples are decimated on every redraw instead,
+        so zooming in reveals the full detail.
+
+    Returns
+    -------
+    stream : `menpowidgets.streams.CurveStream`
+        The object that receives the samples of the curves.
+    """
+    # Parse options
+    if legend_entries is None:
+        legend_entries = ["curve {}".format(i) for i in range(n_curves)]
+    elif isinstance(legend_entries, str):
+        legend_entries = [legend_entries]
+    n_curves = len(legend_entries)
+
+    stream = CurveStream(
+        n_curves, max_length=max_length, min_redraw_interval=min_redraw_interval
+    )
+
+    def get_curves(axes_x_limits, figure_width):
+        if not decimate:
+            values = stream.values()
+            return values[0], list(values[1:])
+        n_bins = figure_width * plt.rcParams["figure.dpi"]
+        if isinstance(axes_x_limits, (list, tuple)):
+            values = stream.values()
+            return decimate_curves(
+                values[0], list(values[1:]), n_bins, axes_x_limits=axes_x_limits
+            )
+        stream.set_decimation_bins(n_bins)
+        values = stream.decimated_values()
+        return values[0], list(values[1:])
+
+    _, stream.redraw_function = _create_plot_graph_widget(
+        get_curves, legend_entries, figure_size
+    )
+
+    return stream
+
+
 def save_matplotlib_figure(renderer):
     r"""
     Widget that allows to save a figure, which was generated with Matplotlib,
@@ -1686,6 +2344,7 @@ def visualize_shape_model_2d(
     mode="multiple",
     parameters_bounds=(-3.0, 3.0),
     figure_size=(7, 7),
+    settle_interval=None,
 ):
     r"""
     Widget that allows the dynamic visualization of a multi-scale linear
@@ -1710,6 +2369,11 @@ def visualize_shape_model_2d(
         The minimum and maximum bounds, in std units, for the sliders.
     figure_size : (`int`, `int`), optional
         The size of the plotted figures.
+    settle_interval : `float` or ``None``, optional
+        If not ``None``, then the parameters' sliders update the shape while
+        they are dragged, rendering fast drafts without numbering and legend.
+        The shape is rendered at full quality once the parameters have been
+        idle for `settle_interval` seconds.
     """
     from menpo.visualize.viewmatplotlib import _set_axes_options, _parse_axes_limits
 
@@ -1734,6 +2398,11 @@ def visualize_shape_model_2d(
 
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
+        # Render a draft while the parameters keep changing
+        draft = progressive.draft
+        if not draft:
+            progressive.cancel()
+
         # Get selected level
         level = 0
         if n_levels > 1:
@@ -1762,17 +2431,11 @@ def visualize_shape_model_2d(
             # ...use with_labels
             options["with_labels"] = shape_options_wid.selected_values["with_labels"]
             # ...correct colours
-            line_colour = []
-            marker_face_colour = []
-            marker_edge_colour = []
-            for lbl in options["with_labels"]:
-                idx = mean.labels.index(lbl)
-                line_colour.append(options["line_colour"][idx])
-                marker_face_colour.append(options["marker_face_colour"][idx])
-                marker_edge_colour.append(options["marker_edge_colour"][idx])
-            options["line_colour"] = line_colour
-            options["marker_face_colour"] = marker_face_colour
-            options["marker_edge_colour"] = marker_edge_colour
+            select_label_colours(
+                options,
+                mean.labels,
+                ["line_colour", "marker_face_colour", "marker_edge_colour"],
+            )
         else:
             # If shape is PointCloud, TriMesh or PointGraph
             # ...correct colours
@@ -1780,6 +2443,10 @@ def visualize_shape_model_2d(
             options["marker_face_colour"] = options["marker_face_colour"][0]
             options["marker_edge_colour"] = options["marker_edge_colour"][0]
 
+        # Skip the numbering, legend and interpolation in drafts
+        if draft:
+            options = draft_view_options(options)
+
         # Get figure size
         new_figure_size = (
             renderer_options_wid.selected_values["zoom_one"] * figure_size[0],
@@ -1893,7 +2560,10 @@ def visualize_shape_model_2d(
             instance_range = mean.range()
 
         # Force rendering
-        save_figure_wid.renderer.force_draw()
+        if draft:
+            _show_draft(save_figure_wid.renderer)
+        else:
+            save_figure_wid.renderer.force_draw()
 
         # Update info
         update_info(level, instance_range)
@@ -1961,9 +2631,12 @@ def visualize_shape_model_2d(
             mean_wid.set_widget_state(False, allow_callback=False)
 
     mode_wid.observe(mean_visible, names="value", type="change")
+
+    # Render drafts while the parameters keep changing
+    progressive = ProgressiveRender(render_function, settle_interval=settle_interval)
     model_parameters_wid = LinearModelParametersWidget(
         n_parameters[0],
-        render_function,
+        progressive,
         params_str="Parameter ",
         mode=mode,
         params_bounds=parameters_bounds,
@@ -1973,7 +2646,10 @@ def visualize_shape_model_2d(
         animation_step=0.5,
         interval=0.0,
         loop_enabled=True,
-        continuous_update=False,
+        continuous_update=settle_interval is not None,
+        record_frame_function=lambda: record_renderer_frame(
+            save_figure_wid, progressive
+        ),
     )
     labels = None
     if hasattr(shape_model[0].mean(), "labels"):
@@ -2055,7 +2731,11 @@ def visualize_shape_model_2d(
 
 
 def visualize_shape_model_3d(
-    shape_model, n_parameters=5, mode="multiple", parameters_bounds=(-15.0, 15.0)
+    shape_model,
+    n_parameters=5,
+    mode="multiple",
+    parameters_bounds=(-15.0, 15.0),
+    backend="mayavi",
 ):
     r"""
     Widget that allows the dynamic visualization of a multi-scale linear
@@ -2078,6 +2758,12 @@ def visualize_shape_model_3d(
         parameter.
     parameters_bounds : (`float`, `float`), optional
         The minimum and maximum bounds, in std units, for the sliders.
+    backend : ``{'mayavi', 'webgl'}``, optional
+        If ``'mayavi'``, the objects are rendered with Mayavi as a snapshot
+        image. If ``'webgl'``, they are rendered in the browser by a
+        `menpowidgets.tools.MeshViewWidget`, which only receives the vertex
+        buffers that changed and handles the camera client-side. Note that
+        the Export tab is only available with Mayavi.
     """
     # Make sure that shape_model is a list even with one member
     if not isinstance(shape_model, list):
@@ -2092,6 +2778,10 @@ def visualize_shape_model_3d(
     # Define the styling options
     main_style = "warning"
 
+    # Check the given backend
+    if backend not in ["mayavi", "webgl"]:
+        raise ValueError("backend should be either mayavi or webgl")
+
     # Get the maximum number of components per level
     max_n_params = [sp.n_active_components for sp in shape_model]
 
@@ -2100,11 +2790,15 @@ def visualize_shape_model_3d(
     n_parameters = check_n_parameters(n_parameters, n_levels, max_n_params)
 
     output = ipywidgets.Output()
+    mesh_view_wid = MeshViewWidget() if backend == "webgl" else None
+
+    # The triangulation of the instances of a level never changes, so when
+    # only the parameters change the mayavi source of the previously rendered
+    # mesh is kept and only its points are updated
+    pipeline_state = {"key": None, "source": None}
 
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
-        save_figure_wid.renderer.clear_figure()
-
         # Get selected level
         level = 0
         if n_levels > 1:
@@ -2117,6 +2811,25 @@ def visualize_shape_model_3d(
         # Compute instance
         instance = shape_model[level].instance(weights)
 
+        # Update the points of the rendered mesh in place, if possible
+        pipeline_key = None
+        if is_trimesh and backend == "mayavi":
+            pipeline_key = repr((level, shape_options_wid.selected_values))
+            if (
+                pipeline_key == pipeline_state["key"]
+                and pipeline_state["source"] is not None
+            ):
+                update_info(level, instance.range())
+                points = instance.points
+                pipeline_state["source"].set(
+                    x=points[:, 0], y=points[:, 1], z=points[:, 2]
+                )
+                save_figure_wid.renderer.force_draw()
+                return
+
+        if backend == "mayavi":
+            save_figure_wid.renderer.clear_figure()
+
         # Create options dictionary
         options = dict()
         if is_trimesh:
@@ -2133,14 +2846,9 @@ def visualize_shape_model_3d(
                     "with_labels"
                 ]
                 # ...correct colours
-                line_colour = []
-                marker_colour = []
-                for lbl in options["with_labels"]:
-                    idx = instance.labels.index(lbl)
-                    line_colour.append(options["line_colour"][idx])
-                    marker_colour.append(options["marker_colour"][idx])
-                options["line_colour"] = line_colour
-                options["marker_colour"] = marker_colour
+                select_label_colours(
+                    options, instance.labels, ["line_colour", "marker_colour"]
+                )
             else:
                 # If shape is PointCloud, TriMesh or PointGraph
                 # ...correct colours
@@ -2150,11 +2858,27 @@ def visualize_shape_model_3d(
         # Update info
         update_info(level, instance.range())
 
+        # The mesh view only sends the points if the triangulation is the same
+        if backend == "webgl":
+            render_mesh_view(mesh_view_wid, instance, options)
+            return
+
         # Render instance
         save_figure_wid.renderer = instance.view(
             figure_id=save_figure_wid.renderer.figure_id, new_figure=False, **options
         )
 
+        # Keep the source of the rendered mesh
+        pipeline_state["key"] = pipeline_key
+        pipeline_state["source"] = None
+        if (
+            pipeline_key is not None
+            and len(save_figure_wid.renderer.figure.children) > 0
+        ):
+            pipeline_state["source"] = getattr(
+                save_figure_wid.renderer.figure.children[-1], "mlab_source", None
+            )
+
         # Force rendering
         save_figure_wid.renderer.force_draw()
 
@@ -2216,7 +2940,7 @@ def visualize_shape_model_3d(
             render_function=render_function,
         )
     info_wid = TextPrintWidget(text_per_line=[""])
-    save_figure_wid = SaveMayaviFigureOptionsWidget()
+    save_figure_wid = SaveMayaviFigureOptionsWidget() if backend == "mayavi" else None
 
     # Group widgets
     if n_levels > 1:
@@ -2249,28 +2973,26 @@ def visualize_shape_model_3d(
     else:
         tmp_wid = ipywidgets.HBox(children=[model_parameters_wid])
     if is_trimesh:
-        options_box = ipywidgets.Tab(
-            children=[tmp_wid, shape_options_wid, info_wid, save_figure_wid]
-        )
-        tab_titles = ["Model", "Mesh", "Info", "Export"]
+        tab_children = [tmp_wid, shape_options_wid, info_wid]
+        tab_titles = ["Model", "Mesh", "Info"]
     else:
-        options_box = ipywidgets.Tab(
-            children=[
-                tmp_wid,
-                shape_options_wid,
-                renderer_options_wid,
-                info_wid,
-                save_figure_wid,
-            ]
-        )
-        tab_titles = ["Model", "Shape", "Renderer", "Info", "Export"]
+        tab_children = [tmp_wid, shape_options_wid, renderer_options_wid, info_wid]
+        tab_titles = ["Model", "Shape", "Renderer", "Info"]
+    if backend == "mayavi":
+        tab_children.append(save_figure_wid)
+        tab_titles.append("Export")
+    options_box = ipywidgets.Tab(children=tab_children)
     for k, tl in enumerate(tab_titles):
         options_box.set_title(k, tl)
     logo_wid = LogoWidget(style=main_style)
     logo_wid.layout.margin = "0px 10px 0px 0px"
 
     output.layout.align_self = "center"
-    wid = ipywidgets.VBox([logo_wid, options_box, output])
+    if backend == "webgl":
+        mesh_view_wid.layout.align_self = "center"
+        wid = ipywidgets.VBox([logo_wid, options_box, mesh_view_wid, output])
+    else:
+        wid = ipywidgets.VBox([logo_wid, options_box, output])
 
     # Set widget's style
     wid.box_style = main_style
@@ -2292,6 +3014,7 @@ def visualize_appearance_model(
     mode="multiple",
     parameters_bounds=(-3.0, 3.0),
     figure_size=(7, 7),
+    settle_interval=None,
 ):
     r"""
     Widget that allows the dynamic visualization of a multi-scale linear
@@ -2316,6 +3039,12 @@ def visualize_appearance_model(
         The minimum and maximum bounds, in std units, for the sliders.
     figure_size : (`int`, `int`), optional
         The size of the plotted figures.
+    settle_interval : `float` or ``None``, optional
+        If not ``None``, then the parameters' sliders update the instance
+        while they are dragged. The instance is shown as a reduced resolution
+        draft with nearest interpolation until the parameters have been idle
+        for `settle_interval` seconds, after which it is rendered at full
+        quality.
     """
     # Make sure that appearance_model is a list even with one member
     if not isinstance(appearance_model, Sized):
@@ -2338,6 +3067,11 @@ def visualize_appearance_model(
 
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
+        # Render a draft while the parameters keep changing
+        draft = progressive.draft
+        if not draft:
+            progressive.cancel()
+
         # Get selected level
         level = level_wid.value if n_levels > 1 else 0
 
@@ -2364,17 +3098,11 @@ def visualize_appearance_model(
         if instance.has_landmarks and hasattr(instance.landmarks[g], "labels"):
             # If the shape is a LabelledPointUndirectedGraph ...
             # ...correct colours
-            line_colour = []
-            marker_face_colour = []
-            marker_edge_colour = []
-            for lbl in options["with_labels"]:
-                id = instance.landmarks[g].labels.index(lbl)
-                line_colour.append(options["line_colour"][id])
-                marker_face_colour.append(options["marker_face_colour"][id])
-                marker_edge_colour.append(options["marker_edge_colour"][id])
-            options["line_colour"] = line_colour
-            options["marker_face_colour"] = marker_face_colour
-            options["marker_edge_colour"] = marker_edge_colour
+            select_label_colours(
+                options,
+                instance.landmarks[g].labels,
+                ["line_colour", "marker_face_colour", "marker_edge_colour"],
+            )
         else:
             # If shape is PointCloud, TriMesh or PointGraph
             # ...correct colours
@@ -2382,6 +3110,10 @@ def visualize_appearance_model(
             options["marker_face_colour"] = options["marker_face_colour"][0]
             options["marker_edge_colour"] = options["marker_edge_colour"][0]
 
+        # Skip the numbering, legend and interpolation in drafts
+        if draft:
+            options = draft_view_options(options)
+
         # Get figure size
         new_figure_size = (
             renderer_options_wid.selected_values["zoom_one"] * figure_size[0],
@@ -2394,8 +3126,11 @@ def visualize_appearance_model(
             renderer=save_figure_wid.renderer,
             image_is_masked=image_is_masked,
             figure_size=new_figure_size,
+            force_draw=not draft,
             **options
         )
+        if draft:
+            _show_draft(save_figure_wid.renderer)
 
         # Update info
         update_info(instance, level, g)
@@ -2444,10 +3179,13 @@ def visualize_appearance_model(
         )
         save_figure_wid.renderer.force_draw()
 
+    # Render drafts while the parameters keep changing
+    progressive = ProgressiveRender(render_function, settle_interval=settle_interval)
+
     # Create widgets
     model_parameters_wid = LinearModelParametersWidget(
         n_parameters[0],
-        render_function,
+        progressive,
         params_str="Parameter ",
         mode=mode,
         params_bounds=parameters_bounds,
@@ -2457,7 +3195,10 @@ def visualize_appearance_model(
         animation_step=0.5,
         interval=0.0,
         loop_enabled=True,
-        continuous_update=False,
+        continuous_update=settle_interval is not None,
+        record_frame_function=lambda: record_renderer_frame(
+            save_figure_wid, progressive
+        ),
     )
     groups_keys, labels_keys = extract_groups_labels_from_image(
         appearance_model[0].mean()
@@ -2728,6 +3469,7 @@ def visualize_patch_appearance_model(
         interval=0.0,
         loop_enabled=True,
         continuous_update=False,
+        record_frame_function=lambda: record_renderer_frame(save_figure_wid),
     )
     shape_options_wid = Shape2DOptionsWidget(labels=None, render_function=None)
     shape_options_wid.line_options_wid.render_lines_switch.button_wid.value = False
@@ -2837,6 +3579,7 @@ def visualize_morphable_model(
     n_texture_parameters=5,
     mode="multiple",
     parameters_bounds=(-15.0, 15.0),
+    backend="mayavi",
 ):
     r"""
     Widget that allows the dynamic visualization of a 3D Morphable Model.
@@ -2864,6 +3607,12 @@ def visualize_morphable_model(
         parameter.
     parameters_bounds : (`float`, `float`), optional
         The minimum and maximum bounds, in std units, for the sliders.
+    backend : ``{'mayavi', 'webgl'}``, optional
+        If ``'mayavi'``, the objects are rendered with Mayavi as a snapshot
+        image. If ``'webgl'``, they are rendered in the browser by a
+        `menpowidgets.tools.MeshViewWidget`, which only receives the vertex
+        buffers that changed and handles the camera client-side. Note that
+        the Export tab is only available with Mayavi.
     """
     # Define the styling options
     main_style = "info"
@@ -2876,12 +3625,22 @@ def visualize_morphable_model(
         n_texture_parameters, 1, [mm.texture_model.n_active_components]
     )
 
+    # Check the given backend
+    if backend not in ["mayavi", "webgl"]:
+        raise ValueError("backend should be either mayavi or webgl")
+
     output = ipywidgets.Output()
+    mesh_view_wid = MeshViewWidget() if backend == "webgl" else None
+
+    # The triangulation of the instances never changes, so when only the
+    # parameters change the VTK pipeline of the previously rendered mesh is
+    # kept and only its points and per-vertex colours are updated. The colours
+    # are converted into a preallocated buffer.
+    pipeline_state = {"key": None, "poly_data": None}
+    colours_buffer = np.empty((mm.n_vertices, mm.n_channels), dtype=np.uint8)
 
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
-        save_figure_wid.renderer.clear_figure()
-
         # Compute weights
         shape_weights = shape_model_parameters_wid.selected_values
         shape_weights = (
@@ -2895,19 +3654,47 @@ def visualize_morphable_model(
         instance = mm.instance(
             shape_weights=shape_weights, texture_weights=texture_weights
         )
-        # TODO: Is this really needed?
-        instance = instance.clip_texture()
+        # Clip the colours of the new instance in place, which is equivalent
+        # to instance.clip_texture() without copying the instance
+        np.clip(instance.colours, 0.0, 1.0, out=instance.colours)
 
         # Update info
         update_info(mm, instance)
 
+        # The mesh view only sends the points and colours, since the
+        # triangulation is the same for all instances
+        if backend == "webgl":
+            render_mesh_view(mesh_view_wid, instance, mesh_options_wid.selected_values)
+            return
+
+        # Update the points and colours of the rendered mesh in place, if
+        # possible
+        pipeline_key = repr(mesh_options_wid.selected_values)
+        poly_data = pipeline_state["poly_data"]
+        if pipeline_key == pipeline_state["key"] and poly_data is not None:
+            np.multiply(instance.colours, 255.0, out=colours_buffer, casting="unsafe")
+            poly_data.points = instance.points
+            poly_data.point_data.scalars = colours_buffer
+            poly_data.modified()
+            save_figure_wid.renderer.figure.scene.render()
+            save_figure_wid.renderer.force_draw()
+            return
+
         # Render instance
+        save_figure_wid.renderer.clear_figure()
         save_figure_wid.renderer = instance.view(
             figure_id=save_figure_wid.renderer.figure_id,
             new_figure=False,
             **mesh_options_wid.selected_values
         )
 
+        # Keep the VTK data of the rendered mesh
+        pipeline_state["key"] = pipeline_key
+        actors = getattr(save_figure_wid.renderer, "_actors", [])
+        pipeline_state["poly_data"] = (
+            actors[-1].mapper.input if len(actors) > 0 else None
+        )
+
         # Force rendering
         save_figure_wid.renderer.force_draw()
 
@@ -2977,7 +3764,7 @@ def visualize_morphable_model(
         textured=True, render_function=render_function
     )
     info_wid = TextPrintWidget(text_per_line=[""])
-    save_figure_wid = SaveMayaviFigureOptionsWidget()
+    save_figure_wid = SaveMayaviFigureOptionsWidget() if backend == "mayavi" else None
 
     # Group widgets
     model_parameters_wid = ipywidgets.HBox(
@@ -2985,17 +3772,23 @@ def visualize_morphable_model(
     )
     model_parameters_wid.children[0].set_title(0, "Shape")
     model_parameters_wid.children[0].set_title(1, "Texture")
-    options_box = ipywidgets.Tab(
-        [model_parameters_wid, mesh_options_wid, info_wid, save_figure_wid]
-    )
-    tab_titles = ["Model", "Mesh", "Info", "Export"]
+    tab_children = [model_parameters_wid, mesh_options_wid, info_wid]
+    tab_titles = ["Model", "Mesh", "Info"]
+    if backend == "mayavi":
+        tab_children.append(save_figure_wid)
+        tab_titles.append("Export")
+    options_box = ipywidgets.Tab(tab_children)
     for k, tl in enumerate(tab_titles):
         options_box.set_title(k, tl)
     logo_wid = LogoWidget(style=main_style)
     logo_wid.layout.margin = "0px 10px 0px 0px"
 
     output.layout.align_self = "center"
-    wid = ipywidgets.VBox([logo_wid, options_box, output])
+    if backend == "webgl":
+        mesh_view_wid.layout.align_self = "center"
+        wid = ipywidgets.VBox([logo_wid, options_box, mesh_view_wid, output])
+    else:
+        wid = ipywidgets.VBox([logo_wid, options_box, output])
 
     # Set widget's style
     wid.box_style = main_style
@@ -0,0 +1,435 @@
+r"""
+Persistent cache of rendered figures and thumbnails.
+"""
+
+from collections.abc import Mapping
+import time
+
+import numpy as np
+
+from .montage import image_tile
+from .utils import is_masked_image
+
+# The default size of the persistent render cache in bytes
+RENDER_CACHE_MAX_SIZE = 512 * 2**20
+
+
+def write_cached_figure(data, filename, overwrite=False):
+    r"""
+    Function that writes the cached file of an exported figure, with the same
+    overwrite check as the ``save_figure()`` method of the renderers.
+
+    Parameters
+    ----------
+    data : `bytes`
+        The content of the file.
+    filename : `str` or `pathlib.Path`
+        The path of the saved file.
+    overwrite : `bool`, optional
+        If ``True``, then the file gets overwritten if it already exists.
+
+    Raises
+    ------
+    OverwriteError
+        If ``overwrite == False`` and the file already exists.
+    """
+    from menpo.io.output.base import _validate_filepath
+
+    _validate_filepath(filename, overwrite).write_bytes(data)
+
+
+def _update_digest(digest, value):
+    if isinstance(value, Mapping):
+        digest.update(b"{")
+        for key in sorted(value, key=repr):
+            _update_digest(digest, key)
+            _update_digest(digest, value[key])
+        digest.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"(")
+        for v in value:
+            _update_digest(digest, v)
+        digest.update(b")")
+    elif isinstance(value, np.ndarray):
+        digest.update("array{}{},".format(value.shape, value.dtype).encode())
+        # hash the buffer of the array without copying it to bytes
+        digest.update(np.ascontiguousarray(value).reshape(-1).view(np.uint8))
+    else:
+        digest.update(repr(value).encode() + b",")
+
+
+def options_digest(*values):
+    r"""
+    Function that returns a digest of options, e.g. the ``selected_values``
+    (or ``selected_record``) of options' widgets. Unlike `hash`, which is
+    salted per process for strings, the digest is the same across processes
+    and kernel sessions, thus it can key persistent caches.
+
+    Parameters
+    ----------
+    values : `dict`, `list`, `tuple`, `ndarray` or scalar
+        The options. The `dict` keys are sorted, so their order does not
+        matter.
+
+    Returns
+    -------
+    digest : `str`
+        The hexadecimal SHA-1 digest.
+    """
+    import hashlib
+
+    digest = hashlib.sha1()
+    _update_digest(digest, values)
+    return digest.hexdigest()
+
+
+def image_digest(image):
+    r"""
+    Function that returns a digest of the content of an image, i.e. of its
+    pixels, its mask and the points, edges and labels of all its landmark
+    groups. It keys the renders of the images that have no source file in the
+    render cache (see :func:`image_cache_source`).
+
+    Parameters
+    ----------
+    image : `menpo.image.Image` or subclass
+        The image.
+
+    Returns
+    -------
+    digest : `str`
+        The hexadecimal SHA-1 digest.
+    """
+    import hashlib
+
+    digest = hashlib.sha1()
+    _update_digest(digest, image.pixels)
+    if is_masked_image(image):
+        _update_digest(digest, image.mask.pixels)
+    for group in image.landmarks.group_labels:
+        landmarks = image.landmarks[group]
+        _update_digest(
+            digest,
+            (
+                group,
+                type(landmarks).__name__,
+                landmarks.points,
+                getattr(landmarks, "edges", None),
+                # the points of each label of a LabelledPointUndirectedGraph
+                getattr(landmarks, "_labels_to_masks", None),
+            ),
+        )
+    return digest.hexdigest()
+
+
+def image_cache_source(image):
+    r"""
+    Function that returns the source of an image in the render cache. An
+    image that has a source file is keyed by its ``path``, i.e. by the
+    modification time and size of the file, which is cheap. An image that
+    only lives in memory is keyed by a digest of its content instead (see
+    :func:`image_digest`).
+
+    Parameters
+    ----------
+    image : `menpo.image.Image` or subclass
+        The image.
+
+    Returns
+    -------
+    path : `str` or `pathlib.Path` or ``None``
+        The path of the source file or ``None`` if it does not exist.
+    content : `str` or ``None``
+        The digest of the content if the image has no source file, else
+        ``None``. It must be part of the rendering options.
+    """
+    path = getattr(image, "path", None)
+    if _source_stamp(path) is not None:
+        return path, None
+    return None, image_digest(image)
+
+
+def _source_stamp(path):
+    # The absolute path, modification time and size of a source file, or None
+    # if it does not exist
+    import os
+
+    try:
+        stat = os.stat(str(path))
+    except (OSError, TypeError, ValueError):
+        return None
+    return os.path.abspath(str(path)), stat.st_mtime_ns, stat.st_size
+
+
+class RenderCache(object):
+    r"""
+    Class that persists rendered thumbnails and frames in an SQLite database
+    under a directory, so that they survive kernel restarts. The entries are
+    keyed by the path of the source file of the rendered object, its
+    modification time and size, and a digest of the rendering options, thus
+    they are missed once the file changes. The least recently used entries
+    are evicted when the stored data exceed `max_size`. A cache directory can
+    be shared between kernels.
+
+    Note that the cache assumes that an object has the content of the file at
+    its ``path`` attribute. The objects without a source file are stored with
+    a path of ``None``, in which case the options must include a digest of
+    their content (see :func:`image_cache_source`).
+
+    Parameters
+    ----------
+    directory : `str` or `pathlib.Path`
+        The directory of the database. It gets created if it does not exist.
+    max_size : `int`, optional
+        The maximum size of the stored data in bytes.
+    """
+
+    # Bumped when the stored format changes, so that old entries are missed
+    version = 1
+
+    def __init__(self, directory, max_size=RENDER_CACHE_MAX_SIZE):
+        import sqlite3
+        import threading
+        from pathlib import Path
+
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        # The montage pages are composed in a background thread as well
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self.directory / "render_cache.sqlite"),
+            timeout=30,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, "
+                "data BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+            )
+
+    def key(self, path, options):
+        r"""
+        Method that returns the key of an entry.
+
+        Parameters
+        ----------
+        path : `str` or `pathlib.Path` or ``None``
+            The path of the source file. If ``None``, then the options must
+            identify the content of the object.
+        options : `dict`, `tuple` or scalar
+            The rendering options (see :func:`options_digest`).
+
+        Returns
+        -------
+        key : `str` or ``None``
+            The key or ``None`` if the source file does not exist.
+        """
+        stamp = None
+        if path is not None:
+            stamp = _source_stamp(path)
+            if stamp is None:
+                return None
+        return options_digest(self.version, stamp, options)
+
+    def get(self, path, options):
+        r"""
+        Method that returns the data of an entry.
+
+        Parameters
+        ----------
+        path : `str` or `pathlib.Path` or ``None``
+            The path of the source file.
+        options : `dict`, `tuple` or scalar
+            The rendering options.
+
+        Returns
+        -------
+        data : `bytes` or ``None``
+            The data or ``None`` if the entry is not cached.
+        """
+        key = self.key(path, options)
+        if key is None:
+            return None
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+        return bytes(row[0])
+
+    def put(self, path, options, data):
+        r"""
+        Method that stores the data of an entry and evicts the least recently
+        used entries if the cache is full.
+
+        Parameters
+        ----------
+        path : `str` or `pathlib.Path` or ``None``
+            The path of the source file.
+        options : `dict`, `tuple` or scalar
+            The rendering options.
+        data : `bytes`
+            The data.
+
+        Returns
+        -------
+        stored : `bool`
+            ``False`` if the source file does not exist.
+        """
+        key = self.key(path, options)
+        if key is None:
+            return False
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (key, data, len(data), time.time()),
+            )
+            self._evict()
+        return True
+
+    def get_arrays(self, path, options):
+        r"""
+        Method that returns the arrays of an entry stored with
+        :meth:`put_arrays`.
+
+        Parameters
+        ----------
+        path : `str` or `pathlib.Path` or ``None``
+            The path of the source file.
+        options : `dict`, `tuple` or scalar
+            The rendering options.
+
+        Returns
+        -------
+        arrays : `tuple` of `ndarray` or ``None``
+            The arrays or ``None`` if the entry is not cached.
+        """
+        import io
+
+        data = self.get(path, options)
+        if data is None:
+            return None
+        with np.load(io.BytesIO(data)) as arrays:
+            return tuple(arrays["arr_{}".format(k)] for k in range(len(arrays.files)))
+
+    def put_arrays(self, path, options, arrays):
+        r"""
+        Method that stores arrays as a compressed ``.npz`` entry.
+
+        Parameters
+        ----------
+        path : `str` or `pathlib.Path` or ``None``
+            The path of the source file.
+        options : `dict`, `tuple` or scalar
+            The rendering options.
+        arrays : `list` of `ndarray`
+            The arrays.
+
+        Returns
+        -------
+        stored : `bool`
+            ``False`` if the source file does not exist.
+        """
+        import io
+
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, *arrays)
+        return self.put(path, options, buffer.getvalue())
+
+    def _evict(self):
+        excess = self.size - self.max_size
+        if excess <= 0:
+            return
+        evicted = []
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM entries ORDER BY accessed"
+        ).fetchall():
+            if excess <= 0:
+                break
+            evicted.append((key,))
+            excess -= size
+        self._connection.executemany("DELETE FROM entries WHERE key = ?", evicted)
+
+    @property
+    def size(self):
+        r"""
+        The size of the stored data in bytes.
+
+        :type: `int`
+        """
+        return self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+
+    def clear(self):
+        r"""
+        Method that deletes all the entries.
+        """
+        with self._lock:
+            self._connection.execute("DELETE FROM entries")
+            self._connection.execute("VACUUM")
+
+
+def as_render_cache(cache_dir):
+    r"""
+    Function that opens the render cache of a directory.
+
+    Parameters
+    ----------
+    cache_dir : `str` or `pathlib.Path` or `RenderCache` or ``None``
+        The directory of the cache or a cache.
+
+    Returns
+    -------
+    cache : `RenderCache` or ``None``
+        The cache or ``None`` if `cache_dir` is ``None``.
+    """
+    if cache_dir is None or isinstance(cache_dir, RenderCache):
+        return cache_dir
+    return RenderCache(cache_dir)
+
+
+def cached_image_tile(cache, image, tile_shape, group=None):
+    r"""
+    Function that creates the montage tile of an image (see
+    :func:`menpowidgets.montage.image_tile`), reading it from and storing it
+    to a render cache.
+
+    Parameters
+    ----------
+    cache : `RenderCache` or ``None``
+        The cache. If ``None``, then the tile is always created.
+    image : `menpo.image.Image` or subclass
+        The image.
+    tile_shape : (`int`, `int`)
+        The height and width of the tile in pixels.
+    group : `str` or ``None``, optional
+        The landmark group that gets overlaid.
+
+    Returns
+    -------
+    tile : ``(height, width, 3)`` `ndarray`
+        The RGB pixels of the tile.
+    points : ``(n_points, 2)`` `ndarray`
+        The ``(x, y)`` coordinates of the overlaid points in the tile.
+    """
+    if cache is None:
+        return image_tile(image, tile_shape, group=group)
+    path, content = image_cache_source(image)
+    options = ("image_tile", tuple(tile_shape), group, content)
+    cached = cache.get_arrays(path, options)
+    if cached is not None:
+        return cached
+    tile, points = image_tile(image, tile_shape, group=group)
+    cache.put_arrays(path, options, [tile, points])
+    return tile, points
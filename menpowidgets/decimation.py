@@ -0,0 +1,665 @@
+r"""
+Decimation of the curves, meshes and glyphs that get rendered.
+"""
+
+import time
+
+import numpy as np
+
+
+def min_max_decimation_indices(y_axis, n_bins):
+    r"""
+    Function that returns the indices of the samples that need to be kept in
+    order to render a curve with `n_bins` horizontal pixels. The samples are
+    split in `n_bins` consecutive blocks and the minimum and maximum of each
+    block are kept, together with the first and last samples. Thus the
+    rendered envelope of the curve is identical to the one of the full curve,
+    given that the samples are (roughly) uniformly spaced on the horizontal
+    axis.
+
+    Parameters
+    ----------
+    y_axis : ``(n_samples,)`` `ndarray`
+        The values of the curve.
+    n_bins : `int`
+        The number of blocks, e.g. the width of the figure in pixels.
+
+    Returns
+    -------
+    indices : ``(n_kept,)`` `ndarray`
+        The sorted indices of the samples to keep. If the curve has less than
+        ``2 * n_bins`` samples, then all indices are returned.
+    """
+    n_samples = len(y_axis)
+    n_bins = max(int(n_bins), 1)
+    if n_samples <= 2 * n_bins:
+        return np.arange(n_samples)
+    block_size = int(np.ceil(n_samples / float(n_bins)))
+    n_blocks = n_samples // block_size
+    n_full = n_blocks * block_size
+    blocks = y_axis[:n_full].reshape(n_blocks, block_size)
+    offsets = np.arange(n_blocks) * block_size
+    indices = [
+        offsets + blocks.argmin(axis=1),
+        offsets + blocks.argmax(axis=1),
+        [0, n_samples - 1],
+    ]
+    if n_full < n_samples:
+        # the last, incomplete block
+        tail = y_axis[n_full:]
+        indices.append([n_full + tail.argmin(), n_full + tail.argmax()])
+    return np.unique(np.concatenate(indices))
+
+
+def decimate_curves(x_axis, y_axis, n_bins, axes_x_limits=None, x_is_sorted=None):
+    r"""
+    Function that reduces curves that share a horizontal axis to the samples
+    that are needed to render them with `n_bins` horizontal pixels, using
+    :func:`min_max_decimation_indices`. The kept indices are the union of the
+    ones of all curves, so that the curves still share a horizontal axis.
+
+    Parameters
+    ----------
+    x_axis : ``(n_samples,)`` `ndarray`
+        The values of the horizontal axis.
+    y_axis : `list` of ``(n_samples,)`` `ndarray`
+        The values of each curve.
+    n_bins : `int`
+        The width of the figure in pixels.
+    axes_x_limits : `float` or [`float`, `float`] or ``None``, optional
+        The limits of the horizontal axis. If [`float`, `float`] and the
+        horizontal values are sorted, then only the visible samples are
+        decimated, so narrowing the limits reveals more detail.
+    x_is_sorted : `bool` or ``None``, optional
+        Whether `x_axis` is sorted in ascending order. If ``None``, it gets
+        checked.
+
+    Returns
+    -------
+    x_axis : ``(n_kept,)`` `ndarray`
+        The kept values of the horizontal axis. It is empty if there are no
+        curves.
+    y_axis : `list` of ``(n_kept,)`` `ndarray`
+        The kept values of each curve.
+    """
+    if len(y_axis) == 0:
+        # there is nothing to render
+        return x_axis[:0], []
+    start = 0
+    end = len(x_axis)
+    if isinstance(axes_x_limits, (list, tuple)):
+        if x_is_sorted is None:
+            x_is_sorted = bool(np.all(x_axis[1:] >= x_axis[:-1]))
+        if x_is_sorted:
+            # keep one more sample on each side so that the lines reach the
+            # figure's borders
+            start = max(np.searchsorted(x_axis, axes_x_limits[0], side="left") - 1, 0)
+            end = np.searchsorted(x_axis, axes_x_limits[1], side="right") + 1
+    indices = np.unique(
+        np.concatenate(
+            [min_max_decimation_indices(y[start:end], n_bins) for y in y_axis]
+        )
+    )
+    indices += start
+    return x_axis[indices], [y[indices] for y in y_axis]
+
+
+def _min_max_columns(columns):
+    # The first, last, minimum and maximum sample of each curve, given that
+    # the curves are stored in the rows after the first two
+    y_axis = columns[2:]
+    keep = np.unique(
+        np.concatenate(
+            [y_axis.argmin(axis=1), y_axis.argmax(axis=1), [0, columns.shape[1] - 1]]
+        )
+    )
+    return columns[:, keep]
+
+
+class IncrementalDecimation(object):
+    r"""
+    Class that applies min-max decimation, as
+    :func:`min_max_decimation_indices`, to curves that share a horizontal axis
+    and whose samples get appended over time.
+
+    The samples are reduced in blocks of :attr:`block_size` consecutive
+    samples to the first, last, minimum and maximum sample of each curve.
+    Once there are ``2 * n_bins`` reduced blocks, consecutive pairs of them get
+    merged and the block size doubles. Thus :meth:`append` has an amortised
+    constant cost and :meth:`values` returns ``O(n_bins)`` samples regardless
+    of the number of appended samples.
+
+    Parameters
+    ----------
+    n_curves : `int`
+        The number of curves.
+    n_bins : `int`
+        The width of the figure in pixels.
+    """
+
+    def __init__(self, n_curves, n_bins):
+        self.n_curves = n_curves
+        self.n_bins = max(int(n_bins), 1)
+        self.block_size = 1
+        # the first row of the blocks stores the indices of the samples, the
+        # second the horizontal values and the rest the curves
+        self._blocks = []
+        self._pending = np.empty((n_curves + 2, 1))
+        self._n_pending = 0
+        self._first_index = 0
+
+    def append(self, index, x, y_per_curve):
+        r"""
+        Method that appends a sample to the curves.
+
+        Parameters
+        ----------
+        index : `int`
+            The index of the sample, which increases with every sample.
+        x : `float`
+            The horizontal value of the sample.
+        y_per_curve : ``(n_curves,)`` `ndarray`
+            The value of each curve.
+        """
+        column = self._pending[:, self._n_pending]
+        column[0] = index
+        column[1] = x
+        column[2:] = y_per_curve
+        self._n_pending += 1
+        if self._n_pending == self.block_size:
+            self._blocks.append(_min_max_columns(self._pending))
+            self._n_pending = 0
+            if len(self._blocks) == 2 * self.n_bins:
+                self._blocks = [
+                    _min_max_columns(np.concatenate(self._blocks[i : i + 2], axis=1))
+                    for i in range(0, len(self._blocks), 2)
+                ]
+                self.block_size *= 2
+                self._pending = np.empty((self.n_curves + 2, self.block_size))
+
+    def extend(self, first_index, values):
+        r"""
+        Method that replaces the curves with the given samples.
+
+        Parameters
+        ----------
+        first_index : `int`
+            The index of the first sample.
+        values : ``(n_curves + 1, n_samples)`` `ndarray`
+            The first row has the horizontal values and each of the rest the
+            values of a curve.
+        """
+        n_samples = values.shape[1]
+        block_size = 1
+        while n_samples // block_size >= 2 * self.n_bins:
+            block_size *= 2
+        n_blocks = n_samples // block_size
+        n_full = n_blocks * block_size
+        columns = np.vstack(
+            [np.arange(first_index, first_index + n_samples, dtype=float), values]
+        )
+        self._blocks = []
+        if n_blocks > 0:
+            blocks = columns[2:, :n_full].reshape(self.n_curves, n_blocks, block_size)
+            keep = np.concatenate(
+                [
+                    blocks.argmin(axis=2),
+                    blocks.argmax(axis=2),
+                    np.zeros((1, n_blocks), dtype=int),
+                    np.full((1, n_blocks), block_size - 1),
+                ]
+            ).T
+            keep.sort(axis=1)
+            is_unique = np.ones(keep.shape, dtype=bool)
+            is_unique[:, 1:] = keep[:, 1:] != keep[:, :-1]
+            keep += np.arange(n_blocks)[:, None] * block_size
+            counts = is_unique.sum(axis=1)
+            self._blocks = np.split(
+                columns[:, keep[is_unique]], np.cumsum(counts)[:-1], axis=1
+            )
+        self.block_size = block_size
+        self._pending = np.empty((self.n_curves + 2, block_size))
+        self._n_pending = n_samples - n_full
+        self._pending[:, : self._n_pending] = columns[:, n_full:]
+        self._first_index = first_index
+
+    def discard_before(self, index):
+        r"""
+        Method that discards the samples with an index lower than `index`,
+        e.g. the ones that were overwritten in the ring buffers of
+        `menpowidgets.streams.CurveStream`.
+
+        Parameters
+        ----------
+        index : `int`
+            The index of the first sample to keep.
+        """
+        self._first_index = index
+        n_discarded = 0
+        for block in self._blocks:
+            if block[0, -1] >= index:
+                break
+            n_discarded += 1
+        if n_discarded > 0:
+            del self._blocks[:n_discarded]
+
+    def values(self):
+        r"""
+        Method that returns the decimated curves.
+
+        Returns
+        -------
+        values : ``(n_curves + 1, n_kept)`` `ndarray`
+            The first row has the horizontal values and each of the rest the
+            values of a curve.
+        """
+        columns = list(self._blocks)
+        if self._n_pending > 0:
+            columns.append(_min_max_columns(self._pending[:, : self._n_pending]))
+        if len(columns) == 0:
+            return np.empty((self.n_curves + 1, 0))
+        columns = np.concatenate(columns, axis=1)
+        if columns[0, 0] < self._first_index:
+            # the oldest block is partially discarded
+            columns = columns[:, columns[0] >= self._first_index]
+        return columns[1:]
+
+
+def grid_clustering(points, n_clusters):
+    r"""
+    Function that clusters 3D points with a regular grid of cubic cells over
+    their bounding box, i.e. the points of each occupied cell form a cluster.
+    The cell size is chosen so that there are roughly `n_clusters` occupied
+    cells, given that the points lie on a surface.
+
+    Parameters
+    ----------
+    points : ``(n_points, 3)`` `ndarray`
+        The points.
+    n_clusters : `int`
+        The target number of clusters.
+
+    Returns
+    -------
+    clusters : ``(n_points,)`` `ndarray`
+        The index of the cluster of each point.
+    n_clusters : `int`
+        The number of clusters.
+    """
+    min_b = points.min(axis=0)
+    extent = max(float((points.max(axis=0) - min_b).max()), np.finfo(float).eps)
+
+    def cluster(resolution):
+        cell_size = extent / resolution
+        cells = np.floor((points - min_b) / cell_size).astype(np.int64)
+        cells = np.minimum(cells, int(resolution))
+        n_cells = int(resolution) + 1
+        keys = cells[:, 0] + n_cells * (cells[:, 1] + n_cells * cells[:, 2])
+        _, clusters = np.unique(keys, return_inverse=True)
+        return clusters.ravel()
+
+    # The number of occupied cells of a surface grows with the square of the
+    # grid resolution, so a second pass corrects the initial guess
+    resolution = max(np.sqrt(n_clusters), 1.0)
+    clusters = cluster(resolution)
+    resolution *= np.sqrt(n_clusters / float(clusters.max() + 1))
+    clusters = cluster(max(resolution, 1.0))
+    return clusters, int(clusters.max()) + 1
+
+
+def vertex_clustering_decimation(points, trilist, n_triangles):
+    r"""
+    Function that decimates a triangle mesh with vertex clustering. The
+    vertices are clustered with :func:`grid_clustering`, the vertices of each
+    cell are merged to their mean and the triangles that collapse are
+    removed. The cell size is chosen so that roughly `n_triangles` triangles
+    are kept, given that the mesh is a surface.
+
+    Parameters
+    ----------
+    points : ``(n_points, 3)`` `ndarray`
+        The vertices of the mesh.
+    trilist : ``(n_tris, 3)`` `ndarray`
+        The triangles of the mesh.
+    n_triangles : `int`
+        The target number of triangles.
+
+    Returns
+    -------
+    clusters : ``(n_points,)`` `ndarray`
+        The index of the cluster (i.e. decimated vertex) of each vertex.
+    n_clusters : `int`
+        The number of decimated vertices.
+    trilist : ``(n_kept_tris, 3)`` `ndarray`
+        The triangles of the decimated mesh.
+    """
+    # The number of occupied cells of a surface grows with the square of the
+    # grid resolution, so roughly half as many vertices as triangles are kept
+    clusters, n_clusters = grid_clustering(points, max(n_triangles // 2, 4))
+
+    # Remove collapsed and duplicate triangles
+    tris = clusters[trilist]
+    keep = (
+        (tris[:, 0] != tris[:, 1])
+        & (tris[:, 1] != tris[:, 2])
+        & (tris[:, 0] != tris[:, 2])
+    )
+    tris = tris[keep]
+    _, unique = np.unique(np.sort(tris, axis=1), axis=0, return_index=True)
+    return clusters, n_clusters, tris[np.sort(unique)]
+
+
+def decimate_trimesh(mesh, n_triangles):
+    r"""
+    Function that returns a decimated copy of a 3D mesh with roughly
+    `n_triangles` triangles, using :func:`vertex_clustering_decimation`. The
+    colours of a `menpo.shape.ColouredTriMesh` and the texture coordinates of
+    a `menpo.shape.TexturedTriMesh` are averaged per merged vertex. If the
+    mesh has at most `n_triangles` triangles, then it is returned as is.
+
+    Parameters
+    ----------
+    mesh : `menpo.shape.TriMesh` or subclass
+        The mesh to decimate.
+    n_triangles : `int`
+        The target number of triangles.
+
+    Returns
+    -------
+    mesh : `menpo.shape.TriMesh` or subclass
+        The decimated mesh, of the same type as the provided one.
+    """
+    from menpo.shape import TriMesh, ColouredTriMesh, TexturedTriMesh
+
+    if mesh.n_tris <= n_triangles:
+        return mesh
+    clusters, n_clusters, trilist = vertex_clustering_decimation(
+        mesh.points, mesh.trilist, n_triangles
+    )
+    counts = np.bincount(clusters, minlength=n_clusters).astype(float)
+
+    def cluster_mean(values):
+        return np.stack(
+            [
+                np.bincount(clusters, weights=v, minlength=n_clusters) / counts
+                for v in values.T
+            ],
+            axis=1,
+        )
+
+    points = cluster_mean(mesh.points)
+    if isinstance(mesh, TexturedTriMesh):
+        return TexturedTriMesh(
+            points,
+            cluster_mean(mesh.tcoords.points),
+            mesh.texture,
+            trilist=trilist,
+        )
+    elif isinstance(mesh, ColouredTriMesh):
+        return ColouredTriMesh(
+            points, trilist=trilist, colours=cluster_mean(mesh.colours)
+        )
+    return TriMesh(points, trilist=trilist)
+
+
+def voxel_grid_decimation(points, n_points):
+    r"""
+    Function that downsamples a 3D point cloud for display by merging the
+    points of each cell of :func:`grid_clustering` to their mean. If there
+    are at most `n_points` points, then they are returned as is.
+
+    Parameters
+    ----------
+    points : ``(n_points, 3)`` `ndarray`
+        The points.
+    n_points : `int`
+        The target number of points.
+
+    Returns
+    -------
+    points : ``(n_kept, 3)`` `ndarray`
+        The downsampled points.
+    """
+    if points.shape[0] <= n_points:
+        return points
+    clusters, n_clusters = grid_clustering(points, max(n_points, 1))
+    counts = np.bincount(clusters, minlength=n_clusters).astype(float)
+    return np.stack(
+        [
+            np.bincount(clusters, weights=p, minlength=n_clusters) / counts
+            for p in points.T
+        ],
+        axis=1,
+    )
+
+
+def glyph_n_triangles(marker_style, marker_resolution):
+    r"""
+    Function that estimates the number of triangles of a single Mayavi glyph.
+
+    Parameters
+    ----------
+    marker_style : `str`
+        The glyph style (e.g. ``'sphere'``).
+    marker_resolution : `int`
+        The resolution of the glyph.
+
+    Returns
+    -------
+    n_triangles : `int`
+        The number of triangles.
+    """
+    r = max(int(marker_resolution), 3)
+    if marker_style == "sphere":
+        return 2 * r * (r - 1)
+    elif marker_style == "cube":
+        return 12
+    elif marker_style == "cylinder":
+        return 4 * r
+    elif marker_style == "arrow":
+        return 6 * r
+    return 2 * r
+
+
+def glyph_decimation(
+    n_points,
+    marker_style,
+    marker_resolution,
+    step,
+    max_n_triangles,
+    min_marker_resolution=4,
+):
+    r"""
+    Function that picks the glyph resolution and the subsampling step with
+    which `n_points` Mayavi glyphs are rendered with at most roughly
+    `max_n_triangles` triangles. The resolution is lowered first, down to
+    `min_marker_resolution`, and then the step is increased. The returned
+    values are never finer than the provided ones.
+
+    Parameters
+    ----------
+    n_points : `int`
+        The number of points.
+    marker_style : `str`
+        The glyph style (e.g. ``'sphere'``).
+    marker_resolution : `int`
+        The selected resolution of the glyphs.
+    step : `int` or ``None``
+        The selected subsampling step, i.e. a glyph is rendered every `step`
+        points.
+    max_n_triangles : `int`
+        The budget of triangles.
+    min_marker_resolution : `int`, optional
+        The lowest resolution to use.
+
+    Returns
+    -------
+    marker_resolution : `int`
+        The resolution of the glyphs.
+    step : `int`
+        The subsampling step.
+    """
+    step = max(int(step or 1), 1)
+    n_glyphs = -(-n_points // step)
+    resolution = int(marker_resolution)
+    while (
+        resolution > min_marker_resolution
+        and n_glyphs * glyph_n_triangles(marker_style, resolution) > max_n_triangles
+    ):
+        resolution -= 1
+    per_glyph = glyph_n_triangles(marker_style, resolution)
+    if n_glyphs * per_glyph > max_n_triangles:
+        step = int(np.ceil(n_points * per_glyph / float(max(max_n_triangles, 1))))
+    return resolution, step
+
+
+class GlyphBudget(object):
+    r"""
+    Class that decimates the Mayavi glyphs of 3D point clouds and point graphs
+    so that they get rendered within a frame time budget.
+
+    The number of triangles that can be rendered within the budget is
+    estimated from the triangles per second measured on the previous renders.
+    :meth:`decimate` then lowers the glyph resolution and increases the
+    subsampling step with :func:`glyph_decimation`. Optionally, point clouds
+    without edges are instead downsampled with :func:`voxel_grid_decimation`,
+    in which case the downsampled points of the last decimated objects are
+    cached.
+
+    Parameters
+    ----------
+    frame_time_budget : `float`, optional
+        The time (in seconds) that rendering a frame should take.
+    voxel_downsampling : `bool`, optional
+        If ``True``, then point clouds without edges are downsampled with a
+        voxel grid instead of being subsampled.
+    triangles_per_second : `float`, optional
+        The initial estimate of the rendering throughput.
+
+    Raises
+    ------
+    ValueError
+        frame_time_budget must be positive
+    """
+
+    def __init__(
+        self, frame_time_budget=0.1, voxel_downsampling=False, triangles_per_second=1e7
+    ):
+        if frame_time_budget <= 0:
+            raise ValueError("frame_time_budget must be positive")
+        self.frame_time_budget = frame_time_budget
+        self.voxel_downsampling = voxel_downsampling
+        self.triangles_per_second = triangles_per_second
+        self._n_triangles = 0
+        self._start_time = None
+        self._voxel_cache = {}
+
+    @property
+    def max_n_triangles(self):
+        r"""
+        The number of triangles that can be rendered within the budget. It is
+        rounded down to a power of two, so that small fluctuations of the
+        measured throughput do not change the decimation between frames.
+
+        :type: `int`
+        """
+        n_triangles = max(self.triangles_per_second * self.frame_time_budget, 1.0)
+        return 2 ** int(np.log2(n_triangles))
+
+    def decimate(self, shape, options):
+        r"""
+        Method that returns the object and the rendering options with which
+        the glyphs of `shape` fit in the budget and starts timing the render.
+
+        Parameters
+        ----------
+        shape : `menpo.shape.PointCloud` or subclass
+            The 3D object to render.
+        options : `dict`
+            The rendering options that are passed to the ``view()`` method of
+            `shape`. For a `menpo.shape.TriMesh`, the glyphs are only rendered
+            if ``mesh_type`` is ``'fancymesh'``, otherwise they are rendered if
+            ``render_markers`` is ``True``.
+
+        Returns
+        -------
+        shape : `menpo.shape.PointCloud` or subclass
+            The object to render.
+        options : `dict`
+            A copy of the options with the effective ``marker_resolution`` and
+            ``step``.
+        message : `str` or ``None``
+            A description of the decimation, or ``None`` if there was none.
+        """
+        from menpo.shape import PointCloud, TriMesh
+
+        self._start_time = time.time()
+        self._n_triangles = 0
+        if isinstance(shape, TriMesh):
+            render_glyphs = options.get("mesh_type") == "fancymesh"
+        else:
+            render_glyphs = options.get("render_markers", False)
+        if not render_glyphs:
+            return shape, options, None
+
+        options = dict(options)
+        n_points = shape.n_points
+        resolution = options["marker_resolution"]
+        step = max(int(options.get("step") or 1), 1)
+        if (
+            self.voxel_downsampling
+            and type(shape) is PointCloud
+            and not options.get("render_numbering", False)
+        ):
+            per_glyph = glyph_n_triangles(options["marker_style"], resolution)
+            n_kept = max(self.max_n_triangles // per_glyph, 1)
+            if -(-n_points // step) > n_kept:
+                key = (id(shape), n_kept)
+                cached = self._voxel_cache.get(key)
+                if cached is None or cached[0] is not shape:
+                    cached = (
+                        shape,
+                        PointCloud(
+                            voxel_grid_decimation(shape.points, n_kept), copy=False
+                        ),
+                    )
+                    self._voxel_cache = {key: cached}
+                decimated = cached[1]
+                options["step"] = 1
+                self._n_triangles = decimated.n_points * per_glyph
+                return (
+                    decimated,
+                    options,
+                    "Rendered voxel-downsampled to {} of {} points".format(
+                        decimated.n_points, n_points
+                    ),
+                )
+
+        new_resolution, new_step = glyph_decimation(
+            n_points, options["marker_style"], resolution, step, self.max_n_triangles
+        )
+        options["marker_resolution"] = new_resolution
+        options["step"] = new_step
+        self._n_triangles = -(-n_points // new_step) * glyph_n_triangles(
+            options["marker_style"], new_resolution
+        )
+        message = None
+        if new_resolution != resolution or new_step != step:
+            message = "Rendered {} of {} markers with resolution {}".format(
+                -(-n_points // new_step), n_points, new_resolution
+            )
+        return shape, options, message
+
+    def update(self):
+        r"""
+        Method that stops timing the render that started with the last
+        :meth:`decimate` and updates the estimated rendering throughput. Only
+        renders with enough triangles are taken into account, since the time
+        of small ones is dominated by constant overheads.
+        """
+        if self._start_time is None:
+            return
+        elapsed = time.time() - self._start_time
+        self._start_time = None
+        if self._n_triangles >= 100000 and elapsed > 0:
+            self.triangles_per_second = self._n_triangles / elapsed
@@ -0,0 +1,381 @@
+r"""
+Default options of the options' widgets.
+
+The functions of this module return the initial ``selected_values`` of the
+widgets of :mod:`menpowidgets.options` as plain `dict` objects. The widgets
+get their defaults from them and :mod:`menpowidgets.render` uses them to
+render without creating any widget.
+"""
+
+from .utils import sample_colours_from_colourmap
+
+
+def shape_2d_default_options(labels):
+    r"""
+    Function that returns the default options of
+    `menpowidgets.options.Shape2DOptionsWidget`.
+
+    Parameters
+    ----------
+    labels : `list` or ``None``
+        The `list` of labels. ``None`` if there are no labels.
+
+    Returns
+    -------
+    default_options : `dict`
+        A `dict` with the default options.
+    """
+    # Set lines options
+    lc = ["red"]
+    if labels is not None:
+        lc = sample_colours_from_colourmap(len(labels), "jet")
+
+    # Set markers options
+    fc = ["red"]
+    ec = ["black"]
+    if labels is not None and len(labels) > 1:
+        fc = sample_colours_from_colourmap(len(labels), "jet")
+        ec = sample_colours_from_colourmap(len(labels), "jet")
+    return {
+        "image_view": True,
+        "lines": {
+            "line_colour": lc,
+            "render_lines": True,
+            "line_width": 1,
+            "line_style": "-",
+        },
+        "markers": {
+            "marker_face_colour": fc,
+            "marker_edge_colour": ec,
+            "render_markers": True,
+            "marker_size": 5,
+            "marker_style": "o",
+            "marker_edge_width": 1,
+        },
+        "with_labels": labels,
+    }
+
+
+def shape_3d_default_options(labels):
+    r"""
+    Function that returns the default options of
+    `menpowidgets.options.Shape3DOptionsWidget`.
+
+    Parameters
+    ----------
+    labels : `list` or ``None``
+        The `list` of labels. ``None`` if there are no labels.
+
+    Returns
+    -------
+    default_options : `dict`
+        A `dict` with the default options.
+    """
+    # Set lines options
+    lc = ["red"]
+    if labels is not None:
+        lc = sample_colours_from_colourmap(len(labels), "jet")
+
+    # Set markers options
+    mc = ["red"]
+    if labels is not None and len(labels) > 1:
+        mc = sample_colours_from_colourmap(len(labels), "jet")
+    return {
+        "lines": {"line_colour": lc, "render_lines": True, "line_width": 2.0},
+        "markers": {
+            "marker_colour": mc,
+            "render_markers": True,
+            "marker_size": None,
+            "marker_style": "sphere",
+            "marker_resolution": 8,
+            "step": 1,
+        },
+        "with_labels": labels,
+    }
+
+
+def renderer_global_options(options_tabs, axes_x_limits=None, axes_y_limits=None):
+    r"""
+    Function that returns the default options of
+    `menpowidgets.options.RendererOptionsWidget` that do not depend on the
+    labels.
+
+    Parameters
+    ----------
+    options_tabs : `list` of `str`
+        The options tabs of the widget.
+    axes_x_limits : `float` or (`float`, `float`) or ``None``, optional
+        The limits of the x axis. If `float`, then it sets padding on the
+        right and left as a percentage of the rendered object's width. If
+        `tuple` or `list`, then it defines the axis limits. If ``None``,
+        then the limits are set automatically.
+    axes_y_limits : (`float`, `float`) `tuple` or ``None``, optional
+        The limits of the y axis. If `float`, then it sets padding on the
+        top and bottom as a percentage of the rendered object's height. If
+        `tuple` or `list`, then it defines the axis limits. If ``None``, then
+        the limits are set automatically.
+
+    Returns
+    -------
+    global_options : `dict`
+        A `dict` with the default options per tab.
+    """
+    global_options = {}
+    for o in options_tabs:
+        if o == "image_matplotlib":
+            global_options[o] = {
+                "interpolation": "bilinear",
+                "cmap_name": None,
+                "alpha": 1.0,
+            }
+        elif o == "trimesh":
+            global_options[o] = {
+                "mesh_type": "wireframe",
+                "line_width": 2.0,
+                "colour": "red",
+                "marker_style": "sphere",
+                "marker_size": None,
+                "marker_resolution": 8,
+                "step": 1,
+                "alpha": 1.0,
+            }
+        elif o == "textured_trimesh":
+            global_options[o] = {
+                "render_texture": True,
+                "mesh_type": "surface",
+                "ambient_light": 0.0,
+                "specular_light": 0.0,
+                "alpha": 1.0,
+                "line_width": 2.0,
+                "colour": "red",
+            }
+        elif o == "numbering_matplotlib":
+            global_options[o] = {
+                "render_numbering": False,
+                "numbers_font_name": "sans-serif",
+                "numbers_font_size": 10,
+                "numbers_font_style": "normal",
+                "numbers_font_weight": "normal",
+                "numbers_font_colour": "black",
+                "numbers_horizontal_align": "center",
+                "numbers_vertical_align": "bottom",
+            }
+        elif o == "numbering_mayavi":
+            global_options[o] = {
+                "render_numbering": False,
+                "numbers_size": None,
+                "numbers_colour": "black",
+            }
+        elif o == "zoom_one":
+            global_options[o] = 1.0
+        elif o == "zoom_two":
+            global_options[o] = [1.0, 1.0]
+        elif o == "axes":
+            global_options[o] = {
+                "render_axes": False,
+                "axes_font_name": "sans-serif",
+                "axes_font_size": 10,
+                "axes_font_style": "normal",
+                "axes_font_weight": "normal",
+                "axes_x_limits": axes_x_limits,
+                "axes_y_limits": axes_y_limits,
+                "axes_x_ticks": None,
+                "axes_y_ticks": None,
+            }
+        elif o == "legend":
+            global_options[o] = {
+                "render_legend": False,
+                "legend_title": "",
+                "legend_font_name": "sans-serif",
+                "legend_font_style": "normal",
+                "legend_font_size": 10,
+                "legend_font_weight": "normal",
+                "legend_marker_scale": 1.0,
+                "legend_location": 2,
+                "legend_bbox_to_anchor": (1.05, 1.0),
+                "legend_border_axes_pad": 1.0,
+                "legend_n_columns": 1,
+                "legend_horizontal_spacing": 1.0,
+                "legend_vertical_spacing": 1.0,
+                "legend_border": True,
+                "legend_border_padding": 0.5,
+                "legend_shadow": False,
+                "legend_rounded_corners": False,
+            }
+        elif o == "grid":
+            global_options[o] = {
+                "render_grid": False,
+                "grid_line_style": "--",
+                "grid_line_width": 0.5,
+            }
+    return global_options
+
+
+def renderer_labels_options(options_tabs, labels):
+    r"""
+    Function that returns the default options of
+    `menpowidgets.options.RendererOptionsWidget` that depend on the labels,
+    i.e. the lines and markers options.
+
+    Parameters
+    ----------
+    options_tabs : `list` of `str`
+        The options tabs of the widget.
+    labels : `list` or ``None``
+        The `list` of labels used in all the colour selection widgets.
+
+    Returns
+    -------
+    default_options : `dict`
+        A `dict` with the default options per tab.
+    """
+    default_options = {}
+    if "lines_matplotlib" in options_tabs:
+        lc = ["red"]
+        if labels is not None:
+            lc = sample_colours_from_colourmap(len(labels), "jet")
+        default_options["lines_matplotlib"] = {
+            "render_lines": True,
+            "line_width": 1,
+            "line_colour": lc,
+            "line_style": "-",
+        }
+    if "lines_mayavi" in options_tabs:
+        lc = ["red"]
+        if labels is not None:
+            lc = sample_colours_from_colourmap(len(labels), "jet")
+        default_options["lines_mayavi"] = {
+            "render_lines": True,
+            "line_width": 4.0,
+            "line_colour": lc,
+        }
+    if "markers_matplotlib" in options_tabs:
+        fc = ["red"]
+        ec = ["black"]
+        if labels is not None and len(labels) > 1:
+            fc = sample_colours_from_colourmap(len(labels), "jet")
+            ec = sample_colours_from_colourmap(len(labels), "jet")
+        default_options["markers_matplotlib"] = {
+            "render_markers": True,
+            "marker_size": 5,
+            "marker_face_colour": fc,
+            "marker_edge_colour": ec,
+            "marker_style": "o",
+            "marker_edge_width": 1,
+        }
+    if "markers_mayavi" in options_tabs:
+        mc = ["red"]
+        if labels is not None and len(labels) > 1:
+            mc = sample_colours_from_colourmap(len(labels), "jet")
+        default_options["markers_mayavi"] = {
+            "marker_colour": mc,
+            "render_markers": True,
+            "marker_size": 0.1,
+            "marker_style": "sphere",
+            "marker_resolution": 8,
+        }
+    return default_options
+
+
+def renderer_default_options(
+    options_tabs, labels=None, axes_x_limits=None, axes_y_limits=None
+):
+    r"""
+    Function that returns the default options of
+    `menpowidgets.options.RendererOptionsWidget`, i.e. the ones of
+    :func:`renderer_labels_options` and :func:`renderer_global_options`.
+
+    Parameters
+    ----------
+    options_tabs : `list` of `str`
+        The options tabs of the widget.
+    labels : `list` or ``None``, optional
+        The `list` of labels used in all the colour selection widgets.
+    axes_x_limits : `float` or (`float`, `float`) or ``None``, optional
+        The limits of the x axis.
+    axes_y_limits : `float` or (`float`, `float`) or ``None``, optional
+        The limits of the y axis.
+
+    Returns
+    -------
+    default_options : `dict`
+        A `dict` with the default options per tab.
+    """
+    default_options = renderer_labels_options(options_tabs, labels)
+    default_options.update(
+        renderer_global_options(options_tabs, axes_x_limits, axes_y_limits)
+    )
+    return default_options
+
+
+def image_default_options(n_channels, image_is_masked):
+    r"""
+    Function that returns the default options of
+    `menpowidgets.options.ImageOptionsWidget`.
+
+    Parameters
+    ----------
+    n_channels : `int`
+        The number of channels.
+    image_is_masked : `bool`
+        Whether the image object is masked or not.
+
+    Returns
+    -------
+    default_options : `dict`
+        A `dict` with the default options.
+    """
+    # if image has 3 channels, visualise it as RGB, else render only the
+    # first channel
+    return {
+        "channels": None if n_channels == 3 else [0],
+        "channels_view": "channels",
+        "masked_enabled": image_is_masked,
+        "alpha": 1.0,
+        "interpolation": "bilinear",
+        "cmap_name": None,
+    }
+
+
+def landmark_default_options(group_keys, labels_keys, type="2D"):
+    r"""
+    Function that returns the default options of
+    `menpowidgets.options.LandmarkOptionsWidget`.
+
+    Parameters
+    ----------
+    group_keys : `list` of `str` or ``None``
+        The `list` of landmark groups. If ``None``, then no landmark groups
+        are available.
+    labels_keys : `list` of `list` of `str` or ``None``
+        The `list` of labels per landmark group. If ``None``, then no labels
+        are available.
+    type : ``{'2D', '3D'}``, optional
+        The type of the rendered landmarks.
+
+    Returns
+    -------
+    default_options : `dict`
+        A `dict` with the default options.
+    """
+    # The lines and markers options are the ones of the first group, whose
+    # labels are all selected
+    labels = None if group_keys is None else labels_keys[0]
+    if type == "2D":
+        default_options = shape_2d_default_options(labels)
+    else:
+        default_options = shape_3d_default_options(labels)
+    del default_options["with_labels"]
+    if group_keys is None:
+        default_options["landmarks"] = {
+            "group": None,
+            "with_labels": None,
+            "render_landmarks": False,
+        }
+    else:
+        default_options["landmarks"] = {
+            "group": group_keys[0],
+            "with_labels": labels,
+            "render_landmarks": True,
+        }
+    return default_options
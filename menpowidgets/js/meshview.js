@@ -0,0 +1,319 @@
+requirejs.undef('meshview');
+
+define('meshview', ["jupyter-js-widgets"], function(widgets) {
+    var VERTEX_SHADER = [
+        'attribute vec3 a_position;',
+        'attribute vec3 a_normal;',
+        'attribute vec3 a_colour;',
+        'uniform mat4 u_modelview;',
+        'uniform mat4 u_projection;',
+        'uniform float u_point_size;',
+        'uniform float u_lighting;',
+        'varying vec3 v_colour;',
+        'void main() {',
+        '    vec4 position = u_modelview * vec4(a_position, 1.0);',
+        '    vec3 normal = normalize(mat3(u_modelview) * a_normal);',
+        '    float light = mix(1.0, 0.3 + 0.7 * abs(normal.z), u_lighting);',
+        '    v_colour = a_colour * light;',
+        '    gl_Position = u_projection * position;',
+        '    gl_PointSize = u_point_size;',
+        '}'
+    ].join('\n');
+
+    var FRAGMENT_SHADER = [
+        'precision mediump float;',
+        'uniform float u_alpha;',
+        'varying vec3 v_colour;',
+        'void main() {',
+        '    gl_FragColor = vec4(v_colour, u_alpha);',
+        '}'
+    ].join('\n');
+
+    // Column-major 4x4 matrices, as expected by WebGL
+    function multiply(a, b) {
+        var out = new Float32Array(16);
+        for (var i = 0; i < 4; i++) {
+            for (var j = 0; j < 4; j++) {
+                var s = 0;
+                for (var k = 0; k < 4; k++) {
+                    s += a[k * 4 + j] * b[i * 4 + k];
+                }
+                out[i * 4 + j] = s;
+            }
+        }
+        return out;
+    }
+
+    function rotation(axis, angle) {
+        var c = Math.cos(angle), s = Math.sin(angle), t = 1 - c;
+        var x = axis[0], y = axis[1], z = axis[2];
+        return new Float32Array([
+            t * x * x + c,     t * x * y + s * z, t * x * z - s * y, 0,
+            t * x * y - s * z, t * y * y + c,     t * y * z + s * x, 0,
+            t * x * z + s * y, t * y * z - s * x, t * z * z + c,     0,
+            0,                 0,                 0,                 1
+        ]);
+    }
+
+    function parse_colour(colour) {
+        var ctx = document.createElement('canvas').getContext('2d');
+        ctx.fillStyle = colour;
+        var hex = ctx.fillStyle;
+        return [parseInt(hex.substr(1, 2), 16) / 255,
+                parseInt(hex.substr(3, 2), 16) / 255,
+                parseInt(hex.substr(5, 2), 16) / 255];
+    }
+
+    var MeshView = widgets.DOMWidgetView.extend({
+        render: function() {
+            this.canvas = document.createElement('canvas');
+            this.el.appendChild(this.canvas);
+            this.gl = this.canvas.getContext('webgl', {antialias: true});
+            if (!this.gl) {
+                this.el.innerHTML = 'MeshView ERROR: WebGL is not supported.';
+                return;
+            }
+            this.gl.getExtension('OES_element_index_uint');
+            this._build_program();
+            this.arrays = {};
+            this.gl_buffers = {};
+            this.rotation = new Float32Array([1, 0, 0, 0, 0, 1, 0, 0,
+                                              0, 0, 1, 0, 0, 0, 0, 1]);
+            this.zoom = 1.0;
+            this._wire_handlers();
+            this._resize();
+            // Ask the kernel for all the buffers, since the view might have
+            // been created after they were sent
+            this.send({method: 'request_state'});
+        },
+        _build_program: function() {
+            var gl = this.gl;
+            function compile(type, source) {
+                var shader = gl.createShader(type);
+                gl.shaderSource(shader, source);
+                gl.compileShader(shader);
+                return shader;
+            }
+            var program = gl.createProgram();
+            gl.attachShader(program, compile(gl.VERTEX_SHADER, VERTEX_SHADER));
+            gl.attachShader(program, compile(gl.FRAGMENT_SHADER, FRAGMENT_SHADER));
+            gl.linkProgram(program);
+            gl.useProgram(program);
+            this.program = program;
+            this.locations = {
+                a_position: gl.getAttribLocation(program, 'a_position'),
+                a_normal: gl.getAttribLocation(program, 'a_normal'),
+                a_colour: gl.getAttribLocation(program, 'a_colour'),
+                u_modelview: gl.getUniformLocation(program, 'u_modelview'),
+                u_projection: gl.getUniformLocation(program, 'u_projection'),
+                u_point_size: gl.getUniformLocation(program, 'u_point_size'),
+                u_lighting: gl.getUniformLocation(program, 'u_lighting'),
+                u_alpha: gl.getUniformLocation(program, 'u_alpha')
+            };
+        },
+        _wire_handlers: function() {
+            var that = this;
+            that.model.on('msg:custom', that._on_message, that);
+            that.model.on('change:width change:height', that._resize, that);
+            that.model.on('change:mesh_type change:colour change:alpha ' +
+                          'change:point_size change:render_colours',
+                          that._draw, that);
+            var last = null;
+            that.canvas.addEventListener('mousedown', function(e) {
+                last = [e.clientX, e.clientY];
+            });
+            window.addEventListener('mouseup', function(_) {
+                last = null;
+            });
+            that.canvas.addEventListener('mousemove', function(e) {
+                if (last === null) {
+                    return;
+                }
+                var dx = e.clientX - last[0], dy = e.clientY - last[1];
+                last = [e.clientX, e.clientY];
+                var norm = Math.sqrt(dx * dx + dy * dy);
+                if (norm > 0) {
+                    var r = rotation([dy / norm, dx / norm, 0], norm * 0.01);
+                    that.rotation = multiply(r, that.rotation);
+                    that._draw();
+                }
+            });
+            that.canvas.addEventListener('wheel', function(e) {
+                e.preventDefault();
+                that.zoom *= Math.exp(-e.deltaY * 0.001);
+                that._draw();
+            });
+        },
+        _resize: function() {
+            this.canvas.width = this.model.get('width');
+            this.canvas.height = this.model.get('height');
+            this._draw();
+        },
+        _on_message: function(content, buffers) {
+            if (content.method !== 'update') {
+                return;
+            }
+            var types = {float32: Float32Array, uint32: Uint32Array};
+            for (var i = 0; i < content.names.length; i++) {
+                var name = content.names[i];
+                var b = buffers[i];
+                var type = types[content.dtypes[name]];
+                this.arrays[name] = new type(
+                    b.buffer.slice(b.byteOffset, b.byteOffset + b.byteLength));
+            }
+            if (content.names.indexOf('points') >= 0 ||
+                    content.names.indexOf('trilist') >= 0) {
+                this._compute_normals();
+                this._compute_bounds();
+            }
+            this._upload(content.names);
+            this._draw();
+        },
+        _compute_bounds: function() {
+            var p = this.arrays.points, n = p.length / 3;
+            var min = [Infinity, Infinity, Infinity];
+            var max = [-Infinity, -Infinity, -Infinity];
+            for (var i = 0; i < n; i++) {
+                for (var d = 0; d < 3; d++) {
+                    min[d] = Math.min(min[d], p[3 * i + d]);
+                    max[d] = Math.max(max[d], p[3 * i + d]);
+                }
+            }
+            this.centre = [(min[0] + max[0]) / 2, (min[1] + max[1]) / 2,
+                           (min[2] + max[2]) / 2];
+            this.radius = Math.max(
+                Math.sqrt(Math.pow(max[0] - min[0], 2) +
+                          Math.pow(max[1] - min[1], 2) +
+                          Math.pow(max[2] - min[2], 2)) / 2, 1e-6);
+        },
+        _compute_normals: function() {
+            var p = this.arrays.points, t = this.arrays.trilist || [];
+            var normals = new Float32Array(p.length);
+            for (var i = 0; i < t.length; i += 3) {
+                var a = 3 * t[i], b = 3 * t[i + 1], c = 3 * t[i + 2];
+                var u = [p[b] - p[a], p[b + 1] - p[a + 1], p[b + 2] - p[a + 2]];
+                var v = [p[c] - p[a], p[c + 1] - p[a + 1], p[c + 2] - p[a + 2]];
+                var n = [u[1] * v[2] - u[2] * v[1], u[2] * v[0] - u[0] * v[2],
+                         u[0] * v[1] - u[1] * v[0]];
+                for (var d = 0; d < 3; d++) {
+                    normals[a + d] += n[d];
+                    normals[b + d] += n[d];
+                    normals[c + d] += n[d];
+                }
+            }
+            this.arrays.normals = normals;
+        },
+        _wireframe_indices: function() {
+            var t = this.arrays.trilist, lines = new Uint32Array(2 * t.length);
+            for (var i = 0; i < t.length; i += 3) {
+                lines.set([t[i], t[i + 1], t[i + 1], t[i + 2], t[i + 2], t[i]], 2 * i);
+            }
+            return lines;
+        },
+        _upload: function(names) {
+            var gl = this.gl, that = this;
+            function upload(name, target, data) {
+                if (!that.gl_buffers[name]) {
+                    that.gl_buffers[name] = gl.createBuffer();
+                }
+                gl.bindBuffer(target, that.gl_buffers[name]);
+                gl.bufferData(target, data, gl.DYNAMIC_DRAW);
+            }
+            if (names.indexOf('points') >= 0) {
+                upload('points', gl.ARRAY_BUFFER, this.arrays.points);
+            }
+            if (names.indexOf('points') >= 0 || names.indexOf('trilist') >= 0) {
+                upload('normals', gl.ARRAY_BUFFER, this.arrays.normals);
+            }
+            if (names.indexOf('colours') >= 0) {
+                upload('colours', gl.ARRAY_BUFFER, this.arrays.colours);
+            }
+            if (names.indexOf('trilist') >= 0) {
+                upload('trilist', gl.ELEMENT_ARRAY_BUFFER, this.arrays.trilist);
+                upload('wireframe', gl.ELEMENT_ARRAY_BUFFER, this._wireframe_indices());
+            }
+            if (names.indexOf('edges') >= 0) {
+                upload('edges', gl.ELEMENT_ARRAY_BUFFER, this.arrays.edges);
+            }
+        },
+        _draw: function() {
+            var gl = this.gl, loc = this.locations;
+            if (!gl) {
+                return;
+            }
+            gl.viewport(0, 0, this.canvas.width, this.canvas.height);
+            gl.clearColor(1, 1, 1, 1);
+            gl.clear(gl.COLOR_BUFFER_BIT | gl.DEPTH_BUFFER_BIT);
+            if (!this.arrays.points || this.arrays.points.length === 0) {
+                return;
+            }
+            var alpha = this.model.get('alpha');
+            gl.enable(gl.DEPTH_TEST);
+            if (alpha < 1) {
+                gl.enable(gl.BLEND);
+                gl.blendFunc(gl.SRC_ALPHA, gl.ONE_MINUS_SRC_ALPHA);
+            } else {
+                gl.disable(gl.BLEND);
+            }
+
+            // Camera: centre the object, rotate, and look at it from +Z
+            var s = this.zoom / this.radius, c = this.centre;
+            var centre = new Float32Array([1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0,
+                                           -c[0], -c[1], -c[2], 1]);
+            var scale = new Float32Array([s, 0, 0, 0, 0, s, 0, 0, 0, 0, s, 0,
+                                          0, 0, 0, 1]);
+            var modelview = multiply(scale, multiply(this.rotation, centre));
+            var aspect = this.canvas.width / this.canvas.height;
+            var projection = new Float32Array([1 / aspect, 0, 0, 0, 0, 1, 0, 0,
+                                               0, 0, -0.1, 0, 0, 0, 0, 1]);
+            gl.uniformMatrix4fv(loc.u_modelview, false, modelview);
+            gl.uniformMatrix4fv(loc.u_projection, false, projection);
+            gl.uniform1f(loc.u_point_size, this.model.get('point_size'));
+            gl.uniform1f(loc.u_alpha, alpha);
+
+            // Attributes
+            gl.bindBuffer(gl.ARRAY_BUFFER, this.gl_buffers.points);
+            gl.enableVertexAttribArray(loc.a_position);
+            gl.vertexAttribPointer(loc.a_position, 3, gl.FLOAT, false, 0, 0);
+            gl.bindBuffer(gl.ARRAY_BUFFER, this.gl_buffers.normals);
+            gl.enableVertexAttribArray(loc.a_normal);
+            gl.vertexAttribPointer(loc.a_normal, 3, gl.FLOAT, false, 0, 0);
+            var n_points = this.arrays.points.length / 3;
+            var colours = this.arrays.colours;
+            if (this.model.get('render_colours') && colours &&
+                    colours.length === 3 * n_points) {
+                gl.bindBuffer(gl.ARRAY_BUFFER, this.gl_buffers.colours);
+                gl.enableVertexAttribArray(loc.a_colour);
+                gl.vertexAttribPointer(loc.a_colour, 3, gl.FLOAT, false, 0, 0);
+            } else {
+                gl.disableVertexAttribArray(loc.a_colour);
+                var rgb = parse_colour(this.model.get('colour'));
+                gl.vertexAttrib3f(loc.a_colour, rgb[0], rgb[1], rgb[2]);
+            }
+
+            // Primitives
+            var mesh_type = this.model.get('mesh_type');
+            var trilist = this.arrays.trilist, edges = this.arrays.edges;
+            var has_tris = trilist && trilist.length > 0;
+            gl.uniform1f(loc.u_lighting, has_tris && mesh_type === 'surface' ? 1 : 0);
+            if (has_tris && mesh_type === 'surface') {
+                gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, this.gl_buffers.trilist);
+                gl.drawElements(gl.TRIANGLES, trilist.length, gl.UNSIGNED_INT, 0);
+            } else if (has_tris && mesh_type === 'wireframe') {
+                gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, this.gl_buffers.wireframe);
+                gl.drawElements(gl.LINES, 2 * trilist.length, gl.UNSIGNED_INT, 0);
+            }
+            if (!has_tris && edges && edges.length > 0) {
+                gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, this.gl_buffers.edges);
+                gl.drawElements(gl.LINES, edges.length, gl.UNSIGNED_INT, 0);
+            }
+            if (mesh_type === 'points') {
+                gl.drawArrays(gl.POINTS, 0, n_points);
+            }
+        }
+    });
+
+    return {
+        MeshView : MeshView
+    };
+});
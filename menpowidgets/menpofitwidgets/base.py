@@ -14,11 +14,15 @@ import ipywidgets
 import IPython.display as ipydisplay
 
 import matplotlib.pyplot as plt
+from matplotlib import collections as mc
 
 from menpo.base import name_of_callable
 from menpo.image import MaskedImage
 from menpo.image.base import _convert_patches_list_to_single_array
 
+from menpofit.aam import HolisticAAM
+from menpofit.atm import HolisticATM
+from menpofit.builder import build_reference_frame
 from menpofit.error import (
     euclidean_bb_normalised_error,
     root_mean_square_bb_normalised_error,
@@ -37,11 +41,82 @@ from ..options import (
     TextPrintWidget,
     Shape2DOptionsWidget,
 )
-from ..tools import LogoWidget
+from ..tools import LogoWidget, MontageWidget
 from ..style import map_styles_to_hex_colours
-from ..utils import render_patches, render_image, extract_groups_labels_from_image
+from ..utils import (
+    render_patches,
+    render_image,
+    extract_groups_labels_from_image,
+    select_label_colours,
+)
+from ..montage import MontagePages, image_tile, shape_tile
+from ..recording import record_renderer_frame
+from ..sketches import (
+    compute_cumulative_error,
+    area_under_curve_and_failure_rate,
+    ErrorHistogramSketch,
+)
 
 from ..options import IterativeResultOptionsWidget
+from ..render import render_fitting_result_view
+
+
+def _build_holistic_warp(model, level, shape_weights, template):
+    r"""
+    Function that precomputes the warp of a holistic AAM or ATM instance, i.e.
+    the mask of the reference frame of the shape instance, the points of the
+    template to be sampled for each of its true pixels and the warped
+    landmarks of the template.
+    """
+    shape_instance = model.shape_models[level].model.instance(
+        shape_weights, normalized_weights=True
+    )
+    reference_frame = build_reference_frame(shape_instance)
+    transform = model.transform(
+        reference_frame.landmarks["source"], template.landmarks["source"]
+    )
+    points = transform.apply(reference_frame.mask.true_indices())
+    landmarks = template.landmarks.copy()
+    transform.pseudoinverse()._apply_inplace(landmarks)
+    return reference_frame.mask, points, landmarks
+
+
+def _warp_holistic_instance(appearance, warp):
+    r"""
+    Function that warps an appearance instance to the reference frame of a
+    warp returned by `_build_holistic_warp`. It returns the same image as the
+    `instance()` method of holistic AAMs and ATMs.
+    """
+    mask, points, landmarks = warp
+    appearance = appearance.as_unmasked(copy=False)
+    sampled = appearance.sample(points)
+    sampled[np.isnan(sampled)] = 0
+    instance = appearance._build_warp_to_mask(mask, sampled)
+    instance.mask = mask
+    instance.landmarks = landmarks
+    return instance
+
+
+def _expert_ensemble_patches(expert_ensemble, domain, image=None, shape=None):
+    r"""
+    Function that returns the spatial or frequency filter images of an
+    ensemble of experts as a single patches array. If `domain` is
+    ``'response'``, then it returns the response maps of the experts on the
+    provided `image` around the provided `shape` instead.
+    """
+    if domain == "response":
+        # predict_response() extracts the patches around all the points at
+        # once and correlates them with all the experts and channels in a
+        # single batched FFT pass
+        responses = expert_ensemble.predict_response(image, shape)
+        return responses[:, None]
+    elif domain == "spatial":
+        filter_images = expert_ensemble.spatial_filter_images
+    else:
+        filter_images = expert_ensemble.frequency_filter_images
+    return _convert_patches_list_to_single_array(
+        filter_images, expert_ensemble.n_experts
+    )
 
 
 def visualize_aam(
@@ -102,6 +177,36 @@ def visualize_aam(
 
     output = ipywidgets.Output()
 
+    # The appearance reconstruction and the warp precomputations of the last
+    # instance are cached separately per level, so that changing the shape
+    # weights does not reconstruct the appearance and changing the appearance
+    # weights does not recompute the warp. This only applies to holistic AAMs,
+    # since the rest of the AAMs build their instances differently.
+    use_instance_cache = type(aam)._instance is HolisticAAM._instance
+    appearance_cache = {}
+    warp_cache = {}
+
+    def get_instance(level, shape_weights, appearance_weights):
+        if not use_instance_cache:
+            return aam.instance(
+                scale_index=level,
+                shape_weights=shape_weights,
+                appearance_weights=appearance_weights,
+            )
+        appearance_key = tuple(appearance_weights)
+        if appearance_cache.get(level, (None,))[0] != appearance_key:
+            appearance = aam.appearance_models[level].instance(
+                appearance_weights, normalized_weights=True
+            )
+            appearance_cache[level] = (appearance_key, appearance)
+        shape_key = tuple(shape_weights)
+        if warp_cache.get(level, (None,))[0] != shape_key:
+            warp = _build_holistic_warp(
+                aam, level, shape_weights, aam.appearance_models[level].mean()
+            )
+            warp_cache[level] = (shape_key, warp)
+        return _warp_holistic_instance(appearance_cache[level][1], warp_cache[level][1])
+
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
         # Get selected level
@@ -110,11 +215,7 @@ def visualize_aam(
         # Compute weights and instance
         shape_weights = shape_model_parameters_wid.selected_values
         appearance_weights = appearance_model_parameters_wid.selected_values
-        instance = aam.instance(
-            scale_index=level,
-            shape_weights=shape_weights,
-            appearance_weights=appearance_weights,
-        )
+        instance = get_instance(level, shape_weights, appearance_weights)
         image_is_masked = isinstance(instance, MaskedImage)
         g = landmark_options_wid.selected_values["landmarks"]["group"]
 
@@ -132,17 +233,11 @@ def visualize_aam(
         if instance.has_landmarks and hasattr(instance.landmarks[g], "labels"):
             # If the shape is a LabelledPointUndirectedGraph ...
             # ...correct colours
-            line_colour = []
-            marker_face_colour = []
-            marker_edge_colour = []
-            for lbl in options["with_labels"]:
-                id = instance.landmarks[g].labels.index(lbl)
-                line_colour.append(options["line_colour"][id])
-                marker_face_colour.append(options["marker_face_colour"][id])
-                marker_edge_colour.append(options["marker_edge_colour"][id])
-            options["line_colour"] = line_colour
-            options["marker_face_colour"] = marker_face_colour
-            options["marker_edge_colour"] = marker_edge_colour
+            select_label_colours(
+                options,
+                instance.landmarks[g].labels,
+                ["line_colour", "marker_face_colour", "marker_edge_colour"],
+            )
         else:
             # If shape is PointCloud, TriMesh or PointGraph
             # ...correct colours
@@ -269,6 +364,7 @@ def visualize_aam(
         animation_step=0.5,
         interval=0.0,
         loop_enabled=True,
+        record_frame_function=lambda: record_renderer_frame(save_figure_wid),
     )
     appearance_model_parameters_wid = LinearModelParametersWidget(
         n_appearance_parameters[0],
@@ -282,6 +378,7 @@ def visualize_aam(
         animation_step=0.5,
         interval=0.0,
         loop_enabled=True,
+        record_frame_function=lambda: record_renderer_frame(save_figure_wid),
     )
     groups_keys, labels_keys = extract_groups_labels_from_image(
         aam.appearance_models[0].mean()
@@ -606,6 +703,7 @@ def visualize_patch_aam(
         animation_step=0.5,
         interval=0.0,
         loop_enabled=True,
+        record_frame_function=lambda: record_renderer_frame(save_figure_wid),
     )
     appearance_model_parameters_wid = LinearModelParametersWidget(
         n_appearance_parameters[0],
@@ -619,6 +717,7 @@ def visualize_patch_aam(
         animation_step=0.5,
         interval=0.0,
         loop_enabled=True,
+        record_frame_function=lambda: record_renderer_frame(save_figure_wid),
     )
     shape_options_wid = Shape2DOptionsWidget(labels=None, render_function=None)
     shape_options_wid.line_options_wid.render_lines_switch.button_wid.value = False
@@ -779,6 +878,26 @@ def visualize_atm(
 
     output = ipywidgets.Output()
 
+    # The warp precomputations of the last instance are cached per level, so
+    # that changing any option other than the shape weights does not recompute
+    # the warp. This only applies to holistic ATMs, since the rest of the ATMs
+    # build their instances differently.
+    use_instance_cache = type(atm)._instance is HolisticATM._instance
+    warp_cache = {}
+
+    def get_instance(level, shape_weights):
+        if not use_instance_cache:
+            return atm.instance(scale_index=level, shape_weights=shape_weights)
+        shape_key = tuple(shape_weights)
+        if warp_cache.get(level, (None,))[0] != shape_key:
+            warp = _build_holistic_warp(
+                atm, level, shape_weights, atm.warped_templates[level]
+            )
+            warp_cache[level] = (shape_key, warp)
+        return _warp_holistic_instance(
+            atm.warped_templates[level], warp_cache[level][1]
+        )
+
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
         # Get selected level
@@ -786,7 +905,7 @@ def visualize_atm(
 
         # Compute weights and instance
         shape_weights = shape_model_parameters_wid.selected_values
-        instance = atm.instance(scale_index=level, shape_weights=shape_weights)
+        instance = get_instance(level, shape_weights)
         image_is_masked = isinstance(instance, MaskedImage)
         g = landmark_options_wid.selected_values["landmarks"]["group"]
 
@@ -804,17 +923,11 @@ def visualize_atm(
         if instance.has_landmarks and hasattr(instance.landmarks[g], "labels"):
             # If the shape is a LabelledPointUndirectedGraph ...
             # ...correct colours
-            line_colour = []
-            marker_face_colour = []
-            marker_edge_colour = []
-            for lbl in options["with_labels"]:
-                id = instance.landmarks[g].labels.index(lbl)
-                line_colour.append(options["line_colour"][id])
-                marker_face_colour.append(options["marker_face_colour"][id])
-                marker_edge_colour.append(options["marker_edge_colour"][id])
-            options["line_colour"] = line_colour
-            options["marker_face_colour"] = marker_face_colour
-            options["marker_edge_colour"] = marker_edge_colour
+            select_label_colours(
+                options,
+                instance.landmarks[g].labels,
+                ["line_colour", "marker_face_colour", "marker_edge_colour"],
+            )
         else:
             # If shape is PointCloud, TriMesh or PointGraph
             # ...correct colours
@@ -911,6 +1024,7 @@ def visualize_atm(
         animation_step=0.5,
         interval=0.0,
         loop_enabled=True,
+        record_frame_function=lambda: record_renderer_frame(save_figure_wid),
     )
     groups_keys, labels_keys = extract_groups_labels_from_image(atm.warped_templates[0])
     image_options_wid = ImageOptionsWidget(
@@ -1177,6 +1291,7 @@ def visualize_patch_atm(
         animation_step=0.5,
         interval=0.0,
         loop_enabled=True,
+        record_frame_function=lambda: record_renderer_frame(save_figure_wid),
     )
     shape_options_wid = Shape2DOptionsWidget(labels=None, render_function=None)
     shape_options_wid.line_options_wid.render_lines_switch.button_wid.value = False
@@ -1325,6 +1440,17 @@ def visualize_clm(
 
     output = ipywidgets.Output()
 
+    # The patches arrays of the filter images are built lazily per (level,
+    # domain) and reused by all subsequent renders
+    patches_cache = {}
+
+    def get_patches(level, domain):
+        if (level, domain) not in patches_cache:
+            patches_cache[(level, domain)] = _expert_ensemble_patches(
+                clm.expert_ensembles[level], domain
+            )
+        return patches_cache[(level, domain)]
+
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
         # Get selected level
@@ -1335,16 +1461,7 @@ def visualize_clm(
         shape_instance = clm.shape_instance(
             scale_index=level, shape_weights=shape_weights
         )
-        if domain_toggles.value == "spatial":
-            patches = _convert_patches_list_to_single_array(
-                clm.expert_ensembles[level].spatial_filter_images,
-                clm.expert_ensembles[level].n_experts,
-            )
-        else:
-            patches = _convert_patches_list_to_single_array(
-                clm.expert_ensembles[level].frequency_filter_images,
-                clm.expert_ensembles[level].n_experts,
-            )
+        patches = get_patches(level, domain_toggles.value)
 
         # Create options dictionary
         options = dict()
@@ -1447,6 +1564,7 @@ def visualize_clm(
         animation_step=0.5,
         interval=0.0,
         loop_enabled=True,
+        record_frame_function=lambda: record_renderer_frame(save_figure_wid),
     )
     shape_options_wid = Shape2DOptionsWidget(labels=None, render_function=None)
     shape_options_wid.line_options_wid.render_lines_switch.button_wid.value = False
@@ -1560,10 +1678,11 @@ def visualize_clm(
     render_function({})
 
 
-def visualize_expert_ensemble(expert_ensemble, centers, figure_size=(7, 7)):
+def visualize_expert_ensemble(expert_ensemble, centers, figure_size=(7, 7), image=None):
     r"""
     Widget that allows the dynamic visualization of a multi-scale Ensemble of
-    Experts.
+    Experts. If an `image` is provided, then the response maps of all the
+    experts on it can also be visualized.
 
     Parameters
     ----------
@@ -1576,6 +1695,11 @@ def visualize_expert_ensemble(expert_ensemble, centers, figure_size=(7, 7)):
         `expert_ensemble`.
     figure_size : (`int`, `int`), optional
         The size of the plotted figures.
+    image : `menpo.image.Image` or subclass or ``None``, optional
+        If not ``None``, then a ``response`` domain is added, which shows the
+        response maps of the experts of each level on this image, computed
+        around the `centers` of the level. Thus, in this case the `centers`
+        must be expressed in the coordinates of `image`.
     """
     # Make sure that expert_ensemble is a list even with one member
     if not isinstance(expert_ensemble, Sized):
@@ -1595,21 +1719,29 @@ def visualize_expert_ensemble(expert_ensemble, centers, figure_size=(7, 7)):
 
     output = ipywidgets.Output()
 
+    # The patches arrays of the filter images, as well as the response maps on
+    # the image around the centers of each level, are built lazily per (level,
+    # domain) and reused by all subsequent renders
+    patches_cache = {}
+
+    def get_patches(level, domain):
+        if (level, domain) not in patches_cache:
+            patches_cache[(level, domain)] = _expert_ensemble_patches(
+                expert_ensemble[level], domain, image=image, shape=centers[level]
+            )
+        return patches_cache[(level, domain)]
+
+    def get_n_channels(level, domain):
+        if domain == "response":
+            return 1
+        return expert_ensemble[level].spatial_filter_images[0].n_channels
+
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
         # Get selected level
         level = level_wid.value if n_levels > 1 else 0
 
-        if domain_toggles.value == "spatial":
-            patches = _convert_patches_list_to_single_array(
-                expert_ensemble[level].spatial_filter_images,
-                expert_ensemble[level].n_experts,
-            )
-        else:
-            patches = _convert_patches_list_to_single_array(
-                expert_ensemble[level].frequency_filter_images,
-                expert_ensemble[level].n_experts,
-            )
+        patches = get_patches(level, domain_toggles.value)
 
         # Create options dictionary
         options = dict()
@@ -1657,6 +1789,10 @@ def visualize_expert_ensemble(expert_ensemble, centers, figure_size=(7, 7)):
             ),
             "> Instance: min={:.3f} , max={:.3f}".format(patches.min(), patches.max()),
         ]
+        if domain_toggles.value == "response":
+            text_per_line.append(
+                "> Responses on {} x {} image".format(image.height, image.width)
+            )
         info_wid.set_widget_state(text_per_line=text_per_line)
 
     # Create widgets
@@ -1671,18 +1807,32 @@ def visualize_expert_ensemble(expert_ensemble, centers, figure_size=(7, 7)):
     )
     patch_options_wid.add_render_function(render_function)
     patch_options_wid.layout.margin = "10px 0px 0px 0px"
+    domain_options = ["spatial", "frequency"]
+    if image is not None:
+        domain_options.append("response")
     domain_toggles = ipywidgets.ToggleButtons(
-        description="Domain", options=["spatial", "frequency"], value="spatial"
+        description="Domain", options=domain_options, value="spatial"
     )
-    domain_toggles.observe(render_function, names="value", type="change")
     image_options_wid = ImageOptionsWidget(
-        n_channels=expert_ensemble[0].spatial_filter_images[0].n_channels,
+        n_channels=get_n_channels(0, "spatial"),
         image_is_masked=False,
         render_function=None,
     )
     image_options_wid.interpolation_checkbox.button_wid.value = False
     image_options_wid.cmap_select.value = "afmhot"
     image_options_wid.add_render_function(render_function)
+
+    # The response maps have a single channel, so the channels options need
+    # to be updated when the domain changes
+    def update_domain(change):
+        level = level_wid.value if n_levels > 1 else 0
+        image_options_wid.set_widget_state(
+            n_channels=get_n_channels(level, change["new"]),
+            image_is_masked=False,
+            allow_callback=True,
+        )
+
+    domain_toggles.observe(update_domain, names="value", type="change")
     renderer_options_wid = RendererOptionsWidget(
         options_tabs=["zoom_one", "axes", "numbering_matplotlib"],
         labels=None,
@@ -1708,7 +1858,7 @@ def visualize_expert_ensemble(expert_ensemble, centers, figure_size=(7, 7)):
 
             # Update channels options
             image_options_wid.set_widget_state(
-                n_channels=expert_ensemble[value].spatial_filter_images[0].n_channels,
+                n_channels=get_n_channels(value, domain_toggles.value),
                 image_is_masked=False,
                 allow_callback=True,
             )
@@ -1778,8 +1928,13 @@ def plot_ced(
 
     Parameters
     ----------
-    errors : `list` of `lists` of `float`
-        A `list` that stores a `list` of errors to be plotted.
+    errors : `list` of `lists` of `float` or `list` of `ErrorHistogramSketch`
+        A `list` that stores a `list` of errors to be plotted. Instead of a
+        `list` of errors, a curve can be given as a
+        `menpowidgets.sketches.ErrorHistogramSketch`, which is useful for
+        millions of errors or for errors that are still being produced. The
+        sketch is read on every render, so pressing the ``Refresh`` button of
+        the ``Info`` tab shows the errors that were fed to it in the meantime.
     legend_entries : `list` or `str` or ``None``, optional
         The `list` of names that will appear on the legend for each curve. If
         ``None``, then the names format is ``Curve {}.format(i)``.
@@ -1805,14 +1960,17 @@ def plot_ced(
         as part of a parent widget. If ``False``, the widget object is not
         returned, it is just visualized.
     """
-    from menpofit.visualize import plot_cumulative_error_distribution
+    from menpo.visualize import plot_curve
 
     # Make sure that errors is a list even with one list member
-    if not isinstance(errors[0], Sized):
+    if isinstance(errors, ErrorHistogramSketch) or not isinstance(
+        errors[0], (Sized, ErrorHistogramSketch)
+    ):
         errors = [errors]
 
     # Get number of curves to be plotted
     n_curves = len(errors)
+    has_sketches = any(isinstance(e, ErrorHistogramSketch) for e in errors)
 
     # Define the styling options
     main_style = "danger"
@@ -1840,6 +1998,54 @@ def plot_ced(
         x_axis_step = error_range[2]
         x_label = "Error"
 
+    # Sort the errors of each curve once. The CED of a curve can then be
+    # evaluated at any error values with a single binary search, so changing a
+    # rendering option does not need to re-bin the errors. Sketches are kept
+    # as they are, since they may still be fed with errors.
+    sorted_errors = []
+    for e in errors:
+        if not isinstance(e, ErrorHistogramSketch):
+            e = np.sort(np.asarray(e, dtype=float).ravel())
+        sorted_errors.append(e)
+    ced_cache = {}
+
+    def get_n_errors(e):
+        if isinstance(e, ErrorHistogramSketch):
+            return e.n_errors
+        return e.size
+
+    def get_max_error():
+        max_errors = []
+        for e in sorted_errors:
+            if isinstance(e, ErrorHistogramSketch):
+                if e.max_observed is not None:
+                    max_errors.append(e.max_observed)
+            elif e.size > 0:
+                max_errors.append(e[-1])
+        return max(max_errors, default=0.0)
+
+    def get_cumulative_errors(tmp_error_range):
+        # Returns the x axis, the CED of each curve and their (AUC, FR)
+        # statistics for the given error range. Only the last error range is
+        # cached, since it changes only when the horizontal limits change. The
+        # number of errors is part of the key, so that the curves of the
+        # sketches get updated when they are fed with new errors.
+        key = tuple(tmp_error_range) + tuple(get_n_errors(e) for e in sorted_errors)
+        if key not in ced_cache:
+            x_axis = np.arange(
+                tmp_error_range[0], tmp_error_range[1], tmp_error_range[2]
+            )
+            ceds = []
+            for e in sorted_errors:
+                if isinstance(e, ErrorHistogramSketch):
+                    ceds.append(e.cumulative_error(x_axis))
+                else:
+                    ceds.append(compute_cumulative_error(e, x_axis))
+            stats = [area_under_curve_and_failure_rate(x_axis, c) for c in ceds]
+            ced_cache.clear()
+            ced_cache[key] = (x_axis, ceds, stats)
+        return ced_cache[key]
+
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
         # plot with selected options
@@ -1850,18 +2056,23 @@ def plot_ced(
         )
         del opts["zoom"]
         if opts["axes_x_limits"] is None:
-            tmp_error_range = None
+            tmp_error_range = [0.0, 0.101, 0.005]
         elif isinstance(opts["axes_x_limits"], float):
-            tmp_error_range = [0.0, np.max(errors), x_axis_step]
+            tmp_error_range = [0.0, get_max_error(), x_axis_step]
         else:
             tmp_error_range = [
                 opts["axes_x_limits"][0],
                 1.0001 * opts["axes_x_limits"][1],
                 x_axis_step,
             ]
-        save_figure_wid.renderer = plot_cumulative_error_distribution(
-            errors,
-            error_range=tmp_error_range,
+        x_axis, ceds, stats = get_cumulative_errors(tmp_error_range)
+        if opts["axes_x_limits"] is None:
+            opts["axes_x_limits"] = (0.0, x_axis[-1])
+        if opts["axes_y_limits"] is None:
+            opts["axes_y_limits"] = (0.0, 1.0)
+        save_figure_wid.renderer = plot_curve(
+            x_axis=x_axis,
+            y_axis=ceds,
             figure_id=save_figure_wid.renderer.figure_id,
             new_figure=False,
             figure_size=new_figure_size,
@@ -1871,11 +2082,40 @@ def plot_ced(
         # show plot
         save_figure_wid.renderer.force_draw()
 
+        # update info text widget
+        update_info(x_axis, stats)
+
+    # Define function that updates info text
+    def update_info(x_axis, stats):
+        text_per_line = [
+            " > Error range: [{:.4f}, {:.4f}]".format(x_axis[0], x_axis[-1])
+        ]
+        for name, e, (auc, fr) in zip(
+            plot_wid.selected_values["legend_entries"], sorted_errors, stats
+        ):
+            text_per_line.append(
+                " > {}: {} errors, AUC: {:.4f}, Failure rate: {:.4f}".format(
+                    name, get_n_errors(e), auc, fr
+                )
+            )
+        info_wid.set_widget_state(text_per_line=text_per_line)
+
     # Create widgets
     plot_wid = PlotMatplotlibOptionsWidget(
         legend_entries=legend_entries, render_function=render_function
     )
     save_figure_wid = SaveMatplotlibFigureOptionsWidget()
+    info_wid = TextPrintWidget(text_per_line=[""])
+    if has_sketches:
+        refresh_button = ipywidgets.Button(
+            description="  Refresh",
+            icon="refresh",
+            layout=ipywidgets.Layout(width="2.5cm"),
+        )
+        refresh_button.on_click(lambda _: render_function({}))
+        info_box = ipywidgets.VBox([info_wid, refresh_button])
+    else:
+        info_box = info_wid
 
     # Set values in plot widget
     plot_wid.remove_render_function()
@@ -1902,6 +2142,7 @@ def plot_ced(
     logo = LogoWidget(style=main_style)
     logo.layout.margin = "0px 10px 0px 0px"
     tmp_children = list(plot_wid.tab_box.children)
+    tmp_children.append(info_box)
     tmp_children.append(save_figure_wid)
     plot_wid.tab_box.children = tmp_children
     plot_wid.tab_box.set_title(0, "Labels")
@@ -1910,7 +2151,8 @@ def plot_ced(
     plot_wid.tab_box.set_title(3, "Axes")
     plot_wid.tab_box.set_title(4, "Zoom")
     plot_wid.tab_box.set_title(5, "Grid")
-    plot_wid.tab_box.set_title(6, "Export")
+    plot_wid.tab_box.set_title(6, "Info")
+    plot_wid.tab_box.set_title(7, "Export")
 
     # Display final widget
     output.layout.align_self = "center"
@@ -1935,6 +2177,7 @@ def visualize_fitting_results(
     figure_size=(7, 7),
     browser_style="buttons",
     custom_info_callback=None,
+    grid_shape=(4, 4),
 ):
     r"""
     Widget that allows browsing through a `list` of fitting results.
@@ -1954,6 +2197,10 @@ def visualize_fitting_results(
         If not None, it should be a function that accepts a fitting result
         and returns a list of custom messages to be printed per result.
         Each custom message will be printed in a separate line.
+    grid_shape : (`int`, `int`), optional
+        The number of rows and columns of the pages of the grid mode, which
+        shows the images of the fitting results as thumbnails with their final
+        shapes. Clicking on a thumbnail shows the fitting result.
     """
     # Make sure that fitting_results is a list even with one fitting_result
     if not isinstance(fitting_results, Sized):
@@ -1967,6 +2214,95 @@ def visualize_fitting_results(
 
     output = ipywidgets.Output()
 
+    # The shapes of all iterations of each fitting result are stacked once in
+    # a (n_shapes, n_points, 2) array, so that the iterations animation only
+    # needs to move the shape artists of the previous frame.
+    iteration_points = {}
+    animation_state = {"key": None}
+
+    def get_iteration_points(i):
+        if i not in iteration_points:
+            iteration_points[i] = np.stack(
+                [s.points for s in fitting_results[i].shapes]
+            )
+        return iteration_points[i]
+
+    def get_iteration_name(fr, j):
+        # same naming as the one of view_iterations()
+        if j == 0 and fr.initial_shape is not None:
+            return "Initial"
+        elif j == len(fr.shapes) - 1:
+            return "Final"
+        iters_offset = 0 if fr.initial_shape is not None else 1
+        return "iteration {:0{}d}".format(j + iters_offset, len(str(fr.n_iters)))
+
+    def find_animation_artists(ax, points, edges):
+        # Finds the artists of the shape of an animation frame by their data,
+        # since the axes may also have the artists of the image, numbering,
+        # legend or any other overlay. The artists are tagged, so that they can
+        # be recognised.
+        markers = []
+        for line in ax.lines:
+            xy = line.get_xydata()
+            if xy.shape == points.shape and np.allclose(xy, points):
+                line.set_gid("menpowidgets-animation-markers")
+                markers.append(line)
+        lines = None
+        if edges is not None and len(edges) > 0:
+            segments = np.stack([points[edges[:, 0]], points[edges[:, 1]]], axis=1)
+            for collection in ax.collections:
+                if not isinstance(collection, mc.LineCollection):
+                    continue
+                s = collection.get_segments()
+                if len(s) == len(segments) and np.allclose(s, segments):
+                    lines = collection
+                    lines.set_gid("menpowidgets-animation-lines")
+        return markers, lines
+
+    def store_animation_artists(key, i, j, render_markers, render_lines):
+        # Stores the shape artists of an animation frame rendered with
+        # view_iterations(), so that the next frames can update them in place.
+        # If any of the rendered artists cannot be found, then the next frame
+        # is fully rendered.
+        ax = save_figure_wid.renderer.figure.axes[-1]
+        edges = getattr(fitting_results[i].shapes[0], "edges", None)
+        points = get_iteration_points(i)[j][:, ::-1]
+        markers, lines = find_animation_artists(ax, points, edges)
+        has_edges = edges is not None and len(edges) > 0
+        if (render_markers and len(markers) == 0) or (
+            render_lines and has_edges and lines is None
+        ):
+            animation_state["key"] = None
+            return
+        animation_state["key"] = key
+        animation_state["axes"] = ax
+        animation_state["markers"] = markers
+        animation_state["edges"] = edges
+        animation_state["lines"] = lines
+        animation_state["name"] = get_iteration_name(fitting_results[i], j)
+
+    def update_animation_artists(i, j):
+        # Moves the shape artists of the previous animation frame to the
+        # points of iteration j. Image points are (y, x), hence the flip.
+        points = get_iteration_points(i)[j][:, ::-1]
+        for line in animation_state["markers"]:
+            line.set_data(points[:, 0], points[:, 1])
+        if animation_state["lines"] is not None:
+            edges = animation_state["edges"]
+            animation_state["lines"].set_segments(
+                np.stack([points[edges[:, 0]], points[edges[:, 1]]], axis=1)
+            )
+        # rename the legend entry and subplot title
+        ax = animation_state["axes"]
+        new_name = get_iteration_name(fitting_results[i], j)
+        texts = [ax.title]
+        if ax.get_legend() is not None:
+            texts.extend(ax.get_legend().get_texts())
+        for t in texts:
+            if t.get_text() == animation_state["name"]:
+                t.set_text(new_name)
+        animation_state["name"] = new_name
+
     @output.capture(clear_output=True, wait=True)
     def plot_errors_function(name):
         # Get selected index
@@ -2019,15 +2355,40 @@ def visualize_fitting_results(
         )
         save_figure_wid.renderer.force_draw()
 
+    def export_jobs(indices):
+        # Snapshot the selected options, since they may change while
+        # exporting. The final fitting results are exported with view().
+        renderer_values = renderer_options_wid.selected_record
+        fitting_result_values = fitting_result_wid.selected_record
+
+        def job(i):
+            return (
+                render_fitting_result_view,
+                dict(
+                    fitting_result=fitting_results[i],
+                    renderer_values=renderer_values,
+                    fitting_result_values=fitting_result_values,
+                    figure_size=figure_size,
+                ),
+            )
+
+        return (job(i) for i in indices)
+
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
         # get selected object
         i = image_number_wid.selected_values if n_fitting_results > 1 else 0
 
+        # Show the page of thumbnails that includes the fitting result
+        if n_fitting_results > 1 and grid_switch.selected_values:
+            montage_wid.show(i)
+            ipydisplay.display(montage_wid)
+            return
+
         # get selected options
         tmp1 = renderer_options_wid.selected_values["markers_matplotlib"]
         tmp2 = renderer_options_wid.selected_values["lines_matplotlib"]
-        options = fitting_result_wid.selected_values
+        options = dict(fitting_result_wid.selected_values)
         options.update(renderer_options_wid.selected_values["axes"])
         options.update(renderer_options_wid.selected_values["legend"])
         options.update(renderer_options_wid.selected_values["numbering_matplotlib"])
@@ -2038,63 +2399,48 @@ def visualize_fitting_results(
         )
 
         # get selected view function
+        animation_key = None
         if (
             fitting_result_wid.result_iterations_tab.selected_index == 0
             or not fitting_results[i].is_iterative
         ):
             # use view()
-            # final shape colour
-            final_marker_face_colour = tmp1["marker_face_colour"][0]
-            final_marker_edge_colour = tmp1["marker_edge_colour"][0]
-            final_line_colour = tmp2["line_colour"][0]
-            # initial shape colour
-            initial_marker_face_colour = "b"
-            initial_marker_edge_colour = "b"
-            initial_line_colour = "b"
-            if fitting_results[i].initial_shape is not None:
-                initial_marker_face_colour = tmp1["marker_face_colour"][1]
-                initial_marker_edge_colour = tmp1["marker_edge_colour"][1]
-                initial_line_colour = tmp2["line_colour"][1]
-            # gt shape colour
-            gt_marker_face_colour = "y"
-            gt_marker_edge_colour = "y"
-            gt_line_colour = "y"
-            if fitting_results[i].gt_shape is not None:
-                if fitting_results[i].initial_shape is not None:
-                    gt_marker_face_colour = tmp1["marker_face_colour"][2]
-                    gt_marker_edge_colour = tmp1["marker_edge_colour"][2]
-                    gt_line_colour = tmp2["line_colour"][2]
-                else:
-                    gt_marker_face_colour = tmp1["marker_face_colour"][1]
-                    gt_marker_edge_colour = tmp1["marker_edge_colour"][1]
-                    gt_line_colour = tmp2["line_colour"][1]
-            # render
-            save_figure_wid.renderer = fitting_results[i].view(
-                figure_id=save_figure_wid.renderer.figure_id,
-                new_figure=False,
-                render_markers=tmp1["render_markers"],
-                final_marker_face_colour=final_marker_face_colour,
-                final_marker_edge_colour=final_marker_edge_colour,
-                final_line_colour=final_line_colour,
-                initial_marker_face_colour=initial_marker_face_colour,
-                initial_marker_edge_colour=initial_marker_edge_colour,
-                initial_line_colour=initial_line_colour,
-                gt_marker_face_colour=gt_marker_face_colour,
-                gt_marker_edge_colour=gt_marker_edge_colour,
-                gt_line_colour=gt_line_colour,
-                marker_style=tmp1["marker_style"],
-                marker_size=tmp1["marker_size"],
-                marker_edge_width=tmp1["marker_edge_width"],
-                render_lines=tmp2["render_lines"],
-                line_style=tmp2["line_style"],
-                line_width=tmp2["line_width"],
-                figure_size=new_figure_size,
-                **options
+            save_figure_wid.renderer = render_fitting_result_view(
+                fitting_results[i],
+                renderer_options_wid.selected_values,
+                fitting_result_wid.selected_values,
+                figure_size=figure_size,
+                renderer=save_figure_wid.renderer,
             )
         else:
             # use view_iterations()
             if fitting_result_wid.iterations_mode.value == "animation":
                 # The mode is 'Animation'
+                # If only the iteration changed since the previous frame, then
+                # just move the shape artists. This requires the image to be
+                # rendered and the axes limits not to be a padding, so that
+                # the axes limits do not depend on the shape.
+                animation_key = (
+                    i,
+                    renderer_options_wid.selected_record,
+                    fitting_result_wid.selected_record,
+                )
+                previous_key = animation_state["key"]
+                if (
+                    previous_key is not None
+                    and previous_key[0] == i
+                    and not animation_key[1].diff(previous_key[1])
+                    and set(animation_key[2].diff(previous_key[2])) <= {"iters"}
+                    and options["render_image"]
+                    and not options["render_numbering"]
+                    and not isinstance(options["axes_x_limits"], float)
+                    and not isinstance(options["axes_y_limits"], float)
+                ):
+                    update_animation_artists(i, options["iters"])
+                    ipydisplay.display(save_figure_wid.renderer.figure)
+                    update_info({}, custom_info_callback=custom_info_callback)
+                    return
+
                 # get colours
                 marker_face_colour = tmp1["marker_face_colour"][0]
                 marker_edge_colour = tmp1["marker_edge_colour"][0]
@@ -2133,6 +2479,18 @@ def visualize_fitting_results(
                 **options
             )
 
+        # Keep the shape artists of the animation frame
+        if animation_key is not None:
+            store_animation_artists(
+                animation_key,
+                i,
+                options["iters"],
+                tmp1["render_markers"],
+                tmp2["render_lines"],
+            )
+        else:
+            animation_state["key"] = None
+
         # Show figure
         save_figure_wid.renderer.force_draw()
 
@@ -2250,7 +2608,9 @@ def visualize_fitting_results(
     info_error_box = ipywidgets.HBox([info_wid, error_box])
 
     # Create save figure widget
-    save_figure_wid = SaveMatplotlibFigureOptionsWidget()
+    save_figure_wid = SaveMatplotlibFigureOptionsWidget(
+        n_items=n_fitting_results, export_jobs_function=export_jobs
+    )
 
     def update_renderer_options(change):
         # Get selected fitting result object
@@ -2340,12 +2700,26 @@ def visualize_fitting_results(
             interval=0.2,
             description="Image",
             loop_enabled=True,
+            record_frame_function=lambda: record_renderer_frame(save_figure_wid),
+        )
+
+        # Grid mode
+        def make_tile(k, tile_shape):
+            fr = fitting_results[k]
+            if fr.image is None:
+                return shape_tile(fr.final_shape, tile_shape, image_view=True)
+            return image_tile(fr.image, tile_shape, shape=fr.final_shape)
+
+        montage_wid = MontageWidget(
+            MontagePages(n_fitting_results, make_tile, grid_shape=grid_shape),
+            figure_width=figure_size[0],
         )
+        grid_switch = montage_wid.link_index_widget(image_number_wid, render_function)
 
         # Header widget
         logo_wid = LogoWidget(style=main_style)
         logo_wid.layout.margin = "0px 10px 0px 0px"
-        header_wid = ipywidgets.HBox([logo_wid, image_number_wid])
+        header_wid = ipywidgets.HBox([logo_wid, image_number_wid, grid_switch])
         header_wid.layout.align_items = "center"
         header_wid.layout.margin = "0px 0px 10px 0px"
     else:
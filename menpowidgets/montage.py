@@ -0,0 +1,366 @@
+r"""
+Montages of thumbnails of images and shapes.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+
+def _thumbnail_pixels(pixels, tile_shape):
+    # Subsample the pixel centres of the thumbnail and place it at the centre
+    # of a white tile
+    height, width = pixels.shape[1:]
+    scale = min(tile_shape[0] / float(height), tile_shape[1] / float(width))
+    t_height = max(int(round(height * scale)), 1)
+    t_width = max(int(round(width * scale)), 1)
+    rows = np.minimum((np.arange(t_height) + 0.5) / scale, height - 1).astype(int)
+    cols = np.minimum((np.arange(t_width) + 0.5) / scale, width - 1).astype(int)
+    sampled = pixels[:, rows][:, :, cols]
+    if sampled.shape[0] == 3:
+        rgb = np.clip(sampled, 0, 1).transpose(1, 2, 0)
+    else:
+        grey = sampled[0]
+        low, high = grey.min(), grey.max()
+        grey = (grey - low) / (high - low) if high > low else np.zeros_like(grey)
+        rgb = np.repeat(grey[..., None], 3, axis=2)
+    tile = np.ones(tuple(tile_shape) + (3,), dtype=np.float32)
+    offset = ((tile_shape[0] - t_height) // 2, (tile_shape[1] - t_width) // 2)
+    tile[offset[0] : offset[0] + t_height, offset[1] : offset[1] + t_width] = rgb
+    return tile, scale, offset
+
+
+def image_tile(image, tile_shape, group=None, shape=None):
+    r"""
+    Function that creates the montage tile of an image, i.e. a subsampled
+    thumbnail of its pixels along with its landmarks.
+
+    Parameters
+    ----------
+    image : `menpo.image.Image` or subclass
+        The image.
+    tile_shape : (`int`, `int`)
+        The height and width of the tile in pixels.
+    group : `str` or ``None``, optional
+        The landmark group that gets overlaid. If ``None``, then no landmarks
+        are overlaid.
+    shape : `menpo.shape.PointCloud` or ``None``, optional
+        A shape that gets overlaid instead of a landmark group, e.g. a fitted
+        shape.
+
+    Returns
+    -------
+    tile : ``(height, width, 3)`` `ndarray`
+        The RGB pixels of the tile.
+    points : ``(n_points, 2)`` `ndarray`
+        The ``(x, y)`` coordinates of the overlaid points in the tile.
+    """
+    tile, scale, offset = _thumbnail_pixels(image.pixels, tile_shape)
+    if shape is None and group is not None and group in image.landmarks:
+        shape = image.landmarks[group]
+    if shape is None:
+        return tile, np.zeros((0, 2))
+    # The row r of the thumbnail samples the image at (r + 0.5) / scale
+    points = shape.points[:, ::-1] * scale - 0.5 + np.array(offset[::-1])
+    return tile, points
+
+
+def shape_tile(shape, tile_shape, image_view=False):
+    r"""
+    Function that creates the montage tile of a shape, i.e. its points fitted
+    within a white tile.
+
+    Parameters
+    ----------
+    shape : `menpo.shape.PointCloud` or subclass
+        The shape.
+    tile_shape : (`int`, `int`)
+        The height and width of the tile in pixels.
+    image_view : `bool`, optional
+        If ``True``, then the shape is viewed in the image coordinates.
+
+    Returns
+    -------
+    tile : ``(height, width, 3)`` `ndarray`
+        The RGB pixels of the tile.
+    points : ``(n_points, 2)`` `ndarray`
+        The ``(x, y)`` coordinates of the points in the tile.
+    """
+    tile = np.ones(tuple(tile_shape) + (3,), dtype=np.float32)
+    points = shape.points[:, :2]
+    if image_view:
+        points = points[:, ::-1]
+    else:
+        # The y axis points upwards
+        points = points * np.array([1.0, -1.0])
+    min_b = points.min(axis=0)
+    extent = np.maximum(points.max(axis=0) - min_b, np.finfo(float).eps)
+    # Keep a 10% margin and the aspect ratio of the shape
+    scale = 0.8 * min(tile_shape[1] / extent[0], tile_shape[0] / extent[1])
+    centre = np.array([tile_shape[1], tile_shape[0]]) / 2.0 - 0.5
+    points = (points - min_b - extent / 2.0) * scale + centre
+    return tile, points
+
+
+def compose_montage(tiles, grid_shape):
+    r"""
+    Function that composes montage tiles into one atlas array, row by row. The
+    slots of the grid that are not filled are left white.
+
+    Parameters
+    ----------
+    tiles : `list` of (``(height, width, 3)`` `ndarray`, ``(n, 2)`` `ndarray`)
+        The pixels and points of each tile (see :func:`image_tile`).
+    grid_shape : (`int`, `int`)
+        The number of rows and columns of the grid.
+
+    Returns
+    -------
+    atlas : ``(n_rows * height, n_columns * width, 3)`` `ndarray`
+        The RGB pixels of the montage.
+    points : ``(n_points, 2)`` `ndarray`
+        The ``(x, y)`` coordinates of the points of all tiles in the atlas.
+    """
+    n_rows, n_columns = grid_shape
+    t_height, t_width = tiles[0][0].shape[:2]
+    atlas = np.ones((n_rows * t_height, n_columns * t_width, 3), dtype=np.float32)
+    points = [np.zeros((0, 2))]
+    for k, (tile, tile_points) in enumerate(tiles):
+        row, column = divmod(k, n_columns)
+        atlas[
+            row * t_height : (row + 1) * t_height,
+            column * t_width : (column + 1) * t_width,
+        ] = tile
+        points.append(tile_points + np.array([column * t_width, row * t_height]))
+    return atlas, np.concatenate(points)
+
+
+class MontagePages(object):
+    r"""
+    Class that splits a `list` of items in pages of montages and caches the
+    composed pages. The pages are composed with :func:`compose_montage`,
+    either on request or in a background thread when they get prefetched.
+
+    Parameters
+    ----------
+    n_items : `int`
+        The number of items.
+    make_tile : `callable`
+        The function that creates the tile of an item given its index. It must
+        have signature ``make_tile(index, tile_shape)`` and return the pixels
+        and points of the tile (see :func:`image_tile`).
+    grid_shape : (`int`, `int`), optional
+        The number of rows and columns of each page.
+    tile_shape : (`int`, `int`), optional
+        The height and width of each tile in pixels.
+    n_cached_pages : `int`, optional
+        The maximum number of cached pages.
+    """
+
+    def __init__(
+        self,
+        n_items,
+        make_tile,
+        grid_shape=(4, 4),
+        tile_shape=(96, 96),
+        n_cached_pages=16,
+    ):
+        self.n_items = n_items
+        self.make_tile = make_tile
+        self.grid_shape = tuple(grid_shape)
+        self.tile_shape = tuple(tile_shape)
+        self.n_cached_pages = n_cached_pages
+        self._pages = OrderedDict()
+        self._executor = None
+
+    @property
+    def page_size(self):
+        r"""
+        The number of items per page.
+
+        :type: `int`
+        """
+        return self.grid_shape[0] * self.grid_shape[1]
+
+    @property
+    def n_pages(self):
+        r"""
+        The number of pages.
+
+        :type: `int`
+        """
+        return max(-(-self.n_items // self.page_size), 1)
+
+    def page_of(self, index):
+        r"""
+        Method that returns the page of an item.
+
+        Parameters
+        ----------
+        index : `int`
+            The index of the item.
+
+        Returns
+        -------
+        page : `int`
+            The page.
+        """
+        return index // self.page_size
+
+    def page_indices(self, page):
+        r"""
+        Method that returns the indices of the items of a page.
+
+        Parameters
+        ----------
+        page : `int`
+            The page.
+
+        Returns
+        -------
+        indices : `range`
+            The indices of the items.
+        """
+        start = page * self.page_size
+        return range(start, min(start + self.page_size, self.n_items))
+
+    def index_at(self, page, x, y):
+        r"""
+        Method that returns the item of a page at a position of its atlas.
+
+        Parameters
+        ----------
+        page : `int`
+            The page.
+        x : `float`
+            The horizontal position in the atlas pixels.
+        y : `float`
+            The vertical position in the atlas pixels.
+
+        Returns
+        -------
+        index : `int` or ``None``
+            The index of the item or ``None`` if there is no item at the
+            position.
+        """
+        column = int(x // self.tile_shape[1])
+        row = int(y // self.tile_shape[0])
+        if not (0 <= row < self.grid_shape[0] and 0 <= column < self.grid_shape[1]):
+            return None
+        index = page * self.page_size + row * self.grid_shape[1] + column
+        return index if index < self.n_items else None
+
+    def _compose(self, page):
+        return compose_montage(
+            [self.make_tile(k, self.tile_shape) for k in self.page_indices(page)],
+            self.grid_shape,
+        )
+
+    def _cache(self, page, future):
+        self._pages[page] = future
+        while len(self._pages) > self.n_cached_pages:
+            _, evicted = self._pages.popitem(last=False)
+            evicted.cancel()
+
+    def get(self, page):
+        r"""
+        Method that returns a composed page. If it is not cached, then it is
+        composed in the calling thread, or waited for if it is being composed
+        in the background.
+
+        Parameters
+        ----------
+        page : `int`
+            The page.
+
+        Returns
+        -------
+        atlas : ``(height, width, 3)`` `ndarray`
+            The RGB pixels of the page.
+        points : ``(n_points, 2)`` `ndarray`
+            The ``(x, y)`` coordinates of the points of the page.
+        """
+        from concurrent.futures import Future
+
+        future = self._pages.get(page)
+        if future is None or future.cancelled():
+            future = Future()
+            future.set_result(self._compose(page))
+            self._cache(page, future)
+        else:
+            self._pages.move_to_end(page)
+        return future.result()
+
+    def prefetch(self, pages):
+        r"""
+        Method that composes pages in a background thread, unless they are
+        already cached.
+
+        Parameters
+        ----------
+        pages : `list` of `int`
+            The pages. The ones that are out of range are ignored.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        for page in pages:
+            if 0 <= page < self.n_pages and page not in self._pages:
+                self._cache(page, self._executor.submit(self._compose, page))
+
+    def clear(self):
+        r"""
+        Method that drops the cached pages, e.g. after the tiles' options have
+        changed.
+        """
+        for future in self._pages.values():
+            future.cancel()
+        self._pages.clear()
+
+
+def render_montage(
+    atlas, points, figure_width=7, marker_size=10, marker_colour="red", dpi=72
+):
+    r"""
+    Function that renders a montage page with a single ``imshow`` of its atlas
+    and a single scatter of its points. The figure is not managed by
+    `matplotlib.pyplot` and the atlas fills it, so a pixel of the figure
+    maps to the atlas by a scale.
+
+    Parameters
+    ----------
+    atlas : ``(height, width, 3)`` `ndarray`
+        The RGB pixels of the page.
+    points : ``(n_points, 2)`` `ndarray`
+        The ``(x, y)`` coordinates of the points in the atlas.
+    figure_width : `float`, optional
+        The width of the figure in inches.
+    marker_size : `float`, optional
+        The size of the markers in points^2.
+    marker_colour : `str`, optional
+        The colour of the markers.
+    dpi : `int`, optional
+        The resolution of the figure.
+
+    Returns
+    -------
+    figure : `matplotlib.figure.Figure`
+        The figure.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    height, width = atlas.shape[:2]
+    figure = Figure(figsize=(figure_width, figure_width * height / width), dpi=dpi)
+    FigureCanvasAgg(figure)
+    ax = figure.add_axes([0, 0, 1, 1])
+    ax.imshow(atlas, interpolation="nearest")
+    if points.shape[0] > 0:
+        ax.scatter(
+            points[:, 0], points[:, 1], s=marker_size, c=marker_colour, linewidths=0
+        )
+    ax.set_xlim(-0.5, width - 0.5)
+    ax.set_ylim(height - 0.5, -0.5)
+    ax.set_axis_off()
+    return figure
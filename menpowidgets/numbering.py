@@ -0,0 +1,207 @@
+r"""
+Numbering of the points of dense shapes.
+"""
+
+import weakref
+
+import numpy as np
+
+
+def numbered_points(shape, with_labels=None, image_view=False):
+    r"""
+    Function that returns the points of a 2D shape in the ``(x, y)`` data
+    coordinates of the axes, along with the number that the menpo viewers
+    assign to each of them, i.e. the points of each label of a labelled shape
+    are numbered separately.
+
+    Parameters
+    ----------
+    shape : `menpo.shape.PointCloud` or subclass
+        The shape.
+    with_labels : `list` of `str` or ``None``, optional
+        The labels of a labelled shape that get rendered. If ``None``, then all
+        the labels are rendered.
+    image_view : `bool`, optional
+        If ``True``, then the points are flipped as in the image coordinates.
+
+    Returns
+    -------
+    points : ``(n_points, 2)`` `ndarray`
+        The points.
+    numbers : ``(n_points,)`` `ndarray`
+        The number of each point.
+    """
+    if hasattr(shape, "labels"):
+        if isinstance(with_labels, str):
+            with_labels = [with_labels]
+        labels = [l for l in shape.labels if with_labels is None or l in with_labels]
+        sub_points = [shape.get_label(l).points for l in labels]
+    else:
+        sub_points = [shape.points]
+    if len(sub_points) == 0:
+        return np.zeros((0, 2)), np.zeros(0, dtype=int)
+    points = np.concatenate(sub_points)
+    numbers = np.concatenate([np.arange(p.shape[0]) for p in sub_points])
+    if image_view:
+        points = points[:, ::-1]
+    return points, numbers
+
+
+def cull_numbering(ax, points, min_distance):
+    r"""
+    Function that selects the points of a Matplotlib axes that get numbered,
+    i.e. the points that lie within the current axes limits and are not closer
+    than `min_distance` pixels to each other. The points are binned on a grid
+    of square cells of side `min_distance` pixels and the first point of each
+    cell is a candidate. A candidate is skipped if it is closer than
+    `min_distance` pixels to the candidate of a neighbouring cell that comes
+    first, thus earlier points take precedence and only the candidates of
+    neighbouring cells are compared.
+
+    Parameters
+    ----------
+    ax : `matplotlib.axes.Axes`
+        The axes. Its limits and figure size must be already set.
+    points : ``(n_points, 2)`` `ndarray`
+        The points in the ``(x, y)`` data coordinates of `ax`.
+    min_distance : `float`
+        The minimum distance (in pixels) between two numbered points. If ``0``,
+        then only the points outside the axes limits are skipped.
+
+    Returns
+    -------
+    indices : ``(n_numbered,)`` `ndarray`
+        The indices of the numbered points in ascending order.
+    """
+    x_min, x_max = sorted(ax.get_xlim())
+    y_min, y_max = sorted(ax.get_ylim())
+    indices = np.nonzero(
+        (points[:, 0] >= x_min)
+        & (points[:, 0] <= x_max)
+        & (points[:, 1] >= y_min)
+        & (points[:, 1] <= y_max)
+    )[0]
+    if min_distance <= 0 or indices.size < 2:
+        return indices
+
+    pixels = ax.transData.transform(points[indices])
+    cells = np.floor(pixels / min_distance).astype(np.int64)
+    cells -= cells.min(axis=0) - 1
+    # The flat index of each cell, with a margin of a cell on each side
+    width = cells[:, 1].max() + 2
+    keys = cells[:, 0] * width + cells[:, 1]
+    # A cell keeps at most one point, so the first point of each cell is the
+    # only candidate that needs to be compared with its neighbourhood
+    _, first = np.unique(keys, return_index=True)
+    first.sort()
+    keys = keys[first]
+    pixels = pixels[first]
+
+    # Look up the candidate of each neighbouring cell by its flat index
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+    candidates = np.arange(first.size)
+    skipped = np.zeros(first.size, dtype=bool)
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            if dx == 0 and dy == 0:
+                continue
+            neighbour_keys = keys + dx * width + dy
+            positions = np.minimum(
+                np.searchsorted(sorted_keys, neighbour_keys), sorted_keys.size - 1
+            )
+            neighbours = order[positions]
+            skipped |= (
+                (sorted_keys[positions] == neighbour_keys)
+                & (neighbours < candidates)
+                & (np.sum((pixels - pixels[neighbours]) ** 2, axis=1) < min_distance**2)
+            )
+    return indices[first[~skipped]]
+
+
+# The numbering Text artists of each axes, so that they get reused
+_numbering_texts = weakref.WeakKeyDictionary()
+
+
+def render_culled_numbering(
+    ax,
+    points,
+    numbers=None,
+    min_distance=0,
+    numbers_horizontal_align="center",
+    numbers_vertical_align="bottom",
+    numbers_font_name="sans-serif",
+    numbers_font_size=10,
+    numbers_font_style="normal",
+    numbers_font_weight="normal",
+    numbers_font_colour="k",
+):
+    r"""
+    Function that numbers the points of a Matplotlib axes as the menpo viewers
+    do, but only for the points selected by :func:`cull_numbering`. The Text
+    artists of the previous call on the same axes are reused and the ones that
+    are not needed get hidden, so repeated renders on a persistent figure do
+    not create new artists.
+
+    Parameters
+    ----------
+    ax : `matplotlib.axes.Axes`
+        The axes. Its limits and figure size must be already set.
+    points : ``(n_points, 2)`` `ndarray`
+        The points in the ``(x, y)`` data coordinates of `ax`.
+    numbers : ``(n_points,)`` `ndarray` or ``None``, optional
+        The number of each point. If ``None``, then the points are numbered by
+        their index.
+    min_distance : `float`, optional
+        The minimum distance (in pixels) between two numbered points.
+    numbers_horizontal_align : `str`, optional
+        The horizontal alignment of the numbers.
+    numbers_vertical_align : `str`, optional
+        The vertical alignment of the numbers.
+    numbers_font_name : `str`, optional
+        The font name of the numbers.
+    numbers_font_size : `int`, optional
+        The font size of the numbers.
+    numbers_font_style : `str`, optional
+        The font style of the numbers.
+    numbers_font_weight : `str`, optional
+        The font weight of the numbers.
+    numbers_font_colour : `str` or `list`, optional
+        The font colour of the numbers.
+
+    Returns
+    -------
+    n_numbered : `int`
+        The number of points that got numbered.
+    """
+    points = np.asarray(points)
+    indices = cull_numbering(ax, points, min_distance)
+    if numbers is None:
+        numbers = indices
+    else:
+        numbers = np.asarray(numbers)[indices]
+    style = {
+        "horizontalalignment": numbers_horizontal_align,
+        "verticalalignment": numbers_vertical_align,
+        "size": numbers_font_size,
+        "family": numbers_font_name,
+        "fontstyle": numbers_font_style,
+        "fontweight": numbers_font_weight,
+        "color": numbers_font_colour,
+    }
+
+    # Reuse the artists that are still attached to the axes, i.e. the axes
+    # have not been cleared since the previous call
+    attached = set(map(id, ax.texts))
+    texts = [t for t in _numbering_texts.get(ax, []) if id(t) in attached]
+    for t, k, p in zip(texts, numbers, points[indices]):
+        t.set_text(str(k))
+        t.set_position((p[0], p[1]))
+        t.update(style)
+        t.set_visible(True)
+    for t in texts[len(indices) :]:
+        t.set_visible(False)
+    for k, p in zip(numbers[len(texts) :], points[indices[len(texts) :]]):
+        texts.append(ax.text(p[0], p[1], str(k), clip_on=True, **style))
+    _numbering_texts[ax] = texts
+    return indices.size
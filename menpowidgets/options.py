@@ -32,12 +32,24 @@ from .tools import (
     MultipleSelectionTogglesWidget,
 )
 from .style import map_styles_to_hex_colours
+from .defaults import (
+    shape_2d_default_options,
+    shape_3d_default_options,
+    renderer_global_options,
+    renderer_labels_options,
+    image_default_options,
+    landmark_default_options,
+)
 from .utils import (
     do_one_iteration,
     sample_colours_from_colourmap,
     lists_are_the_same,
     sync_asyncio_sleep,
 )
+from .cache import write_cached_figure
+from .recording import VideoWriter
+from .records import OptionsRecord
+from .workers import init_export_worker, save_figure_job
 
 
 class AnimationOptionsWidget(MenpoWidget):
@@ -108,6 +120,15 @@ class AnimationOptionsWidget(MenpoWidget):
             ``''``        No style
             ============= ==================
 
+    record_frame_function : `callable` or ``None``, optional
+        Function with signature ``record_frame_function()`` that returns the
+        currently rendered frame as an ``(height, width, 3)`` `uint8` array.
+        If not ``None``, then a record button is added that steps through all
+        the indices and writes the frames to a video file (see
+        :meth:`record_animation`).
+    record_fps : `int`, optional
+        The frame rate of the recorded videos.
+
     Example
     -------
     Let's create an animation widget and then update its state. Firstly, we need
@@ -150,7 +171,11 @@ class AnimationOptionsWidget(MenpoWidget):
         loop_enabled=True,
         continuous_update=False,
         style="",
+        record_frame_function=None,
+        record_fps=10,
     ):
+        from os import getcwd
+        from os.path import join
         from time import sleep
         from IPython import get_ipython
 
@@ -228,6 +253,24 @@ class AnimationOptionsWidget(MenpoWidget):
         self.box_2.layout.margin = "0px 0px 0px 10px"
         self.container = ipywidgets.HBox([self.index_wid, self.box_1, self.box_2])
         self.container.layout.align_items = "flex-start"
+        if record_frame_function is not None:
+            self.record_button = ipywidgets.Button(
+                icon="circle",
+                description="",
+                tooltip="Record animation to video",
+                layout=ipywidgets.Layout(width="40px"),
+            )
+            self.record_filename_text = ipywidgets.Text(
+                value=join(getcwd(), "animation.mp4"),
+                description="",
+                layout=ipywidgets.Layout(width="15cm"),
+            )
+            self.box_3 = ipywidgets.HBox(
+                [self.record_button, self.record_filename_text]
+            )
+            self.box_3.layout.align_items = "center"
+            self.box_3.layout.margin = "0px 0px 0px 10px"
+            self.container.children = self.container.children + (self.box_3,)
 
         # Assign properties
         self.min = index["min"]
@@ -240,6 +283,8 @@ class AnimationOptionsWidget(MenpoWidget):
         self.interval_step = interval_step
         self.please_stop = False
         self.please_pause = False
+        self.record_frame_function = record_frame_function
+        self.record_fps = record_fps
 
         # Set style
         self.predefined_style(style)
@@ -289,20 +334,7 @@ class AnimationOptionsWidget(MenpoWidget):
                     break
 
                 # Update index value
-                if index_style == "slider":
-                    self.index_wid.slider.value = i
-                else:
-                    self.index_wid.set_widget_state(
-                        {
-                            "min": self.min,
-                            "max": self.max,
-                            "step": self.step,
-                            "index": i,
-                        },
-                        loop_enabled=self.loop_enabled,
-                        text_editable=False,
-                        allow_callback=True,
-                    )
+                self._set_index(i)
 
                 # Update counter
                 if self.loop_toggle.value and i >= self.max:
@@ -319,26 +351,25 @@ class AnimationOptionsWidget(MenpoWidget):
 
             # If stop was pressed, then reset
             if self.please_stop:
-                if index_style == "slider":
-                    self.index_wid.slider.value = 0
-                else:
-                    self.index_wid.set_widget_state(
-                        {
-                            "min": self.min,
-                            "max": self.max,
-                            "step": self.step,
-                            "index": 0,
-                        },
-                        loop_enabled=self.loop_enabled,
-                        text_editable=False,
-                        allow_callback=True,
-                    )
+                self._set_index(0)
 
             # Enable the index widget
             self.index_wid_disability(False)
 
         self.play_button.on_click(animate)
 
+        if record_frame_function is not None:
+
+            def record_pressed(_):
+                self.record_button.disabled = True
+                try:
+                    filename = self.record_animation(self.record_filename_text.value)
+                    self.record_filename_text.value = filename
+                finally:
+                    self.record_button.disabled = False
+
+            self.record_button.on_click(record_pressed)
+
         def pause_pressed(_):
             self.pause_animation()
 
@@ -354,6 +385,55 @@ class AnimationOptionsWidget(MenpoWidget):
 
         self.index_wid.observe(save_value, names="selected_values", type="change")
 
+    def _set_index(self, i):
+        if self.index_style == "slider":
+            self.index_wid.slider.value = i
+        else:
+            self.index_wid.set_widget_state(
+                {"min": self.min, "max": self.max, "step": self.step, "index": i},
+                loop_enabled=self.loop_enabled,
+                text_editable=False,
+                allow_callback=True,
+            )
+
+    def record_animation(self, filename):
+        r"""
+        Method that steps through all the indices and records the rendered
+        frames to a video file. The frames are grabbed with
+        ``record_frame_function`` after each render and streamed to the file one
+        at a time at a fixed frame rate of ``record_fps``, regardless of how
+        long each render took. Pressing the stop button ends the recording
+        early.
+
+        Parameters
+        ----------
+        filename : `str`
+            The video file path. If ``ffmpeg`` is not available, then the video
+            is written as GIF and the suffix is replaced with ``.gif``.
+
+        Returns
+        -------
+        filename : `str`
+            The path of the written video file.
+        """
+        if self.record_frame_function is None:
+            raise ValueError("record_frame_function was not provided")
+        writer = VideoWriter(filename, fps=self.record_fps)
+        self.index_wid_disability(True)
+        self.please_pause = False
+        self.please_stop = False
+        try:
+            for i in range(self.min, self.max + 1, self.step):
+                if self.please_pause or self.please_stop:
+                    break
+                self._set_index(i)
+                writer.write(self.record_frame_function())
+                do_one_iteration(self.kernel)
+        finally:
+            writer.close()
+            self.index_wid_disability(False)
+        return writer.filename
+
     def index_wid_disability(self, disabled):
         if self.index_style == "buttons":
             self.index_wid.index_text.disabled = disabled
@@ -390,6 +470,8 @@ class AnimationOptionsWidget(MenpoWidget):
         self.fast_forward_button.button_style = "info"
         self.fast_backward_button.button_style = "info"
         self.loop_toggle.button_style = "warning"
+        if self.record_frame_function is not None:
+            self.record_button.button_style = "danger"
         if self.index_style == "buttons":
             self.index_wid.button_plus.button_style = "primary"
             self.index_wid.button_minus.button_style = "primary"
@@ -686,39 +768,7 @@ class Shape2DOptionsWidget(MenpoWidget):
         key = self.get_key(labels)
         # if the key does not exist in the default options dict, then add it
         if key not in self.default_options:
-            self.default_options[key] = {}
-
-            # Set image view
-            self.default_options[key]["image_view"] = True
-
-            # Set lines options
-            lc = ["red"]
-            if labels is not None:
-                lc = sample_colours_from_colourmap(len(labels), "jet")
-            self.default_options[key]["lines"] = {
-                "line_colour": lc,
-                "render_lines": True,
-                "line_width": 1,
-                "line_style": "-",
-            }
-
-            # Set markers options
-            fc = ["red"]
-            ec = ["black"]
-            if labels is not None and len(labels) > 1:
-                fc = sample_colours_from_colourmap(len(labels), "jet")
-                ec = sample_colours_from_colourmap(len(labels), "jet")
-            self.default_options[key]["markers"] = {
-                "marker_face_colour": fc,
-                "marker_edge_colour": ec,
-                "render_markers": True,
-                "marker_size": 5,
-                "marker_style": "o",
-                "marker_edge_width": 1,
-            }
-
-            # Set labels
-            self.default_options[key]["with_labels"] = labels
+            self.default_options[key] = shape_2d_default_options(labels)
         return self.default_options[key]
 
     def add_callbacks(self):
@@ -1083,33 +1133,7 @@ class Shape3DOptionsWidget(MenpoWidget):
         key = self.get_key(labels)
         # if the key does not exist in the default options dict, then add it
         if key not in self.default_options:
-            self.default_options[key] = {}
-
-            # Set lines options
-            lc = ["red"]
-            if labels is not None:
-                lc = sample_colours_from_colourmap(len(labels), "jet")
-            self.default_options[key]["lines"] = {
-                "line_colour": lc,
-                "render_lines": True,
-                "line_width": 2.0,
-            }
-
-            # Set markers options
-            mc = ["red"]
-            if labels is not None and len(labels) > 1:
-                mc = sample_colours_from_colourmap(len(labels), "jet")
-            self.default_options[key]["markers"] = {
-                "marker_colour": mc,
-                "render_markers": True,
-                "marker_size": None,
-                "marker_style": "sphere",
-                "marker_resolution": 8,
-                "step": 1,
-            }
-
-            # Set labels
-            self.default_options[key]["with_labels"] = labels
+            self.default_options[key] = shape_3d_default_options(labels)
         return self.default_options[key]
 
     def add_callbacks(self):
@@ -1897,22 +1921,14 @@ class RendererOptionsWidget(MenpoWidget):
         }
         # update default values
         current_key = self.get_key(self.labels)
-        if "lines_matplotlib" in self.options_tabs:
-            self.default_options[current_key]["lines_matplotlib"] = (
-                self.selected_values["lines_matplotlib"].copy()
-            )
-        if "lines_mayavi" in self.options_tabs:
-            self.default_options[current_key]["lines_mayavi"] = self.selected_values[
-                "lines_mayavi"
-            ].copy()
-        if "markers_matplotlib" in self.options_tabs:
-            self.default_options[current_key]["markers_matplotlib"] = (
-                self.selected_values["markers_matplotlib"].copy()
-            )
-        if "markers_mayavi" in self.options_tabs:
-            self.default_options[current_key]["markers_mayavi"] = self.selected_values[
-                "markers_mayavi"
-            ].copy()
+        for o in [
+            "lines_matplotlib",
+            "lines_mayavi",
+            "markers_matplotlib",
+            "markers_mayavi",
+        ]:
+            if o in self.options_tabs:
+                self.default_options[current_key][o] = self.selected_values[o].copy()
         # update global values
         if "image_matplotlib" in self.options_tabs:
             self.global_options["image_matplotlib"] = self.selected_values[
@@ -1943,6 +1959,27 @@ class RendererOptionsWidget(MenpoWidget):
         if "axes" in self.options_tabs:
             self.global_options["axes"] = self.selected_values["axes"]
 
+    @property
+    def selected_record(self):
+        r"""
+        The `selected_values` as an immutable and hashable
+        `menpowidgets.records.OptionsRecord`. It is composed of the records of
+        the options' widgets, thus only the option group that changed gets
+        frozen again.
+
+        :type: `menpowidgets.records.OptionsRecord`
+        """
+        values = self.selected_values
+        if getattr(self, "_record_source", None) is not values:
+            self._record = OptionsRecord(
+                {
+                    o: self.options_widgets[i].selected_record
+                    for i, o in enumerate(self.options_tabs)
+                }
+            )
+            self._record_source = values
+        return self._record
+
     def add_callbacks(self):
         r"""
         Function that adds the handler callback functions in all the widget
@@ -1993,94 +2030,9 @@ class RendererOptionsWidget(MenpoWidget):
             `tuple` or `list`, then it defines the axis limits. If ``None``, then
             the limits are set automatically.
         """
-        self.global_options = {}
-        for o in self.options_tabs:
-            if o == "image_matplotlib":
-                self.global_options[o] = {
-                    "interpolation": "bilinear",
-                    "cmap_name": None,
-                    "alpha": 1.0,
-                }
-            elif o == "trimesh":
-                self.global_options[o] = {
-                    "mesh_type": "wireframe",
-                    "line_width": 2.0,
-                    "colour": "red",
-                    "marker_style": "sphere",
-                    "marker_size": None,
-                    "marker_resolution": 8,
-                    "step": 1,
-                    "alpha": 1.0,
-                }
-            elif o == "textured_trimesh":
-                self.global_options[o] = {
-                    "render_texture": True,
-                    "mesh_type": "surface",
-                    "ambient_light": 0.0,
-                    "specular_light": 0.0,
-                    "alpha": 1.0,
-                    "line_width": 2.0,
-                    "colour": "red",
-                }
-            elif o == "numbering_matplotlib":
-                self.global_options[o] = {
-                    "render_numbering": False,
-                    "numbers_font_name": "sans-serif",
-                    "numbers_font_size": 10,
-                    "numbers_font_style": "normal",
-                    "numbers_font_weight": "normal",
-                    "numbers_font_colour": "black",
-                    "numbers_horizontal_align": "center",
-                    "numbers_vertical_align": "bottom",
-                }
-            elif o == "numbering_mayavi":
-                self.global_options[o] = {
-                    "render_numbering": False,
-                    "numbers_size": None,
-                    "numbers_colour": "black",
-                }
-            elif o == "zoom_one":
-                self.global_options[o] = 1.0
-            elif o == "zoom_two":
-                self.global_options[o] = [1.0, 1.0]
-            elif o == "axes":
-                self.global_options[o] = {
-                    "render_axes": False,
-                    "axes_font_name": "sans-serif",
-                    "axes_font_size": 10,
-                    "axes_font_style": "normal",
-                    "axes_font_weight": "normal",
-                    "axes_x_limits": axes_x_limits,
-                    "axes_y_limits": axes_y_limits,
-                    "axes_x_ticks": None,
-                    "axes_y_ticks": None,
-                }
-            elif o == "legend":
-                self.global_options[o] = {
-                    "render_legend": False,
-                    "legend_title": "",
-                    "legend_font_name": "sans-serif",
-                    "legend_font_style": "normal",
-                    "legend_font_size": 10,
-                    "legend_font_weight": "normal",
-                    "legend_marker_scale": 1.0,
-                    "legend_location": 2,
-                    "legend_bbox_to_anchor": (1.05, 1.0),
-                    "legend_border_axes_pad": 1.0,
-                    "legend_n_columns": 1,
-                    "legend_horizontal_spacing": 1.0,
-                    "legend_vertical_spacing": 1.0,
-                    "legend_border": True,
-                    "legend_border_padding": 0.5,
-                    "legend_shadow": False,
-                    "legend_rounded_corners": False,
-                }
-            elif o == "grid":
-                self.global_options[o] = {
-                    "render_grid": False,
-                    "grid_line_style": "--",
-                    "grid_line_width": 0.5,
-                }
+        self.global_options = renderer_global_options(
+            self.options_tabs, axes_x_limits, axes_y_limits
+        )
 
     def get_default_options(self, labels):
         r"""
@@ -2102,51 +2054,9 @@ class RendererOptionsWidget(MenpoWidget):
         key = self.get_key(labels)
         # if the key does not exist in the default options dict, then add it
         if key not in self.default_options:
-            self.default_options[key] = {}
-            if "lines_matplotlib" in self.options_tabs:
-                lc = ["red"]
-                if labels is not None:
-                    lc = sample_colours_from_colourmap(len(labels), "jet")
-                self.default_options[key]["lines_matplotlib"] = {
-                    "render_lines": True,
-                    "line_width": 1,
-                    "line_colour": lc,
-                    "line_style": "-",
-                }
-            if "lines_mayavi" in self.options_tabs:
-                lc = ["red"]
-                if labels is not None:
-                    lc = sample_colours_from_colourmap(len(labels), "jet")
-                self.default_options[key]["lines_mayavi"] = {
-                    "render_lines": True,
-                    "line_width": 4.0,
-                    "line_colour": lc,
-                }
-            if "markers_matplotlib" in self.options_tabs:
-                fc = ["red"]
-                ec = ["black"]
-                if labels is not None and len(labels) > 1:
-                    fc = sample_colours_from_colourmap(len(labels), "jet")
-                    ec = sample_colours_from_colourmap(len(labels), "jet")
-                self.default_options[key]["markers_matplotlib"] = {
-                    "render_markers": True,
-                    "marker_size": 5,
-                    "marker_face_colour": fc,
-                    "marker_edge_colour": ec,
-                    "marker_style": "o",
-                    "marker_edge_width": 1,
-                }
-            if "markers_mayavi" in self.options_tabs:
-                mc = ["red"]
-                if labels is not None and len(labels) > 1:
-                    mc = sample_colours_from_colourmap(len(labels), "jet")
-                self.default_options[key]["markers_mayavi"] = {
-                    "marker_colour": mc,
-                    "render_markers": True,
-                    "marker_size": 0.1,
-                    "marker_style": "sphere",
-                    "marker_resolution": 8,
-                }
+            self.default_options[key] = renderer_labels_options(
+                self.options_tabs, labels
+            )
         return self.default_options[key]
 
     def predefined_style(self, style):
@@ -2336,6 +2246,15 @@ class ImageOptionsWidget(MenpoWidget):
             ``''``        No style
             ============= ============================
 
+    reduction_views : `bool`, optional
+        If ``True``, then multi-channel images can also be viewed as the sum of
+        the selected channels or as the projection of the channels on their
+        first three principal components in RGB (see
+        `menpowidgets.reductions.reduced_image`), which get selected with the
+        ``channels_view`` key of the selected values. The render function
+        must accept ``channels_view``, as `menpowidgets.utils.render_image`
+        does.
+
     Example
     -------
     Let's create an image options widget and then update its state. Firstly,
@@ -2373,13 +2292,21 @@ class ImageOptionsWidget(MenpoWidget):
 
     """
 
-    def __init__(self, n_channels, image_is_masked, render_function=None, style=""):
+    def __init__(
+        self,
+        n_channels,
+        image_is_masked,
+        render_function=None,
+        style="",
+        reduction_views=False,
+    ):
         # Initialise default options dictionary
         self.default_options = {}
 
         # Assign properties
         self.n_channels = None
         self.image_is_masked = None
+        self.reduction_views = reduction_views
 
         # Create children
         slice_options = {"command": "0", "length": n_channels}
@@ -2421,8 +2348,25 @@ class ImageOptionsWidget(MenpoWidget):
         )
         self.cmap_title = ipywidgets.HTML(value="Colour map")
         self._add_cmap_select()  # Adds self.cmap_select
+        self.channels_view_title = ipywidgets.HTML(value="View")
+        channels_view_dict = OrderedDict()
+        channels_view_dict["Channels"] = "channels"
+        channels_view_dict["Sum"] = "sum"
+        channels_view_dict["PCA-RGB"] = "pca"
+        self.channels_view_dropdown = ipywidgets.Dropdown(
+            options=channels_view_dict,
+            value="channels",
+            layout=ipywidgets.Layout(width="3cm"),
+        )
+        self.channels_view_dropdown.observe(
+            self._save_options, names="value", type="change"
+        )
 
         # Group widgets
+        self.box_1 = ipywidgets.HBox(
+            [self.channels_view_title, self.channels_view_dropdown]
+        )
+        self.box_1.layout.align_items = "center"
         self.box_2 = ipywidgets.HBox([self.cmap_title, self.cmap_select])
         self.box_2.layout.align_items = "center"
         self.box_3 = ipywidgets.HBox(
@@ -2433,7 +2377,7 @@ class ImageOptionsWidget(MenpoWidget):
             [self.interpolation_checkbox, self.masked_checkbox, self.rgb_checkbox]
         )
         self.box_5.layout.margin = "0px 10px 0px 0px"
-        self.box_6 = ipywidgets.VBox([self.box_2, self.box_3])
+        self.box_6 = ipywidgets.VBox([self.box_1, self.box_2, self.box_3])
         self.box_6.layout.align_items = "flex-end"
         self.channels_wid.layout.margin = "0px 10px 0px 0px"
         self.container = ipywidgets.HBox([self.channels_wid, self.box_5, self.box_6])
@@ -2539,6 +2483,9 @@ class ImageOptionsWidget(MenpoWidget):
         )
         self.cmap_select.observe(self._save_options, names="value", type="change")
         self.alpha_slider.observe(self._save_options, names="value", type="change")
+        self.channels_view_dropdown.observe(
+            self._save_options, names="value", type="change"
+        )
 
     def remove_callbacks(self):
         r"""
@@ -2558,6 +2505,9 @@ class ImageOptionsWidget(MenpoWidget):
         )
         self.cmap_select.unobserve(self._save_options, names="value", type="change")
         self.alpha_slider.unobserve(self._save_options, names="value", type="change")
+        self.channels_view_dropdown.unobserve(
+            self._save_options, names="value", type="change"
+        )
 
     def _save_options(self, change):
         # get channels value
@@ -2569,13 +2519,16 @@ class ImageOptionsWidget(MenpoWidget):
             "bilinear" if self.interpolation_checkbox.selected_values else "none"
         )
         # update selected values
-        self.selected_values = {
+        selected_values = {
             "channels": channels_val,
             "masked_enabled": self.masked_checkbox.selected_values,
             "alpha": self.alpha_slider.value,
             "cmap_name": self.cmap_select.value,
             "interpolation": interpolation,
         }
+        if self.reduction_views:
+            selected_values["channels_view"] = self.channels_view_dropdown.value
+        self.selected_values = selected_values
         # update default values
         current_key = self.get_key(self.n_channels, self.image_is_masked)
         self.default_options[current_key] = self.selected_values
@@ -2615,6 +2568,9 @@ class ImageOptionsWidget(MenpoWidget):
         self.channels_wid.layout.display = "flex" if self.n_channels > 1 else "none"
         self.rgb_checkbox.layout.display = "flex" if self.n_channels == 3 else "none"
         self.masked_checkbox.layout.display = "flex" if self.image_is_masked else "none"
+        self.box_1.layout.display = (
+            "flex" if self.reduction_views and self.n_channels > 1 else "none"
+        )
 
     def get_key(self, n_channels, image_is_masked):
         r"""
@@ -2660,20 +2616,9 @@ class ImageOptionsWidget(MenpoWidget):
         key = self.get_key(n_channels, image_is_masked)
         # if the key does not exist in the default options dict, then add it
         if key not in self.default_options:
-            # if image has 3 channels, visualise it as RGB, else render only the
-            # first channel
-            channels = None if n_channels == 3 else [0]
-            # if image is masked, render it as masked
-            masked_enabled = image_is_masked
-            # update default options dictionary
-            self.default_options[key] = {
-                "channels": channels,
-                "sum_enabled": False,
-                "masked_enabled": masked_enabled,
-                "alpha": 1.0,
-                "interpolation": "bilinear",
-                "cmap_name": None,
-            }
+            self.default_options[key] = image_default_options(
+                n_channels, image_is_masked
+            )
         return self.default_options[key]
 
     def _parse_channels_value(self, channels):
@@ -2681,6 +2626,13 @@ class ImageOptionsWidget(MenpoWidget):
             return "0, 1, 2"
         elif isinstance(channels, list):
             return str(channels).strip("[]")
+        elif isinstance(channels, range):
+            # the stop of a decreasing range that includes the first channel is
+            # negative, which is written as an index before the first channel
+            stop = channels.stop
+            if stop < 0:
+                stop = -self.n_channels - 1
+            return "{}:{}:{}".format(channels.start, stop, channels.step)
         else:
             return str(channels)
 
@@ -2760,6 +2712,8 @@ class ImageOptionsWidget(MenpoWidget):
             )
             self.alpha_slider.value = channel_options["alpha"]
             self.cmap_select.value = channel_options["cmap_name"]
+            if self.reduction_views:
+                self.channels_view_dropdown.value = channel_options["channels_view"]
 
             # Set widget's visibility
             self.set_visibility()
@@ -3089,27 +3043,9 @@ class LandmarkOptionsWidget(MenpoWidget):
         key = self.get_key(group_keys, labels_keys)
         # if the key does not exist in the default options dict, then add it
         if key not in self.default_options:
-            if group_keys is None:
-                self.default_options[key] = {
-                    "landmarks": {
-                        "group": None,
-                        "with_labels": None,
-                        "render_landmarks": False,
-                    }
-                }
-            else:
-                self.default_options[key] = {
-                    "landmarks": {
-                        "group": group_keys[0],
-                        "with_labels": labels_keys[0],
-                        "render_landmarks": True,
-                    }
-                }
-                tmp = self.shape_options_wid.get_default_options(labels_keys)
-                self.default_options[key]["lines"] = tmp["lines"]
-                self.default_options[key]["markers"] = tmp["markers"]
-                if self.type == "2D":
-                    self.default_options[key]["image_view"] = tmp["image_view"]
+            self.default_options[key] = landmark_default_options(
+                group_keys, labels_keys, type=self.type
+            )
         return self.default_options[key]
 
     def _parse_group_keys_labels_keys(self, group_keys, labels_keys):
@@ -3353,6 +3289,35 @@ class SaveMatplotlibFigureOptionsWidget(ipywidgets.Box):
         The initial value of the figure padding in inches.
     overwrite : `bool`, optional
         The initial value of the overwrite flag.
+    n_items : `int` or ``None``, optional
+        The number of objects that can be browsed in the widget that renders
+        the figure. It is only required if `export_jobs_function` is provided.
+    export_jobs_function : `callable` or ``None``, optional
+        If not ``None``, then a ``Batch`` tab allows to export the figures of
+        all the objects, or of a range of them, with the current options. It
+        is called once per export with the `list` of the selected indices and
+        it must return an iterable with a ``(render_function, kwargs)`` job per
+        index, which is passed to :func:`menpowidgets.workers.save_figure_job`.
+        The options must be snapshotted when it gets called. The jobs are
+        rendered in parallel by a pool of processes and each figure is saved
+        to the selected path with the zero-padded index appended to the file
+        name, e.g. ``Untitled_0042.png``. A job can also be a
+        ``(render_function, kwargs, cache_key)`` triplet, where ``cache_key``
+        is the ``(path, options)`` of the object in `render_cache`, or
+        ``None``.
+    n_workers : `int` or ``None``, optional
+        The number of processes that render the exported figures. If ``None``,
+        then the number of CPUs is used.
+    render_cache : `menpowidgets.cache.RenderCache` or ``None``, optional
+        If not ``None``, then the exported files of the jobs that have a cache
+        key are read from and stored to the persistent cache, along with the
+        save options, so that exporting again after a kernel restart only
+        copies them.
+    renderer_function : `callable` or ``None``, optional
+        If not ``None``, then it is called without arguments when saving and
+        it must return the renderer of the saved figure, which is used instead
+        of `renderer`. It allows to render the figure on demand, e.g. when the
+        widget shows frames that are rendered out of process.
     style : `str` (see below), optional
         Sets a predefined style at the widget. Possible options are:
 
@@ -3379,11 +3344,15 @@ class SaveMatplotlibFigureOptionsWidget(ipywidgets.Box):
         edge_colour="white",
         pad_inches=0.0,
         overwrite=False,
+        n_items=None,
+        export_jobs_function=None,
+        n_workers=None,
+        render_cache=None,
+        renderer_function=None,
         style="",
     ):
         from os import getcwd
         from os.path import join, splitext
-        from pathlib import Path
 
         # Create widgets
         self.file_format_title = ipywidgets.HTML(value="Format")
@@ -3514,8 +3483,64 @@ class SaveMatplotlibFigureOptionsWidget(ipywidgets.Box):
         self.box_9.layout.margin = "0px 10px 0px 0px"
         self.box_99 = ipywidgets.HBox([self.box_9, self.transparent_checkbox])
         self.box_99.layout.align_items = "center"
-        self.box_10 = ipywidgets.Tab([self.box_7, self.box_88, self.box_99])
+        tab_children = [self.box_7, self.box_88, self.box_99]
         tab_titles = ["Path", "Page setup", "Colour"]
+        self.export_jobs_function = export_jobs_function
+        self.n_items = n_items
+        self.n_workers = n_workers
+        self.render_cache = render_cache
+        self.please_cancel = False
+        if export_jobs_function is not None:
+            from IPython import get_ipython
+
+            # Get the kernel to use it later in order to make sure that the
+            # cancel button gets processed during the export loop
+            self.kernel = get_ipython().kernel
+
+            self.export_range_title = ipywidgets.HTML(value="Range")
+            self.export_range_slider = ipywidgets.IntRangeSlider(
+                min=0,
+                max=max(n_items - 1, 0),
+                value=(0, max(n_items - 1, 0)),
+                description="",
+                continuous_update=False,
+                layout=ipywidgets.Layout(width="6cm"),
+            )
+            self.export_all_button = ipywidgets.Button(
+                description="  Export all",
+                icon="files-o",
+                layout=ipywidgets.Layout(width="3cm"),
+            )
+            self.export_range_button = ipywidgets.Button(
+                description="  Export range",
+                icon="files-o",
+                layout=ipywidgets.Layout(width="3cm"),
+            )
+            self.cancel_button = ipywidgets.Button(
+                description="  Cancel",
+                icon="stop",
+                disabled=True,
+                layout=ipywidgets.Layout(width="2.5cm"),
+            )
+            self.export_progress = ipywidgets.IntProgress(
+                min=0, max=max(n_items, 1), value=0, description=""
+            )
+            self.export_status = ipywidgets.HTML(value="")
+            self.box_13 = ipywidgets.HBox(
+                [self.export_range_title, self.export_range_slider]
+            )
+            self.box_13.layout.align_items = "center"
+            self.box_14 = ipywidgets.HBox(
+                [self.export_all_button, self.export_range_button, self.cancel_button]
+            )
+            self.box_14.layout.align_items = "center"
+            self.box_15 = ipywidgets.HBox([self.export_progress, self.export_status])
+            self.box_15.layout.align_items = "center"
+            self.box_16 = ipywidgets.VBox([self.box_13, self.box_14, self.box_15])
+            self.box_16.layout.align_items = "flex-start"
+            tab_children.append(self.box_16)
+            tab_titles.append("Batch")
+        self.box_10 = ipywidgets.Tab(tab_children)
         for k, tl in enumerate(tab_titles):
             self.box_10.set_title(k, tl)
         self.box_11 = ipywidgets.VBox([self.box_10])
@@ -3537,6 +3562,7 @@ class SaveMatplotlibFigureOptionsWidget(ipywidgets.Box):
                 figure_id=None, new_figure=True, image=np.zeros((10, 10))
             )
         self.renderer = renderer
+        self.renderer_function = renderer_function
 
         # Set style
         self.predefined_style(style)
@@ -3555,22 +3581,12 @@ class SaveMatplotlibFigureOptionsWidget(ipywidgets.Box):
             self.save_button.disabled = True
 
             # save figure
-            selected_dpi = self.dpi_text.value
-            if self.dpi_text.value == 0:
-                selected_dpi = None
             try:
-                file_extension = Path(self.filename_text.value).suffix[1:]
-                self.renderer.save_figure(
-                    filename=self.filename_text.value,
-                    format=str(file_extension),
-                    dpi=selected_dpi,
-                    face_colour=self.facecolour_widget.selected_values[0],
-                    edge_colour=self.edgecolour_widget.selected_values[0],
-                    orientation=self.orientation_dropdown.value,
-                    paper_type=self.papertype_select.value,
-                    transparent=self.transparent_checkbox.selected_values,
-                    pad_inches=self.pad_inches_text.value,
-                    overwrite=self.overwrite_checkbox.selected_values,
+                renderer = self.renderer
+                if self.renderer_function is not None:
+                    renderer = self.renderer_function()
+                renderer.save_figure(
+                    filename=self.filename_text.value, **self.save_figure_kwargs()
                 )
                 self.error_latex.value = ""
             except ValueError as e:
@@ -3597,6 +3613,192 @@ class SaveMatplotlibFigureOptionsWidget(ipywidgets.Box):
 
         self.save_button.on_click(save_function)
 
+        if export_jobs_function is not None:
+
+            def export_function(button):
+                if button is self.export_all_button:
+                    start, end = 0, self.n_items - 1
+                else:
+                    start, end = self.export_range_slider.value
+                self.export_items(list(range(start, end + 1)))
+
+            self.export_all_button.on_click(export_function)
+            self.export_range_button.on_click(export_function)
+
+            def cancel_function(name):
+                self.please_cancel = True
+
+            self.cancel_button.on_click(cancel_function)
+
+    def save_figure_kwargs(self):
+        r"""
+        Method that returns the selected options of ``save_figure()``, apart
+        from the filename. The format is defined by the extension of the
+        selected path.
+
+        Returns
+        -------
+        save_kwargs : `dict`
+            The options.
+        """
+        from pathlib import Path
+
+        selected_dpi = self.dpi_text.value
+        if self.dpi_text.value == 0:
+            selected_dpi = None
+        return {
+            "format": str(Path(self.filename_text.value).suffix[1:]),
+            "dpi": selected_dpi,
+            "face_colour": self.facecolour_widget.selected_values[0],
+            "edge_colour": self.edgecolour_widget.selected_values[0],
+            "orientation": self.orientation_dropdown.value,
+            "paper_type": self.papertype_select.value,
+            "transparent": self.transparent_checkbox.selected_values,
+            "pad_inches": self.pad_inches_text.value,
+            "overwrite": self.overwrite_checkbox.selected_values,
+        }
+
+    def export_items(self, indices):
+        r"""
+        Method that renders and saves the figures of the objects with the
+        provided indices in parallel, using the jobs returned by
+        `export_jobs_function`. At most two jobs per worker are submitted at
+        a time, so that the objects of large lists are not all pickled at
+        once. The files that are found in `render_cache` are copied instead
+        of rendered. The progress is shown in the ``Batch`` tab and the kernel keeps
+        processing widget messages, so that the export can be cancelled.
+
+        Parameters
+        ----------
+        indices : `list` of `int`
+            The indices of the objects to export.
+
+        Returns
+        -------
+        n_saved : `int`
+            The number of saved figures.
+        errors : `list` of `Exception`
+            The errors of the figures that failed.
+        """
+        import multiprocessing
+        import os
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+        from pathlib import Path
+
+        # Snapshot the save options and the jobs' options
+        save_kwargs = self.save_figure_kwargs()
+        # The options that define the content of the saved files
+        file_kwargs = {k: v for k, v in save_kwargs.items() if k != "overwrite"}
+        path = Path(self.filename_text.value)
+        n_digits = len(str(max(self.n_items - 1, 0)))
+        jobs = zip(indices, self.export_jobs_function(indices))
+
+        # Set buttons and progress state
+        self.please_cancel = False
+        self.export_all_button.disabled = True
+        self.export_range_button.disabled = True
+        self.cancel_button.disabled = False
+        self.export_progress.max = max(len(indices), 1)
+        self.export_progress.value = 0
+        self.export_status.value = "0 / {}".format(len(indices))
+
+        n_workers = self.n_workers or os.cpu_count() or 1
+        n_workers = max(min(n_workers, len(indices)), 1)
+        n_saved = 0
+        errors = []
+        pending = set()
+        # The cache entries of the pending jobs
+        cache_keys = dict()
+        jobs_left = True
+        # Spawn the workers, since forking a kernel with running threads is
+        # not safe
+        executor = ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_export_worker,
+        )
+        try:
+            while True:
+                while (
+                    jobs_left
+                    and not self.please_cancel
+                    and len(pending) < 2 * n_workers
+                ):
+                    try:
+                        i, job = next(jobs)
+                    except StopIteration:
+                        jobs_left = False
+                        break
+                    filename = path.with_name(
+                        "{}_{:0{}d}{}".format(path.stem, i, n_digits, path.suffix)
+                    )
+                    cache_key = None
+                    if self.render_cache is not None and len(job) > 2:
+                        cache_key = job[2]
+                    if cache_key is not None:
+                        cache_key = (
+                            cache_key[0],
+                            ("export", cache_key[1], file_kwargs),
+                        )
+                        data = self.render_cache.get(*cache_key)
+                        if data is not None:
+                            try:
+                                write_cached_figure(
+                                    data, filename, save_kwargs["overwrite"]
+                                )
+                                n_saved += 1
+                            except Exception as e:
+                                errors.append(e)
+                            continue
+                    future = executor.submit(
+                        save_figure_job, job[0], job[1], str(filename), save_kwargs
+                    )
+                    pending.add(future)
+                    if cache_key is not None:
+                        cache_keys[future] = cache_key
+                if len(pending) == 0:
+                    break
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for f in done:
+                    if f.cancelled():
+                        continue
+                    cache_key = cache_keys.pop(f, None)
+                    if f.exception() is not None:
+                        errors.append(f.exception())
+                    else:
+                        n_saved += 1
+                        if cache_key is not None:
+                            self.render_cache.put(
+                                *cache_key, data=Path(f.result()).read_bytes()
+                            )
+                self.export_progress.value = n_saved + len(errors)
+                self.export_status.value = "{} / {}".format(
+                    n_saved + len(errors), len(indices)
+                )
+                # Run IPython iteration, so that the cancel button is processed
+                do_one_iteration(self.kernel)
+                if self.please_cancel:
+                    for f in pending:
+                        f.cancel()
+        finally:
+            executor.shutdown(wait=True)
+
+        # Report
+        self.export_progress.value = n_saved + len(errors)
+        status = "{} of {} saved".format(n_saved, len(indices))
+        if self.please_cancel:
+            status += " (cancelled)"
+        if len(errors) > 0:
+            status += (
+                '<p style="color:#FF0000";><font size="2"><em>'
+                "{} failed: {}</em></font size></p>".format(len(errors), errors[0])
+            )
+        self.export_status.value = status
+        self.export_all_button.disabled = False
+        self.export_range_button.disabled = False
+        self.cancel_button.disabled = True
+        return n_saved, errors
+
     def predefined_style(self, style):
         r"""
         Function that sets a predefined style on the widget.
@@ -3619,6 +3821,10 @@ class SaveMatplotlibFigureOptionsWidget(ipywidgets.Box):
         self.container.box_style = style
         self.container.border = "0px"
         self.save_button.button_style = "primary"
+        if self.export_jobs_function is not None:
+            self.export_all_button.button_style = "primary"
+            self.export_range_button.button_style = "primary"
+            self.cancel_button.button_style = "danger"
 
 
 class SaveMayaviFigureOptionsWidget(ipywidgets.Box):
@@ -3647,6 +3853,11 @@ class SaveMayaviFigureOptionsWidget(ipywidgets.Box):
         then the magnification will be set automatically.
     overwrite : `bool`, optional
         The initial value of the overwrite flag.
+    export_render_function : `callable` or ``None``, optional
+        If not ``None``, it is called with ``True`` before saving the figure and
+        with ``False`` after it. This allows to save a different rendering
+        than the displayed one, e.g. the full resolution version of a
+        decimated mesh.
     style : `str` (see below), optional
         Sets a predefined style at the widget. Possible options are:
 
@@ -3668,6 +3879,7 @@ class SaveMayaviFigureOptionsWidget(ipywidgets.Box):
         size=None,
         magnification="auto",
         overwrite=False,
+        export_render_function=None,
         style="",
     ):
         from os import getcwd
@@ -3757,6 +3969,7 @@ class SaveMayaviFigureOptionsWidget(ipywidgets.Box):
 
             renderer = MayaviRenderer(figure_id=None, new_figure=True)
         self.renderer = renderer
+        self.export_render_function = export_render_function
 
         # Set style
         self.predefined_style(style)
@@ -3793,13 +4006,19 @@ class SaveMayaviFigureOptionsWidget(ipywidgets.Box):
                 selected_magn = float(self.magn_text.value)
             try:
                 file_extension = Path(self.filename_text.value).suffix[1:]
-                self.renderer.save_figure(
-                    filename=self.filename_text.value,
-                    format=file_extension,
-                    size=selected_size,
-                    magnification=selected_magn,
-                    overwrite=self.overwrite_checkbox.selected_values,
-                )
+                if self.export_render_function is not None:
+                    self.export_render_function(True)
+                try:
+                    self.renderer.save_figure(
+                        filename=self.filename_text.value,
+                        format=file_extension,
+                        size=selected_size,
+                        magnification=selected_magn,
+                        overwrite=self.overwrite_checkbox.selected_values,
+                    )
+                finally:
+                    if self.export_render_function is not None:
+                        self.export_render_function(False)
                 self.error_latex.value = ""
             except ValueError as e:
                 e = str(e)
@@ -4941,6 +5160,14 @@ class LinearModelParametersWidget(MenpoWidget):
         If ``True``, then the render function is called while moving a
         slider's handle. If ``False``, then the the function is called only
         when the handle (mouse click) is released.
+    record_frame_function : `callable` or ``None``, optional
+        Function with signature ``record_frame_function()`` that returns the
+        currently rendered frame as an ``(height, width, 3)`` `uint8` array.
+        If not ``None``, then a record button is added that sweeps the
+        parameters and writes the frames to a video file (see
+        :meth:`record_animation`).
+    record_fps : `int`, optional
+        The frame rate of the recorded videos.
 
     Example
     -------
@@ -4994,7 +5221,11 @@ class LinearModelParametersWidget(MenpoWidget):
         animation_step=0.5,
         style="",
         continuous_update=False,
+        record_frame_function=None,
+        record_fps=10,
     ):
+        from os import getcwd
+        from os.path import join
         from time import sleep
         from IPython import get_ipython
 
@@ -5101,6 +5332,23 @@ class LinearModelParametersWidget(MenpoWidget):
         self.buttons_box = ipywidgets.HBox(
             [self.animation_buttons, self.plot_and_reset]
         )
+        if record_frame_function is not None:
+            self.record_button = ipywidgets.Button(
+                icon="circle",
+                description="",
+                tooltip="Record animation to video",
+                layout=ipywidgets.Layout(width="40px"),
+            )
+            self.record_filename_text = ipywidgets.Text(
+                value=join(getcwd(), "animation.mp4"),
+                description="",
+                layout=ipywidgets.Layout(width="10cm"),
+            )
+            self.record_box = ipywidgets.HBox(
+                [self.record_button, self.record_filename_text]
+            )
+            self.record_box.layout.margin = "0px 0px 0px 15px"
+            self.buttons_box.children = self.buttons_box.children + (self.record_box,)
         self.container = ipywidgets.VBox([self.parameters_wid, self.buttons_box])
 
         # Create final widget
@@ -5125,6 +5373,8 @@ class LinearModelParametersWidget(MenpoWidget):
         self.animation_step = animation_step
         self.animation_visible = animation_visible
         self.please_stop = False
+        self.record_frame_function = record_frame_function
+        self.record_fps = record_fps
 
         # Set style
         self.predefined_style(style)
@@ -5390,6 +5640,18 @@ class LinearModelParametersWidget(MenpoWidget):
 
         self.stop_button.on_click(stop_pressed)
 
+        if record_frame_function is not None:
+
+            def record_pressed(_):
+                self.record_button.disabled = True
+                try:
+                    filename = self.record_animation(self.record_filename_text.value)
+                    self.record_filename_text.value = filename
+                finally:
+                    self.record_button.disabled = False
+
+            self.record_button.on_click(record_pressed)
+
         # Set plot variance function
         self._variance_function = None
         self.add_variance_function(plot_variance_function)
@@ -5400,6 +5662,74 @@ class LinearModelParametersWidget(MenpoWidget):
         current_parameters[i] = change["new"]
         self.selected_values = current_parameters
 
+    def _set_parameter(self, p, value):
+        if self.mode == "multiple":
+            self.sliders[p].value = value
+        else:
+            self.parameters_wid.children[0].value = p
+            self.parameters_wid.children[1].value = value
+
+    def record_animation(self, filename):
+        r"""
+        Method that sweeps each parameter from ``0`` to the minimum, then to the
+        maximum and back to ``0`` (as the play button does) and records the
+        rendered frames to a video file. The frames are grabbed with
+        ``record_frame_function`` after each render and streamed to the file one
+        at a time at a fixed frame rate of ``record_fps``, regardless of how
+        long each render took. Pressing the stop button ends the recording
+        early.
+
+        Parameters
+        ----------
+        filename : `str`
+            The video file path. If ``ffmpeg`` is not available, then the video
+            is written as GIF and the suffix is replaced with ``.gif``.
+
+        Returns
+        -------
+        filename : `str`
+            The path of the written video file.
+        """
+        if self.record_frame_function is None:
+            raise ValueError("record_frame_function was not provided")
+        self.reset_button.click()
+        self.please_stop = False
+        self.reset_button.disabled = True
+        self.plot_button.disabled = True
+        writer = VideoWriter(filename, fps=self.record_fps)
+        try:
+            writer.write(self.record_frame_function())
+            for p in range(self.n_parameters):
+                # same value sequence as the animation: 0 -> min -> max -> 0
+                values = []
+                val = 0.0
+                while val > self.params_bounds[0]:
+                    val -= self.animation_step
+                    values.append(val)
+                val = self.params_bounds[0]
+                while val < self.params_bounds[1]:
+                    val += self.animation_step
+                    values.append(val)
+                val = self.params_bounds[1]
+                while val > 0.0:
+                    val -= self.animation_step
+                    values.append(val)
+                values.append(0.0)
+                for val in values:
+                    do_one_iteration(self.kernel)
+                    if self.please_stop:
+                        break
+                    self._set_parameter(p, val)
+                    writer.write(self.record_frame_function())
+                if self.please_stop:
+                    self._set_parameter(p, 0.0)
+                    break
+        finally:
+            writer.close()
+            self.reset_button.disabled = False
+            self.plot_button.disabled = False
+        return writer.filename
+
     def predefined_style(self, style):
         r"""
         Function that sets a predefined style on the widget.
@@ -5428,6 +5758,8 @@ class LinearModelParametersWidget(MenpoWidget):
         self.loop_toggle.button_style = "warning"
         self.reset_button.button_style = "danger"
         self.plot_button.button_style = "primary"
+        if self.record_frame_function is not None:
+            self.record_button.button_style = "danger"
 
     def stop_animation(self):
         r"""
@@ -6638,8 +6970,9 @@ class IterativeResultOptionsWidget(MenpoWidget):
                 # The mode is 'Animation'
                 iters = self.index_animation.selected_values
             else:
-                # The mode is 'Static'
-                iters = self.index_slicing.selected_values
+                # The mode is 'Static'. The iterations are few and
+                # view_iterations() requires a list.
+                iters = list(self.index_slicing.selected_values)
             # Get selected values
             self.selected_values = {
                 "iters": iters,
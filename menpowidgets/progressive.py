@@ -0,0 +1,133 @@
+r"""
+Draft renders while the values of the widgets keep changing.
+"""
+
+from .utils import _running_loop
+
+# The view options of the draft renders, which are shown while a value keeps
+# changing
+DRAFT_VIEW_OPTIONS = {
+    "render_numbering": False,
+    "render_legend": False,
+    "interpolation": "nearest",
+}
+# The resolution scale and JPEG quality of the draft frames
+DRAFT_DPI_SCALE = 0.5
+DRAFT_JPEG_QUALITY = 75
+
+
+def draft_view_options(options):
+    r"""
+    Function that returns the draft version of the options of a ``view()``
+    method, i.e. with `DRAFT_VIEW_OPTIONS` applied to the options that it
+    has.
+
+    Parameters
+    ----------
+    options : `dict`
+        The options.
+
+    Returns
+    -------
+    options : `dict`
+        The draft options.
+    """
+    options = dict(options)
+    for key, value in DRAFT_VIEW_OPTIONS.items():
+        if key in options:
+            options[key] = value
+    return options
+
+
+def figure_to_jpeg(figure, dpi_scale=DRAFT_DPI_SCALE, quality=DRAFT_JPEG_QUALITY):
+    r"""
+    Function that encodes a Matplotlib figure as a reduced resolution JPEG,
+    which is faster to rasterize and transfer than a PNG of the figure.
+
+    Parameters
+    ----------
+    figure : `matplotlib.figure.Figure`
+        The figure.
+    dpi_scale : `float`, optional
+        The scale of the resolution of the figure.
+    quality : `int`, optional
+        The JPEG quality, from ``1`` to ``95``.
+
+    Returns
+    -------
+    jpeg : `bytes`
+        The encoded figure.
+    """
+    from io import BytesIO
+
+    buffer = BytesIO()
+    figure.savefig(
+        buffer,
+        format="jpeg",
+        dpi=figure.dpi * dpi_scale,
+        pil_kwargs={"quality": quality},
+    )
+    return buffer.getvalue()
+
+
+class ProgressiveRender(object):
+    r"""
+    Class that wraps a render function, so that it renders drafts while a
+    value keeps changing and a single full quality render once the value has
+    been idle for `settle_interval` seconds. It is passed as the render
+    function of the widgets whose values change continuously, e.g. the
+    sliders of `menpowidgets.options.LinearModelParametersWidget` or
+    `menpowidgets.tools.IndexSliderWidget`, and the render function reads
+    :attr:`draft` to select the quality.
+
+    The full quality render is scheduled on the event loop of the kernel. If
+    there is no running loop, e.g. outside of a kernel, or `settle_interval`
+    is ``None``, then every render is a full quality one.
+
+    Parameters
+    ----------
+    render_function : `callable`
+        The render function. On settle, it is called again with the last
+        change.
+    settle_interval : `float` or ``None``, optional
+        The idle time in seconds after which the full quality render happens.
+    """
+
+    def __init__(self, render_function, settle_interval=0.3):
+        self.render_function = render_function
+        self.settle_interval = settle_interval
+        self.draft = False
+        self._change = None
+        self._handle = None
+
+    def __call__(self, change):
+        self.cancel()
+        loop = _running_loop() if self.settle_interval is not None else None
+        if loop is None:
+            self.render_function(change)
+            return
+        self._change = change
+        self._handle = loop.call_later(self.settle_interval, self.settle)
+        self.draft = True
+        try:
+            self.render_function(change)
+        finally:
+            self.draft = False
+
+    def cancel(self):
+        r"""
+        Method that cancels the pending full quality render, e.g. because a
+        full quality render has been triggered by another widget.
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def settle(self):
+        r"""
+        Method that renders at full quality, if a draft is shown.
+        """
+        if self._handle is None:
+            return
+        self.cancel()
+        self.render_function(self._change)
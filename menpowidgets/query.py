@@ -0,0 +1,386 @@
+r"""
+Index of the metadata of images that is filtered with queries.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from .utils import extract_groups_labels_from_image, is_masked_image
+
+
+def _image_metadata(image):
+    groups_keys, labels_keys = extract_groups_labels_from_image(image)
+    n_points = None
+    if groups_keys is not None:
+        n_points = [image.landmarks[g].n_points for g in groups_keys]
+    return (
+        getattr(image, "path", None),
+        image.shape,
+        image.n_channels,
+        is_masked_image(image),
+        groups_keys,
+        labels_keys,
+        n_points,
+    )
+
+
+class ImageIndex(object):
+    r"""
+    Class that indexes the metadata of a `list` of images in columnar arrays,
+    so that the images can be filtered without visiting them again. The
+    metadata are extracted once, in a pool of threads, thus a lazy `list` of
+    images (e.g. `menpo.base.LazyList`) is loaded in parallel.
+
+    The images are filtered with :meth:`query`, which evaluates an expression
+    over the columns, e.g. ``n_channels == 1``, ``not has('PTS')`` or
+    ``n_points('PTS') != 68 and width > 500``. The expressions support the
+    comparison, arithmetic, ``and``/``or``/``not`` (as well as ``&``/``|``/``~``)
+    operators, the columns:
+
+        ============== =================================================
+        Column         Description
+        ============== =================================================
+        ``index``      The index of the image in the `list`
+        ``path``       The path of the image as `str` (``''`` if none)
+        ``height``     The height of the image
+        ``width``      The width of the image
+        ``n_channels`` The number of channels of the image
+        ``masked``     Whether the image is a `menpo.image.MaskedImage`
+        ``n_groups``   The number of landmark groups of the image
+        ============== =================================================
+
+    and the functions:
+
+        ============================= =========================================
+        Function                      Description
+        ============================= =========================================
+        ``has(group)``                Whether the image has a landmark group
+        ``n_points(group)``           The number of points of a landmark group
+                                      (``-1`` if the image does not have it)
+        ``has_label(group, label)``   Whether a landmark group has a label
+        ``matches(pattern)``          Whether the path matches a shell pattern,
+                                      e.g. ``'*.jpg'``
+        ============================= =========================================
+
+    The images are indexed in the background if `background` is ``True``.
+    Until the indexing finishes, :meth:`query` only matches the images that
+    are already indexed (see :attr:`indexed`). If `lazy` is ``True``, then the
+    indexing starts on the first non-empty query (or :meth:`start`), thus the
+    images are not loaded unless they get filtered.
+
+    Parameters
+    ----------
+    images : `list` of `menpo.image.Image` or subclass
+        The images.
+    n_workers : `int` or ``None``, optional
+        The number of threads that extract the metadata. If ``None``, then the
+        default of `concurrent.futures.ThreadPoolExecutor` is used.
+    background : `bool`, optional
+        If ``False``, then starting the indexing waits for it to finish.
+    lazy : `bool`, optional
+        If ``False``, then the indexing starts in the constructor.
+    """
+
+    def __init__(self, images, n_workers=None, background=False, lazy=False):
+        import threading
+
+        self.images = images
+        self.n_workers = n_workers
+        self.background = background
+        self.n_images = len(images)
+        self.paths = np.full(self.n_images, "", dtype=object)
+        self.heights = np.zeros(self.n_images, dtype=int)
+        self.widths = np.zeros(self.n_images, dtype=int)
+        self.n_channels = np.zeros(self.n_images, dtype=int)
+        self.masked = np.zeros(self.n_images, dtype=bool)
+        self.groups_keys = np.empty(self.n_images, dtype=object)
+        self.labels_keys = np.empty(self.n_images, dtype=object)
+        self.n_groups = np.zeros(self.n_images, dtype=int)
+        # The number of points of each group, -1 where it is missing
+        self.n_points = OrderedDict()
+        self.indexed = np.zeros(self.n_images, dtype=bool)
+        self.n_indexed = 0
+        self._lock = threading.Lock()
+        self._done_callbacks = []
+        self._futures = None
+        if not lazy:
+            self.start()
+
+    def start(self):
+        r"""
+        Method that starts the indexing, unless it has already started. It
+        waits for the indexing to finish, unless the index is built in the
+        background.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        with self._lock:
+            if self._futures is not None:
+                return
+            # Submit the indices, so that lazy lists are loaded by the workers
+            executor = ThreadPoolExecutor(max_workers=self.n_workers)
+            self._futures = [
+                executor.submit(self._index_image, self.images, i)
+                for i in range(self.n_images)
+            ]
+        executor.shutdown(wait=not self.background)
+        if not self.background:
+            self.wait()
+
+    def _index_image(self, images, i):
+        path, shape, n_channels, masked, groups_keys, labels_keys, n_points = (
+            _image_metadata(images[i])
+        )
+        with self._lock:
+            self.paths[i] = "" if path is None else str(path)
+            self.heights[i], self.widths[i] = shape[:2]
+            self.n_channels[i] = n_channels
+            self.masked[i] = masked
+            self.groups_keys[i] = groups_keys
+            self.labels_keys[i] = labels_keys
+            self.n_groups[i] = len(groups_keys or ())
+            for g, n in zip(groups_keys or (), n_points or ()):
+                if g not in self.n_points:
+                    self.n_points[g] = np.full(self.n_images, -1, dtype=int)
+                self.n_points[g][i] = n
+            self.indexed[i] = True
+            self.n_indexed += 1
+            callbacks = self._done_callbacks if self.is_complete else []
+        for callback in callbacks:
+            callback()
+
+    @property
+    def is_started(self):
+        r"""
+        Whether the indexing has started.
+
+        :type: `bool`
+        """
+        return self._futures is not None
+
+    @property
+    def is_complete(self):
+        r"""
+        Whether all the images are indexed.
+
+        :type: `bool`
+        """
+        return self.n_indexed == self.n_images
+
+    def add_done_callback(self, callback):
+        r"""
+        Method that adds a function that gets called (from a worker thread)
+        when the indexing finishes. If it has already finished, then the
+        function is called immediately.
+
+        Parameters
+        ----------
+        callback : `callable`
+            The function, without arguments.
+        """
+        with self._lock:
+            if not self.is_complete:
+                self._done_callbacks.append(callback)
+                return
+        callback()
+
+    def wait(self):
+        r"""
+        Method that starts the indexing, if it has not started, and waits for
+        it to finish.
+
+        Raises
+        ------
+        Exception
+            The error raised while extracting the metadata of an image.
+        """
+        self.start()
+        for future in self._futures:
+            future.result()
+
+    def groups_labels(self, i):
+        r"""
+        Method that returns the landmark groups and labels of an image, as
+        :func:`menpowidgets.utils.extract_groups_labels_from_image` does.
+
+        Parameters
+        ----------
+        i : `int`
+            The index of the image.
+
+        Returns
+        -------
+        group_keys : `list` of `str` or ``None``
+            The landmark groups.
+        labels_keys : `list` or ``None``
+            The labels of each landmark group.
+        """
+        groups_keys = self.groups_keys[i]
+        labels_keys = self.labels_keys[i]
+        if groups_keys is None:
+            return None, None
+        return list(groups_keys), list(labels_keys)
+
+    def _has_label(self, group, label):
+        has = np.zeros(self.n_images, dtype=bool)
+        if group in self.n_points:
+            for i in np.nonzero(self.n_points[group] >= 0)[0]:
+                labels = self.labels_keys[i][self.groups_keys[i].index(group)]
+                has[i] = labels is not None and label in labels
+        return has
+
+    def _n_points(self, group):
+        if group in self.n_points:
+            return self.n_points[group]
+        return np.full(self.n_images, -1, dtype=int)
+
+    def _matches(self, pattern):
+        from fnmatch import fnmatch
+
+        return np.array([fnmatch(p, pattern) for p in self.paths], dtype=bool)
+
+    def query(self, expression):
+        r"""
+        Method that returns the indices of the images that match an
+        expression (see the class description). Only the indexed images
+        can match a non-empty expression, whereas an empty expression matches
+        all the images.
+
+        Parameters
+        ----------
+        expression : `str`
+            The expression.
+
+        Returns
+        -------
+        indices : `ndarray` of `int`
+            The indices of the matching images.
+
+        Raises
+        ------
+        ValueError
+            If the expression is invalid.
+        """
+        import ast
+
+        if expression.strip() == "":
+            return np.arange(self.n_images)
+        self.start()
+        columns = {
+            "index": np.arange(self.n_images),
+            "path": self.paths,
+            "height": self.heights,
+            "width": self.widths,
+            "n_channels": self.n_channels,
+            "masked": self.masked,
+            "n_groups": self.n_groups,
+        }
+        functions = {
+            "has": lambda group: self._n_points(group) >= 0,
+            "n_points": self._n_points,
+            "has_label": self._has_label,
+            "matches": self._matches,
+        }
+        try:
+            tree = ast.parse(expression.strip(), mode="eval")
+        except SyntaxError as e:
+            raise ValueError("Invalid query: {}".format(e.msg))
+        with self._lock:
+            mask = np.asarray(_evaluate_query(tree.body, columns, functions))
+            if mask.dtype != bool:
+                raise ValueError("The query must be a condition")
+            return np.nonzero(np.broadcast_to(mask, (self.n_images,)) & self.indexed)[0]
+
+
+def _evaluate_query(node, columns, functions):
+    # Evaluate an expression of ImageIndex.query element-wise, allowing only
+    # the columns, the functions, literals and operators
+    import ast
+    import operator
+
+    binary_operators = {
+        ast.Add: operator.add,
+        ast.Sub: operator.sub,
+        ast.Mult: operator.mul,
+        ast.Div: operator.truediv,
+        ast.Mod: operator.mod,
+        ast.BitAnd: np.logical_and,
+        ast.BitOr: np.logical_or,
+    }
+    compare_operators = {
+        ast.Eq: operator.eq,
+        ast.NotEq: operator.ne,
+        ast.Lt: operator.lt,
+        ast.LtE: operator.le,
+        ast.Gt: operator.gt,
+        ast.GtE: operator.ge,
+    }
+
+    def evaluate(node):
+        return _evaluate_query(node, columns, functions)
+
+    def apply(function, *operands):
+        # Operands of mismatched types, e.g. a number column compared to a
+        # string, are an error of the query
+        try:
+            return function(*operands)
+        except TypeError:
+            raise ValueError(
+                "Mismatched operand types at column {}".format(node.col_offset + 1)
+            )
+
+    if isinstance(node, ast.Constant) and isinstance(
+        node.value, (str, int, float, bool)
+    ):
+        return node.value
+    if isinstance(node, ast.Name) and node.id in columns:
+        return columns[node.id]
+    if isinstance(node, ast.BoolOp):
+        reduce = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+        result = evaluate(node.values[0])
+        for value in node.values[1:]:
+            result = apply(reduce, result, evaluate(value))
+        return result
+    if isinstance(node, ast.UnaryOp):
+        if isinstance(node.op, (ast.Not, ast.Invert)):
+            return apply(np.logical_not, evaluate(node.operand))
+        if isinstance(node.op, ast.USub):
+            return apply(operator.neg, evaluate(node.operand))
+    if isinstance(node, ast.BinOp) and type(node.op) in binary_operators:
+        return apply(
+            binary_operators[type(node.op)], evaluate(node.left), evaluate(node.right)
+        )
+    if isinstance(node, ast.Compare) and all(
+        type(op) in compare_operators for op in node.ops
+    ):
+        result = True
+        left = evaluate(node.left)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = evaluate(comparator)
+            comparison = apply(compare_operators[type(op)], left, right)
+            result = np.logical_and(result, comparison)
+            left = right
+        return result
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in functions
+        and len(node.keywords) == 0
+    ):
+        args = [evaluate(arg) for arg in node.args]
+        if not all(isinstance(arg, str) for arg in args):
+            raise ValueError(
+                "The arguments of {}() must be strings".format(node.func.id)
+            )
+        try:
+            return functions[node.func.id](*args)
+        except TypeError:
+            raise ValueError("Invalid arguments of {}()".format(node.func.id))
+    if isinstance(node, ast.Name):
+        raise ValueError("Unknown column '{}'".format(node.id))
+    raise ValueError(
+        "Unsupported query expression at column {}".format(
+            getattr(node, "col_offset", 0) + 1
+        )
+    )
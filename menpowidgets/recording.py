@@ -0,0 +1,204 @@
+r"""
+Recording of the rendered figures of the widgets as videos.
+"""
+
+import numpy as np
+
+from .utils import figure_to_rgb
+
+
+def find_ffmpeg():
+    r"""
+    Function that returns the path of an ffmpeg binary, i.e. the one of
+    ``imageio-ffmpeg``, if it is installed, otherwise the one on the ``PATH``.
+
+    Returns
+    -------
+    path : `str` or ``None``
+        The path of the binary or ``None`` if there is no ffmpeg.
+    """
+    try:
+        import imageio_ffmpeg
+
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except (ImportError, RuntimeError):
+        import shutil
+
+        return shutil.which("ffmpeg")
+
+
+def record_renderer_frame(save_figure_wid, progressive=None):
+    r"""
+    Function that grabs the current frame of the renderer of a figure saving
+    widget, for video recording. It is the ``record_frame_function`` of the
+    animation widgets of the ``visualize_*`` functions.
+
+    Parameters
+    ----------
+    save_figure_wid : `menpowidgets.options.SaveMatplotlibFigureOptionsWidget`
+        The widget whose renderer has the frame.
+    progressive : `menpowidgets.progressive.ProgressiveRender` or ``None``, optional
+        If not ``None``, then any pending full quality render is done before
+        grabbing the frame.
+
+    Returns
+    -------
+    frame : ``(height, width, 3)`` `ndarray`
+        The ``uint8`` RGB pixels.
+    """
+    if progressive is not None:
+        progressive.settle()
+    return figure_to_rgb(save_figure_wid.renderer.figure)
+
+
+class VideoWriter(object):
+    r"""
+    Class that encodes a sequence of RGB frames into a video file as they are
+    written, so that the frames are never all kept in memory.
+
+    If an ffmpeg binary is available (see :func:`find_ffmpeg`), then the raw
+    frames are piped to it and the container is defined by the extension of
+    `filename` (e.g. ``.mp4`` or ``.gif``). Otherwise, the frames are encoded
+    to an animated GIF with PIL, one frame at a time, and the extension of
+    `filename` is replaced by ``.gif``. All the frames get the size of the
+    first one, thus the following ones are cropped or padded with white.
+
+    Parameters
+    ----------
+    filename : `str`
+        The path of the video file.
+    fps : `float`, optional
+        The frame rate of the video, which is independent of the time it takes
+        to render the frames.
+
+    Raises
+    ------
+    ValueError
+        fps must be positive
+    """
+
+    def __init__(self, filename, fps=10):
+        from pathlib import Path
+
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        self.fps = fps
+        self.ffmpeg = find_ffmpeg()
+        path = Path(filename)
+        if self.ffmpeg is None and path.suffix.lower() != ".gif":
+            path = path.with_suffix(".gif")
+        self.filename = str(path)
+        self.n_frames = 0
+        self.frame_shape = None
+        self._process = None
+        self._file = None
+
+    def _open(self, frame_shape):
+        import subprocess
+
+        self.frame_shape = frame_shape
+        if self.ffmpeg is None:
+            self._file = open(self.filename, "wb")
+            return
+        command = [
+            self.ffmpeg,
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgb24",
+            "-s",
+            "{}x{}".format(frame_shape[1], frame_shape[0]),
+            "-r",
+            str(self.fps),
+            "-i",
+            "-",
+        ]
+        if not self.filename.lower().endswith(".gif"):
+            # yuv420p, which most players require, needs even dimensions
+            command += [
+                "-vf",
+                "pad=ceil(iw/2)*2:ceil(ih/2)*2:color=white",
+                "-pix_fmt",
+                "yuv420p",
+            ]
+        command.append(self.filename)
+        self._process = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+
+    def _fit(self, frame):
+        height, width = self.frame_shape
+        frame = frame[:height, :width]
+        if frame.shape[:2] != self.frame_shape:
+            padded = np.full((height, width, 3), 255, dtype=np.uint8)
+            padded[: frame.shape[0], : frame.shape[1]] = frame
+            frame = padded
+        return frame
+
+    def write(self, frame):
+        r"""
+        Method that encodes a frame.
+
+        Parameters
+        ----------
+        frame : ``(height, width, 3)`` or ``(height, width)`` `ndarray`
+            The frame, either ``uint8`` or float in the range ``[0, 1]``.
+        """
+        frame = np.asarray(frame)
+        if frame.dtype != np.uint8:
+            frame = (np.clip(frame, 0.0, 1.0) * 255).astype(np.uint8)
+        if frame.ndim == 2:
+            frame = np.repeat(frame[..., None], 3, axis=2)
+        frame = frame[..., :3]
+        if self.frame_shape is None:
+            self._open(frame.shape[:2])
+        frame = np.ascontiguousarray(self._fit(frame))
+        if self._process is not None:
+            self._process.stdin.write(frame.data)
+        else:
+            self._write_gif_frame(frame)
+        self.n_frames += 1
+
+    def _write_gif_frame(self, frame):
+        from PIL import Image, GifImagePlugin
+
+        # Every frame gets its own palette
+        image = Image.fromarray(frame).quantize(256)
+        if self.n_frames == 0:
+            header, _ = GifImagePlugin.getheader(image, info={"loop": 0})
+            for chunk in header:
+                self._file.write(chunk)
+        for chunk in GifImagePlugin.getdata(
+            image, duration=int(round(1000.0 / self.fps)), include_color_table=True
+        ):
+            self._file.write(chunk)
+
+    def close(self):
+        r"""
+        Method that finalises the video file.
+
+        Raises
+        ------
+        RuntimeError
+            ffmpeg failed
+        """
+        if self._process is not None:
+            self._process.stdin.close()
+            error = self._process.stderr.read()
+            self._process.stderr.close()
+            if self._process.wait() != 0:
+                raise RuntimeError("ffmpeg failed: {}".format(error.decode()))
+            self._process = None
+        elif self._file is not None:
+            self._file.write(b";")
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,169 @@
+r"""
+Immutable records of the selected options of the widgets.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+
+
+class _FrozenList(tuple):
+    # The frozen values of lists. They differ from the tuples with the same
+    # items, so that a list and a tuple option are not equal, as in a dict.
+    __slots__ = ()
+
+    def __eq__(self, other):
+        return type(other) is _FrozenList and tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((_FrozenList, tuple(self)))
+
+
+def freeze_options(value):
+    r"""
+    Function that converts a value of the `selected_values` of a widget to an
+    immutable and hashable one, i.e. `dict` to :map:`OptionsRecord` and
+    `list`, `tuple` and `ndarray` to `tuple`. The frozen lists (and arrays)
+    are not equal to the frozen tuples with the same items, as a `list` is not
+    equal to a `tuple`. Records are returned as they are, so the nested
+    records of unchanged options are shared.
+
+    Parameters
+    ----------
+    value : `object`
+        The value.
+
+    Returns
+    -------
+    frozen_value : `object`
+        The immutable value.
+    """
+    if isinstance(value, OptionsRecord):
+        return value
+    if isinstance(value, dict):
+        return OptionsRecord(value)
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    if isinstance(value, list):
+        return _FrozenList(freeze_options(v) for v in value)
+    if isinstance(value, tuple):
+        return tuple(freeze_options(v) for v in value)
+    return value
+
+
+def thaw_options(value):
+    r"""
+    Function that converts a value created by :func:`freeze_options` back to
+    plain `dict` and `list` objects.
+
+    Parameters
+    ----------
+    value : `object`
+        The frozen value.
+
+    Returns
+    -------
+    value : `object`
+        The mutable value.
+    """
+    if isinstance(value, OptionsRecord):
+        return value.to_dict()
+    if isinstance(value, _FrozenList):
+        return [thaw_options(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(thaw_options(v) for v in value)
+    return value
+
+
+class OptionsRecord(Mapping):
+    r"""
+    Immutable record of the selected options of a widget. It behaves as a
+    read-only `dict` whose nested `dict` and `list` values are frozen to
+    records and tuples. The structural hash is computed once, so records can
+    be used as cache keys and compared cheaply, and :meth:`diff` returns the
+    option groups that changed between two records.
+
+    Parameters
+    ----------
+    options : `dict`
+        The options.
+    """
+
+    __slots__ = ("_items", "_hash")
+
+    def __init__(self, options):
+        items = {k: freeze_options(v) for k, v in options.items()}
+        object.__setattr__(self, "_items", items)
+        object.__setattr__(self, "_hash", hash(frozenset(items.items())))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("OptionsRecord is immutable")
+
+    def __getitem__(self, key):
+        return self._items[key]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, OptionsRecord):
+            return self._hash == other._hash and self._items == other._items
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __reduce__(self):
+        return OptionsRecord, (self.to_dict(),)
+
+    def __repr__(self):
+        return "OptionsRecord({})".format(self._items)
+
+    def diff(self, other):
+        r"""
+        Method that returns the keys whose values differ from the ones of
+        another record. The nested records are compared by their hash first,
+        thus unchanged option groups are skipped without traversing them.
+
+        Parameters
+        ----------
+        other : :map:`OptionsRecord` or ``None``
+            The record to compare with. If ``None``, then all the keys are
+            returned.
+
+        Returns
+        -------
+        keys : `tuple`
+            The keys that were added, removed or changed.
+        """
+        if other is None:
+            return tuple(self._items)
+        if other is self:
+            return ()
+        keys = [k for k, v in self._items.items() if other._items.get(k, self) != v]
+        keys.extend(k for k in other._items if k not in self._items)
+        return tuple(keys)
+
+    def to_dict(self):
+        r"""
+        Method that converts the record to a `dict` with plain `dict` and
+        `list` values, as expected by the render functions.
+
+        Returns
+        -------
+        options : `dict`
+            The options.
+        """
+        return {k: thaw_options(v) for k, v in self._items.items()}
@@ -0,0 +1,222 @@
+r"""
+Reductions of the channels of images with many channels.
+"""
+
+from collections import OrderedDict
+import weakref
+
+import numpy as np
+
+
+def randomized_pca(data, n_components, n_iter=4, n_oversamples=10, seed=0):
+    r"""
+    Function that computes the principal components of a set of samples with a
+    randomized SVD, i.e. the SVD is computed on the projection of the centred
+    samples on a random subspace of ``n_components + n_oversamples``
+    dimensions that is refined with `n_iter` power iterations.
+
+    Parameters
+    ----------
+    data : ``(n_samples, n_features)`` `ndarray`
+        The samples.
+    n_components : `int`
+        The number of principal components.
+    n_iter : `int`, optional
+        The number of power iterations.
+    n_oversamples : `int`, optional
+        The number of additional dimensions of the random subspace.
+    seed : `int`, optional
+        The seed of the random subspace, so that the components are
+        reproducible.
+
+    Returns
+    -------
+    components : ``(n_components, n_features)`` `ndarray`
+        The principal components.
+    mean : ``(n_features,)`` `ndarray`
+        The mean of the samples.
+    """
+    mean = data.mean(axis=0)
+    centred = data - mean
+    n_random = min(n_components + n_oversamples, min(centred.shape))
+    random_state = np.random.RandomState(seed)
+    q = centred.dot(random_state.normal(size=(centred.shape[1], n_random)))
+    q, _ = np.linalg.qr(q)
+    for _ in range(n_iter):
+        q, _ = np.linalg.qr(centred.T.dot(q))
+        q, _ = np.linalg.qr(centred.dot(q))
+    _, _, v = np.linalg.svd(q.T.dot(centred), full_matrices=False)
+    return v[:n_components], mean
+
+
+class ChannelReductions(object):
+    r"""
+    Class that computes the reductions of the channels of an image that are
+    rendered instead of its channels, e.g. for feature images with many
+    channels. Each reduction is computed once and cached. The sums of the
+    most recently selected channels are kept, so that browsing many channel
+    selections does not grow the memory of the image.
+
+    Parameters
+    ----------
+    pixels : ``(n_channels, height, width)`` `ndarray`
+        The pixels of the image.
+    n_cached_sums : `int`, optional
+        The maximum number of cached sums of channels.
+    """
+
+    def __init__(self, pixels, n_cached_sums=8):
+        self.pixels = pixels
+        self.n_cached_sums = n_cached_sums
+        self._ranges = None
+        self._sums = OrderedDict()
+        self._pca_rgb = None
+
+    def channel_ranges(self):
+        r"""
+        Method that returns the minimum and maximum value of each channel.
+
+        Returns
+        -------
+        ranges : ``(n_channels, 2)`` `ndarray`
+            The minimum and maximum of each channel.
+        """
+        if self._ranges is None:
+            flat = self.pixels.reshape(self.pixels.shape[0], -1)
+            self._ranges = np.stack([flat.min(axis=1), flat.max(axis=1)], axis=1)
+        return self._ranges
+
+    def sum(self, channels=None):
+        r"""
+        Method that returns the sum of the selected channels.
+
+        Parameters
+        ----------
+        channels : `list` or `range` of `int` or ``None``, optional
+            The channels to sum. If ``None``, then all the channels are summed.
+            A `range` with a positive step selects a view of the channels.
+
+        Returns
+        -------
+        pixels : ``(1, height, width)`` `ndarray`
+            The sum of the channels.
+        """
+        key = (
+            channels
+            if channels is None or isinstance(channels, range)
+            else tuple(channels)
+        )
+        if key in self._sums:
+            self._sums.move_to_end(key)
+            return self._sums[key]
+        if channels is None:
+            pixels = self.pixels.sum(axis=0)
+        elif isinstance(channels, range) and channels.step > 0:
+            pixels = self.pixels[channels.start : channels.stop : channels.step].sum(
+                axis=0
+            )
+        else:
+            pixels = self.pixels[list(channels)].sum(axis=0)
+        self._sums[key] = pixels[None]
+        while len(self._sums) > self.n_cached_sums:
+            self._sums.popitem(last=False)
+        return self._sums[key]
+
+    def pca_rgb(self):
+        r"""
+        Method that returns the projection of the pixels on the first three
+        principal components of the channels (see :func:`randomized_pca`).
+        Each component is rescaled to ``[0, 1]``, so that the projection is
+        rendered as an RGB image.
+
+        Returns
+        -------
+        pixels : ``(3, height, width)`` `ndarray`
+            The projected pixels.
+        """
+        if self._pca_rgb is None:
+            n_channels = self.pixels.shape[0]
+            data = self.pixels.reshape(n_channels, -1).T
+            components, mean = randomized_pca(data, min(3, n_channels))
+            projected = (data - mean).dot(components.T)
+            # Pad with zeros for images with less than three channels
+            rgb = np.zeros((data.shape[0], 3))
+            rgb[:, : projected.shape[1]] = projected
+            low = rgb.min(axis=0)
+            extent = rgb.max(axis=0) - low
+            extent[extent == 0] = 1.0
+            rgb = (rgb - low) / extent
+            self._pca_rgb = rgb.T.reshape((3,) + self.pixels.shape[1:])
+        return self._pca_rgb
+
+
+# The channel reductions of each image
+_channel_reductions = weakref.WeakKeyDictionary()
+
+
+def channel_reductions(image):
+    r"""
+    Function that returns the cached :class:`ChannelReductions` of an image.
+    The cache is dropped once the image gets garbage collected or its pixels
+    get replaced.
+
+    Parameters
+    ----------
+    image : `menpo.image.Image` or subclass
+        The image.
+
+    Returns
+    -------
+    reductions : :class:`ChannelReductions`
+        The channel reductions of the image.
+    """
+    reductions = _channel_reductions.get(image)
+    if reductions is None or reductions.pixels is not image.pixels:
+        reductions = ChannelReductions(image.pixels)
+        _channel_reductions[image] = reductions
+    return reductions
+
+
+def reduced_image(image, channels_view, channels=None):
+    r"""
+    Function that returns an image whose pixels are a cached reduction of the
+    channels of the provided image. The mask and landmarks are kept.
+
+    Parameters
+    ----------
+    image : `menpo.image.Image` or subclass
+        The image.
+    channels_view : ``{'sum', 'pca'}``
+        The reduction. If ``'sum'``, then the selected channels are summed. If
+        ``'pca'``, then the pixels are projected on the first three principal
+        components of the channels and rendered as RGB.
+    channels : `list` of `int` or ``None``, optional
+        The channels that are summed. If ``None``, then all the channels are
+        summed.
+
+    Returns
+    -------
+    image : `menpo.image.Image` or subclass
+        The image with the reduced pixels.
+
+    Raises
+    ------
+    ValueError
+        channels_view must be either 'sum' or 'pca'
+    """
+    from menpo.image import Image, MaskedImage
+
+    reductions = channel_reductions(image)
+    if channels_view == "sum":
+        pixels = reductions.sum(channels)
+    elif channels_view == "pca":
+        pixels = reductions.pca_rgb()
+    else:
+        raise ValueError("channels_view must be either 'sum' or 'pca'")
+    if isinstance(image, MaskedImage):
+        reduced = MaskedImage(pixels, mask=image.mask, copy=False)
+    else:
+        reduced = Image(pixels, copy=False)
+    if image.has_landmarks:
+        reduced.landmarks = image.landmarks
+    return reduced
@@ -0,0 +1,774 @@
+r"""
+Widget-free rendering of the views of the visualization widgets.
+
+The functions of this module take the ``selected_values`` of the options'
+widgets (or their defaults) and render on a Matplotlib figure without requiring
+an IPython kernel. They are the render path of the widgets of
+:mod:`menpowidgets.base` as well, thus a batch job renders exactly the same
+figures as a notebook session with the same options.
+"""
+
+from menpo.image import MaskedImage
+
+from .defaults import (
+    shape_2d_default_options,
+    renderer_default_options,
+    image_default_options,
+    landmark_default_options,
+)
+from .utils import (
+    extract_groups_labels_from_image,
+    render_image,
+    render_object_view,
+    figure_to_rgb,
+    figure_to_png,
+    blank_renderer,
+    select_label_colours,
+)
+from .cache import as_render_cache, image_cache_source
+from .numbering import numbered_points, render_culled_numbering
+from .progressive import draft_view_options
+from .records import OptionsRecord
+from .workers import attach_image, close_segments
+
+# The number of points above which a shape is dense, i.e. its numbering skips
+# the numbers that would overlap. Sparser shapes are numbered by menpo.
+DENSE_NUMBERING_N_POINTS = 500
+
+
+def _correct_label_colours(options, labels):
+    # Keep the colours of the selected labels only, or the first colour if
+    # the shape does not have labels
+    if labels is not None:
+        select_label_colours(
+            options, labels, ["line_colour", "marker_face_colour", "marker_edge_colour"]
+        )
+    else:
+        for key in ["line_colour", "marker_face_colour", "marker_edge_colour"]:
+            options[key] = options[key][0]
+
+
+def _as_dict(values):
+    # The options can also be given as the widgets' selected_record
+    return values.to_dict() if isinstance(values, OptionsRecord) else values
+
+
+def _zoomed_figure_size(renderer_values, figure_size):
+    return (
+        renderer_values["zoom_one"] * figure_size[0],
+        renderer_values["zoom_one"] * figure_size[1],
+    )
+
+
+def _numbering_min_distance(n_points, numbering_values, min_distance):
+    # By default, the numbers of dense shapes are kept a font size apart and
+    # the rest are numbered by menpo, which is denoted by None
+    if min_distance is None and n_points > DENSE_NUMBERING_N_POINTS:
+        min_distance = numbering_values["numbers_font_size"]
+    return min_distance
+
+
+def default_shape_options(shape):
+    r"""
+    Function that returns the initial options of
+    :func:`menpowidgets.visualize_shapes_2d` for a shape.
+
+    Parameters
+    ----------
+    shape : `menpo.shape.PointCloud` or subclass
+        The shape.
+
+    Returns
+    -------
+    shape_values : `dict`
+        The options of `menpowidgets.options.Shape2DOptionsWidget`.
+    renderer_values : `dict`
+        The options of `menpowidgets.options.RendererOptionsWidget`.
+    """
+    labels = shape.labels if hasattr(shape, "labels") else None
+    return (
+        shape_2d_default_options(labels),
+        renderer_default_options(
+            ["zoom_one", "axes", "numbering_matplotlib", "legend"],
+            labels=None,
+            axes_x_limits=0.1,
+            axes_y_limits=0.1,
+        ),
+    )
+
+
+def shape_view_options(shape, shape_values, renderer_values, figure_size=(7, 7)):
+    r"""
+    Function that merges the options' widgets values into the options of the
+    ``view()`` method of a shape.
+
+    Parameters
+    ----------
+    shape : `menpo.shape.PointCloud` or subclass
+        The shape.
+    shape_values : `dict`
+        The options of `menpowidgets.options.Shape2DOptionsWidget`.
+    renderer_values : `dict`
+        The options of `menpowidgets.options.RendererOptionsWidget`.
+    figure_size : (`int`, `int`), optional
+        The size of the figure before zooming.
+
+    Returns
+    -------
+    options : `dict`
+        The options of ``view()``, including the zoomed ``figure_size``.
+    """
+    shape_values = _as_dict(shape_values)
+    renderer_values = _as_dict(renderer_values)
+    options = dict()
+    options.update(shape_values["lines"])
+    options.update(shape_values["markers"])
+    options["image_view"] = shape_values["image_view"]
+    options.update(renderer_values["numbering_matplotlib"])
+    options.update(renderer_values["axes"])
+    if hasattr(shape, "labels"):
+        # LabelledPointUndirectedGraph uses the legend and with_labels
+        options.update(renderer_values["legend"])
+        options["with_labels"] = shape_values["with_labels"]
+        _correct_label_colours(options, shape.labels)
+    else:
+        _correct_label_colours(options, None)
+    options["figure_size"] = _zoomed_figure_size(renderer_values, figure_size)
+    return options
+
+
+def render_shape_view(
+    shape,
+    shape_values,
+    renderer_values,
+    figure_size=(7, 7),
+    renderer=None,
+    numbering_min_distance=None,
+    draft=False,
+):
+    r"""
+    Function that renders a shape as in :func:`menpowidgets.visualize_shapes_2d`.
+
+    Parameters
+    ----------
+    shape : `menpo.shape.PointCloud` or subclass
+        The shape.
+    shape_values : `dict`
+        The options of `menpowidgets.options.Shape2DOptionsWidget`.
+    renderer_values : `dict`
+        The options of `menpowidgets.options.RendererOptionsWidget`.
+    figure_size : (`int`, `int`), optional
+        The size of the figure before zooming.
+    renderer : `menpo.visualize.Renderer` or subclass or ``None``, optional
+        The renderer whose figure is used. If ``None``, then a new figure is
+        created.
+    numbering_min_distance : `float` or ``None``, optional
+        The numbering only draws the numbers within the axes limits that are at
+        least `numbering_min_distance` pixels apart (see
+        :func:`menpowidgets.numbering.render_culled_numbering`). If ``None``,
+        then it is the font size of the numbers for shapes with more than
+        `DENSE_NUMBERING_N_POINTS` points, while the rest are numbered by the
+        ``view()`` method of the shape.
+    draft : `bool`, optional
+        If ``True``, then the shape is rendered with the draft options (see
+        `menpowidgets.progressive.draft_view_options`), i.e. without numbering
+        and legend.
+
+    Returns
+    -------
+    renderer : `menpo.visualize.Renderer` or subclass
+        The renderer object.
+    """
+    if renderer is None:
+        renderer = blank_renderer()
+    options = shape_view_options(shape, shape_values, renderer_values, figure_size)
+    if draft:
+        options = draft_view_options(options)
+    numbering_values = _as_dict(renderer_values)["numbering_matplotlib"]
+    numbering_min_distance = _numbering_min_distance(
+        shape.n_points, numbering_values, numbering_min_distance
+    )
+    culled_numbering = (
+        options["render_numbering"] and numbering_min_distance is not None
+    )
+    if culled_numbering:
+        options["render_numbering"] = False
+    renderer = render_object_view(shape, renderer, **options)
+    if culled_numbering:
+        points, numbers = numbered_points(
+            shape,
+            with_labels=options.get("with_labels"),
+            image_view=options["image_view"],
+        )
+        numbering_options = dict(numbering_values)
+        del numbering_options["render_numbering"]
+        render_culled_numbering(
+            renderer.figure.gca(),
+            points,
+            numbers=numbers,
+            min_distance=numbering_min_distance,
+            **numbering_options
+        )
+    return renderer
+
+
+def default_image_options(image):
+    r"""
+    Function that returns the initial options of
+    :func:`menpowidgets.visualize_images` for an image.
+
+    Parameters
+    ----------
+    image : `menpo.image.Image` or subclass
+        The image.
+
+    Returns
+    -------
+    landmark_values : `dict`
+        The options of `menpowidgets.options.LandmarkOptionsWidget`.
+    renderer_values : `dict`
+        The options of `menpowidgets.options.RendererOptionsWidget`.
+    image_values : `dict`
+        The options of `menpowidgets.options.ImageOptionsWidget`.
+    """
+    groups_keys, labels_keys = extract_groups_labels_from_image(image)
+    first_label = labels_keys[0] if labels_keys else None
+    image_is_masked = isinstance(image, MaskedImage)
+    return (
+        landmark_default_options(groups_keys, labels_keys, type="2D"),
+        renderer_default_options(
+            ["zoom_one", "axes", "numbering_matplotlib", "legend"],
+            labels=first_label,
+            axes_x_limits=None,
+            axes_y_limits=None,
+        ),
+        image_default_options(image.n_channels, image_is_masked),
+    )
+
+
+def image_view_options(
+    image,
+    landmark_values,
+    renderer_values,
+    image_values,
+    figure_size=(7, 7),
+    numbering_min_distance=None,
+):
+    r"""
+    Function that merges the options' widgets values into the options of
+    :func:`menpowidgets.utils.render_image`.
+
+    Parameters
+    ----------
+    image : `menpo.image.Image` or subclass
+        The image.
+    landmark_values : `dict`
+        The options of `menpowidgets.options.LandmarkOptionsWidget`.
+    renderer_values : `dict`
+        The options of `menpowidgets.options.RendererOptionsWidget`.
+    image_values : `dict`
+        The options of `menpowidgets.options.ImageOptionsWidget`.
+    figure_size : (`int`, `int`), optional
+        The size of the figure before zooming.
+    numbering_min_distance : `float` or ``None``, optional
+        The minimum distance (in pixels) between the numbers of the landmarks.
+        If ``None``, then it is the font size of the numbers for groups with
+        more than `DENSE_NUMBERING_N_POINTS` points, while the rest are
+        numbered by menpo.
+
+    Returns
+    -------
+    options : `dict`
+        The options of :func:`menpowidgets.utils.render_image`, including the
+        zoomed ``figure_size``, ``image_is_masked`` and
+        ``numbers_min_distance``.
+    """
+    landmark_values = _as_dict(landmark_values)
+    renderer_values = _as_dict(renderer_values)
+    image_values = _as_dict(image_values)
+    g = landmark_values["landmarks"]["group"]
+    options = dict()
+    options.update(landmark_values["lines"])
+    options.update(landmark_values["markers"])
+    options.update(renderer_values["numbering_matplotlib"])
+    options.update(renderer_values["axes"])
+    options.update(renderer_values["legend"])
+    options.update(image_values)
+    options.update(landmark_values["landmarks"])
+    if image.has_landmarks and hasattr(image.landmarks[g], "labels"):
+        _correct_label_colours(options, image.landmarks[g].labels)
+    else:
+        _correct_label_colours(options, None)
+    n_points = image.landmarks[g].n_points if image.has_landmarks else 0
+    options["numbers_min_distance"] = _numbering_min_distance(
+        n_points, renderer_values["numbering_matplotlib"], numbering_min_distance
+    )
+    options["image_is_masked"] = isinstance(image, MaskedImage)
+    options["figure_size"] = _zoomed_figure_size(renderer_values, figure_size)
+    return options
+
+
+def render_image_view(
+    image,
+    landmark_values,
+    renderer_values,
+    image_values,
+    figure_size=(7, 7),
+    renderer=None,
+    numbering_min_distance=None,
+    draft=False,
+):
+    r"""
+    Function that renders an image as in :func:`menpowidgets.visualize_images`.
+
+    Parameters
+    ----------
+    image : `menpo.image.Image` or subclass
+        The image.
+    landmark_values : `dict`
+        The options of `menpowidgets.options.LandmarkOptionsWidget`.
+    renderer_values : `dict`
+        The options of `menpowidgets.options.RendererOptionsWidget`.
+    image_values : `dict`
+        The options of `menpowidgets.options.ImageOptionsWidget`.
+    figure_size : (`int`, `int`), optional
+        The size of the figure before zooming.
+    renderer : `menpo.visualize.Renderer` or subclass or ``None``, optional
+        The renderer whose figure is used. If ``None``, then a new figure is
+        created.
+    numbering_min_distance : `float` or ``None``, optional
+        The minimum distance (in pixels) between the numbers of the landmarks
+        (see :func:`image_view_options`).
+    draft : `bool`, optional
+        If ``True``, then the image is rendered with the draft options (see
+        `menpowidgets.progressive.draft_view_options`), i.e. with nearest
+        interpolation and without numbering and legend, and the figure is not
+        shown, so that it can be shown as a draft frame.
+
+    Returns
+    -------
+    renderer : `menpo.visualize.Renderer` or subclass
+        The renderer object.
+    """
+    if renderer is None:
+        renderer = blank_renderer()
+    options = image_view_options(
+        image,
+        landmark_values,
+        renderer_values,
+        image_values,
+        figure_size,
+        numbering_min_distance=numbering_min_distance,
+    )
+    if draft:
+        options = draft_view_options(options)
+    return render_image(image=image, renderer=renderer, force_draw=not draft, **options)
+
+
+def render_image_frame(
+    image_handle, landmark_values, renderer_values, image_values, figure_size=(7, 7)
+):
+    r"""
+    Function that renders an image as in :func:`render_image_view` and encodes
+    the figure as PNG. It runs in the worker processes of a
+    `menpowidgets.workers.RenderPool`, thus the image is attached from shared
+    memory instead of being pickled.
+
+    Parameters
+    ----------
+    image_handle : `tuple`
+        The handle of the image, as returned by
+        `menpowidgets.workers.SharedImages.share`.
+    landmark_values : `dict`
+        The options of `menpowidgets.options.LandmarkOptionsWidget`.
+    renderer_values : `dict`
+        The options of `menpowidgets.options.RendererOptionsWidget`.
+    image_values : `dict`
+        The options of `menpowidgets.options.ImageOptionsWidget`.
+    figure_size : (`int`, `int`), optional
+        The size of the figure before zooming.
+
+    Returns
+    -------
+    png : `bytes`
+        The encoded frame.
+    """
+    import matplotlib.pyplot as plt
+
+    image, segments = attach_image(image_handle)
+    try:
+        return figure_to_png(
+            render_image_view(
+                image,
+                landmark_values,
+                renderer_values,
+                image_values,
+                figure_size=figure_size,
+            ).figure
+        )
+    finally:
+        # The figures are created with pyplot, so they must be closed in
+        # order not to accumulate in the worker
+        plt.close("all")
+        del image
+        close_segments(segments)
+
+
+def default_fitting_result_options(fitting_result):
+    r"""
+    Function that returns the initial options of the final result view of
+    :func:`menpowidgets.visualize_fitting_results` for a fitting result.
+
+    Parameters
+    ----------
+    fitting_result : `menpofit.result.Result` or subclass
+        The fitting result.
+
+    Returns
+    -------
+    renderer_values : `dict`
+        The options of `menpowidgets.options.RendererOptionsWidget`.
+    fitting_result_values : `dict`
+        The options of `menpowidgets.options.IterativeResultOptionsWidget`.
+    """
+    labels = ["Final"]
+    default_colours = ["red"]
+    if fitting_result.initial_shape is not None:
+        labels.append("Initial")
+        default_colours.append("blue")
+    if fitting_result.gt_shape is not None:
+        labels.append("Groundtruth")
+        default_colours.append("yellow")
+
+    renderer_values = renderer_default_options(
+        [
+            "markers_matplotlib",
+            "lines_matplotlib",
+            "zoom_one",
+            "legend",
+            "numbering_matplotlib",
+            "image_matplotlib",
+            "axes",
+        ],
+        labels=labels,
+        axes_x_limits=None,
+        axes_y_limits=None,
+    )
+    renderer_values["legend"]["render_legend"] = True
+    renderer_values["markers_matplotlib"]["marker_face_colour"] = default_colours
+    renderer_values["markers_matplotlib"]["marker_edge_colour"] = ["black"] * len(
+        default_colours
+    )
+    renderer_values["lines_matplotlib"]["line_colour"] = default_colours
+    fitting_result_values = {
+        "render_final_shape": True,
+        "render_initial_shape": False,
+        "render_gt_shape": False,
+        "render_image": fitting_result.image is not None,
+        "subplots_enabled": False,
+    }
+    return renderer_values, fitting_result_values
+
+
+def fitting_result_view_options(
+    fitting_result, renderer_values, fitting_result_values, figure_size=(7, 7)
+):
+    r"""
+    Function that merges the options' widgets values into the options of the
+    ``view()`` method of a fitting result.
+
+    Parameters
+    ----------
+    fitting_result : `menpofit.result.Result` or subclass
+        The fitting result.
+    renderer_values : `dict`
+        The options of `menpowidgets.options.RendererOptionsWidget`.
+    fitting_result_values : `dict`
+        The options of `menpowidgets.options.IterativeResultOptionsWidget`.
+    figure_size : (`int`, `int`), optional
+        The size of the figure before zooming.
+
+    Returns
+    -------
+    options : `dict`
+        The options of ``view()``, including the zoomed ``figure_size``.
+    """
+    renderer_values = _as_dict(renderer_values)
+    fitting_result_values = _as_dict(fitting_result_values)
+    markers = renderer_values["markers_matplotlib"]
+    lines = renderer_values["lines_matplotlib"]
+    options = dict(fitting_result_values)
+    options.update(renderer_values["axes"])
+    options.update(renderer_values["legend"])
+    options.update(renderer_values["numbering_matplotlib"])
+    options.update(renderer_values["image_matplotlib"])
+    # The colours are ordered as final, initial (if any) and groundtruth (if
+    # any) shape
+    colours = {}
+    c = 0
+    for shape_type, default_colour in [
+        ("final", None),
+        ("initial", "b"),
+        ("gt", "y"),
+    ]:
+        if shape_type == "initial" and fitting_result.initial_shape is None:
+            face = edge = line = default_colour
+        elif shape_type == "gt" and fitting_result.gt_shape is None:
+            face = edge = line = default_colour
+        else:
+            face = markers["marker_face_colour"][c]
+            edge = markers["marker_edge_colour"][c]
+            line = lines["line_colour"][c]
+            c += 1
+        colours["{}_marker_face_colour".format(shape_type)] = face
+        colours["{}_marker_edge_colour".format(shape_type)] = edge
+        colours["{}_line_colour".format(shape_type)] = line
+    options.update(colours)
+    options.update(
+        render_markers=markers["render_markers"],
+        marker_style=markers["marker_style"],
+        marker_size=markers["marker_size"],
+        marker_edge_width=markers["marker_edge_width"],
+        render_lines=lines["render_lines"],
+        line_style=lines["line_style"],
+        line_width=lines["line_width"],
+        figure_size=_zoomed_figure_size(renderer_values, figure_size),
+    )
+    return options
+
+
+def render_fitting_result_view(
+    fitting_result,
+    renderer_values,
+    fitting_result_values,
+    figure_size=(7, 7),
+    renderer=None,
+):
+    r"""
+    Function that renders the final result view of a fitting result as in
+    :func:`menpowidgets.visualize_fitting_results`.
+
+    Parameters
+    ----------
+    fitting_result : `menpofit.result.Result` or subclass
+        The fitting result.
+    renderer_values : `dict`
+        The options of `menpowidgets.options.RendererOptionsWidget`.
+    fitting_result_values : `dict`
+        The options of `menpowidgets.options.IterativeResultOptionsWidget`.
+    figure_size : (`int`, `int`), optional
+        The size of the figure before zooming.
+    renderer : `menpo.visualize.Renderer` or subclass or ``None``, optional
+        The renderer whose figure is used. If ``None``, then a new figure is
+        created.
+
+    Returns
+    -------
+    renderer : `menpo.visualize.Renderer` or subclass
+        The renderer object.
+    """
+    if renderer is None:
+        renderer = blank_renderer()
+    options = fitting_result_view_options(
+        fitting_result, renderer_values, fitting_result_values, figure_size
+    )
+    return render_object_view(fitting_result, renderer, **options)
+
+
+def _fill_defaults(values, default_values):
+    return [d if v is None else v for v, d in zip(values, default_values)]
+
+
+def _render_items(
+    items, values, render, as_array, figure_size, cache=None, cache_source=None
+):
+    import matplotlib.pyplot as plt
+
+    for item in items:
+        item_values = values(item)
+        # The frames are keyed by the source file of the items, or by their
+        # content if they have none
+        use_cache = cache is not None and as_array
+        if use_cache:
+            path, content = cache_source(item)
+            cache_options = ("frame", item_values, figure_size, content)
+            cached = cache.get_arrays(path, cache_options)
+            if cached is not None:
+                yield cached[0]
+                continue
+        renderer = render(item, item_values)
+        if as_array:
+            frame = figure_to_rgb(renderer.figure)
+            # The figures are created with pyplot, so they must be closed in
+            # order not to accumulate
+            plt.close(renderer.figure)
+            if use_cache:
+                cache.put_arrays(path, cache_options, [frame])
+            yield frame
+        else:
+            yield renderer.figure
+
+
+def render_shapes(
+    shapes, shape_values=None, renderer_values=None, figure_size=(7, 7), as_array=False
+):
+    r"""
+    Function that renders a `list` of shapes without widgets, with the same
+    render path as :func:`menpowidgets.visualize_shapes_2d`.
+
+    Parameters
+    ----------
+    shapes : `list` of `menpo.shape.PointCloud` or subclass
+        The shapes.
+    shape_values : `dict` or ``None``, optional
+        The options of `menpowidgets.options.Shape2DOptionsWidget`, e.g. its
+        ``selected_values``. If ``None``, then the initial options of the
+        widget are used for each shape.
+    renderer_values : `dict` or ``None``, optional
+        The options of `menpowidgets.options.RendererOptionsWidget`. If
+        ``None``, then the initial options of the widget are used.
+    figure_size : (`int`, `int`), optional
+        The size of the figures before zooming.
+    as_array : `bool`, optional
+        If ``True``, then each figure is converted to an ``(height, width, 3)``
+        `uint8` array and closed. If ``False``, then the Matplotlib figures are
+        returned and it is up to the caller to close them.
+
+    Returns
+    -------
+    frames : `generator`
+        The rendered figures (or arrays), one per shape.
+    """
+
+    def values(shape):
+        values = [shape_values, renderer_values]
+        if None in values:
+            values = _fill_defaults(values, default_shape_options(shape))
+        return values
+
+    def render(shape, values):
+        return render_shape_view(shape, *values, figure_size=figure_size)
+
+    return _render_items(shapes, values, render, as_array, figure_size)
+
+
+def render_images(
+    images,
+    landmark_values=None,
+    renderer_values=None,
+    image_values=None,
+    figure_size=(7, 7),
+    as_array=False,
+    cache_dir=None,
+):
+    r"""
+    Function that renders a `list` of images without widgets, with the same
+    render path as :func:`menpowidgets.visualize_images`.
+
+    Parameters
+    ----------
+    images : `list` of `menpo.image.Image` or subclass
+        The images.
+    landmark_values : `dict` or ``None``, optional
+        The options of `menpowidgets.options.LandmarkOptionsWidget`, e.g. its
+        ``selected_values``. If ``None``, then the initial options of the
+        widget are used for each image.
+    renderer_values : `dict` or ``None``, optional
+        The options of `menpowidgets.options.RendererOptionsWidget`. If
+        ``None``, then the initial options of the widget are used.
+    image_values : `dict` or ``None``, optional
+        The options of `menpowidgets.options.ImageOptionsWidget`. If ``None``,
+        then the initial options of the widget are used for each image.
+    figure_size : (`int`, `int`), optional
+        The size of the figures before zooming.
+    as_array : `bool`, optional
+        If ``True``, then each figure is converted to an ``(height, width, 3)``
+        `uint8` array and closed. If ``False``, then the Matplotlib figures are
+        returned and it is up to the caller to close them.
+    cache_dir : `str` or `pathlib.Path` or ``None``, optional
+        If not ``None``, then the arrays of the images are read from and
+        stored to the persistent render cache of the directory (see
+        `menpowidgets.cache.RenderCache`), so that a later session with the
+        same options does not render them again. The images without a source
+        file are keyed by their content (see
+        `menpowidgets.cache.image_cache_source`).
+
+    Returns
+    -------
+    frames : `generator`
+        The rendered figures (or arrays), one per image.
+    """
+
+    def values(image):
+        values = [landmark_values, renderer_values, image_values]
+        if None in values:
+            values = _fill_defaults(values, default_image_options(image))
+        return values
+
+    def render(image, values):
+        return render_image_view(image, *values, figure_size=figure_size)
+
+    return _render_items(
+        images,
+        values,
+        render,
+        as_array,
+        figure_size,
+        cache=as_render_cache(cache_dir),
+        cache_source=image_cache_source,
+    )
+
+
+def render_fitting_results(
+    fitting_results,
+    renderer_values=None,
+    fitting_result_values=None,
+    figure_size=(7, 7),
+    as_array=False,
+):
+    r"""
+    Function that renders the final result view of a `list` of fitting results
+    without widgets, with the same render path as
+    :func:`menpowidgets.visualize_fitting_results`. The view shows the final
+    shape and, if enabled in `fitting_result_values`, the initial and
+    groundtruth shapes. The iterations view and the plots of the errors, costs
+    and displacements of the widget are not rendered.
+
+    Parameters
+    ----------
+    fitting_results : `list` of `menpofit.result.Result` or subclass
+        The fitting results.
+    renderer_values : `dict` or ``None``, optional
+        The options of `menpowidgets.options.RendererOptionsWidget`, e.g. its
+        ``selected_values``. If ``None``, then the initial options of the
+        widget are used for each fitting result.
+    fitting_result_values : `dict` or ``None``, optional
+        The options of `menpowidgets.options.IterativeResultOptionsWidget`. If
+        ``None``, then the initial options of the widget are used.
+    figure_size : (`int`, `int`), optional
+        The size of the figures before zooming.
+    as_array : `bool`, optional
+        If ``True``, then each figure is converted to an ``(height, width, 3)``
+        `uint8` array and closed. If ``False``, then the Matplotlib figures are
+        returned and it is up to the caller to close them.
+
+    Returns
+    -------
+    frames : `generator`
+        The rendered figures (or arrays), one per fitting result.
+    """
+
+    def values(fitting_result):
+        values = [renderer_values, fitting_result_values]
+        if None in values:
+            values = _fill_defaults(
+                values, default_fitting_result_options(fitting_result)
+            )
+        return values
+
+    def render(fitting_result, values):
+        return render_fitting_result_view(
+            fitting_result, *values, figure_size=figure_size
+        )
+
+    return _render_items(fitting_results, values, render, as_array, figure_size)
@@ -0,0 +1,249 @@
+r"""
+Cumulative Error Distributions of sorted and streamed errors.
+"""
+
+from collections.abc import Sized
+
+import numpy as np
+
+
+def compute_cumulative_error(sorted_errors, x_axis):
+    r"""
+    Function that computes the Cumulative Error Distribution (CED) of a set of
+    errors at the provided error values. The errors must be already sorted,
+    which allows to evaluate the CED at all the error values with a single
+    binary search.
+
+    Parameters
+    ----------
+    sorted_errors : ``(n_errors,)`` `ndarray`
+        The errors sorted in ascending order.
+    x_axis : ``(n_bins,)`` `ndarray`
+        The error values at which the CED is evaluated.
+
+    Returns
+    -------
+    ced : ``(n_bins,)`` `ndarray`
+        The proportion of errors that are less or equal to each error value.
+    """
+    if sorted_errors.size == 0:
+        return np.zeros(len(x_axis))
+    n_le = np.searchsorted(sorted_errors, x_axis, side="right")
+    return n_le / float(sorted_errors.size)
+
+
+class ErrorHistogramSketch(object):
+    r"""
+    Mergeable histogram of errors that allows to compute the Cumulative Error
+    Distribution (CED) of an arbitrarily large stream of errors with bounded
+    memory. The errors can be fed in chunks while they are being produced
+    (e.g. while an evaluation job is still running) and sketches that were
+    built separately can be merged.
+
+    The errors are counted in `n_bins` equally sized bins that cover
+    ``(min_error, max_error]``, thus the memory is ``O(n_bins)`` regardless of
+    the number of errors. The accuracy of the CED is the following:
+
+    * It is exact at the bin edges, i.e. at ``min_error + k * bin_width``.
+    * At any other error value ``x``, it is the CED at the largest bin edge
+      that is less or equal to ``x``, i.e. the curve is shifted horizontally
+      by at most one ``bin_width = (max_error - min_error) / n_bins``.
+    * Errors greater than `max_error` are only counted as failures, thus the
+      CED is saturated after `max_error`.
+    * Non-finite errors, e.g. of failed fittings, are not binned. They are
+      counted in :attr:`n_non_finite` and as failures, as
+      :func:`compute_cumulative_error` does with the sorted errors.
+
+    Parameters
+    ----------
+    max_error : `float`
+        The maximum error value that is binned.
+    n_bins : `int`, optional
+        The number of bins.
+    min_error : `float`, optional
+        The minimum error value that is binned. Errors less or equal to it are
+        counted together.
+
+    Raises
+    ------
+    ValueError
+        max_error must be greater than min_error
+    ValueError
+        n_bins must be a positive integer
+    """
+
+    def __init__(self, max_error, n_bins=10000, min_error=0.0):
+        if max_error <= min_error:
+            raise ValueError("max_error must be greater than min_error")
+        if n_bins < 1:
+            raise ValueError("n_bins must be a positive integer")
+        self.min_error = float(min_error)
+        self.max_error = float(max_error)
+        self.n_bins = int(n_bins)
+        self.bin_width = (self.max_error - self.min_error) / self.n_bins
+        # counts[0] stores the errors that are <= min_error, counts[k] the
+        # errors in the k-th bin and counts[-1] the errors that are > max_error
+        self.counts = np.zeros(self.n_bins + 2, dtype=np.int64)
+        self.n_non_finite = 0
+        self.max_observed = None
+
+    @classmethod
+    def from_chunks(cls, chunks, max_error, n_bins=10000, min_error=0.0):
+        r"""
+        Method that creates a sketch and feeds it with the provided chunks of
+        errors.
+
+        Parameters
+        ----------
+        chunks : `iterable` of `list` or `ndarray` of `float`
+            The chunks of errors, e.g. a generator that yields the errors of
+            each batch of fitted images.
+        max_error : `float`
+            The maximum error value that is binned.
+        n_bins : `int`, optional
+            The number of bins.
+        min_error : `float`, optional
+            The minimum error value that is binned.
+
+        Returns
+        -------
+        sketch : `ErrorHistogramSketch`
+            The sketch object.
+        """
+        sketch = cls(max_error, n_bins=n_bins, min_error=min_error)
+        sketch.extend(chunks)
+        return sketch
+
+    @property
+    def n_errors(self):
+        r"""
+        The number of errors that have been fed to the sketch, including the
+        non-finite ones.
+
+        :type: `int`
+        """
+        return int(self.counts.sum()) + self.n_non_finite
+
+    def update(self, errors):
+        r"""
+        Method that adds a chunk of errors to the sketch.
+
+        Parameters
+        ----------
+        errors : `list` or `ndarray` or `iterable` of `float`
+            The errors to add.
+        """
+        if not isinstance(errors, (Sized, np.ndarray)):
+            errors = np.fromiter(errors, dtype=float)
+        errors = np.asarray(errors, dtype=float).ravel()
+        is_finite = np.isfinite(errors)
+        if not is_finite.all():
+            # NaN and inf have no bin
+            self.n_non_finite += int(errors.size - is_finite.sum())
+            errors = errors[is_finite]
+        if errors.size == 0:
+            return
+        indices = np.ceil((errors - self.min_error) / self.bin_width)
+        indices = np.clip(indices, 0, self.n_bins + 1).astype(np.int64)
+        self.counts += np.bincount(indices, minlength=self.n_bins + 2)
+        chunk_max = float(errors.max())
+        if self.max_observed is None or chunk_max > self.max_observed:
+            self.max_observed = chunk_max
+
+    def extend(self, chunks):
+        r"""
+        Method that adds all the chunks of errors of an iterable to the sketch.
+
+        Parameters
+        ----------
+        chunks : `iterable` of `list` or `ndarray` of `float`
+            The chunks of errors.
+        """
+        for c in chunks:
+            self.update(c)
+
+    def merge(self, other):
+        r"""
+        Method that adds the counts of another sketch to this one.
+
+        Parameters
+        ----------
+        other : `ErrorHistogramSketch`
+            The sketch to merge. It must have the same binning.
+
+        Raises
+        ------
+        ValueError
+            Cannot merge sketches with different binning
+        """
+        if (
+            other.min_error != self.min_error
+            or other.max_error != self.max_error
+            or other.n_bins != self.n_bins
+        ):
+            raise ValueError("Cannot merge sketches with different binning")
+        self.counts += other.counts
+        self.n_non_finite += other.n_non_finite
+        if other.max_observed is not None and (
+            self.max_observed is None or other.max_observed > self.max_observed
+        ):
+            self.max_observed = other.max_observed
+
+    def cumulative_error(self, x_axis):
+        r"""
+        Method that computes the CED of the errors at the provided error
+        values.
+
+        Parameters
+        ----------
+        x_axis : ``(n_bins,)`` `ndarray`
+            The error values at which the CED is evaluated.
+
+        Returns
+        -------
+        ced : ``(n_bins,)`` `ndarray`
+            The proportion of errors that are less or equal to each error value.
+        """
+        x_axis = np.asarray(x_axis, dtype=float)
+        n_errors = self.n_errors
+        if n_errors == 0:
+            return np.zeros(x_axis.shape)
+        cumulative_counts = np.cumsum(self.counts[:-1])
+        # the tolerance absorbs the rounding of error values that lie on a bin
+        # edge, e.g. the values of np.arange(0, 0.1, 0.005)
+        edges = np.floor((x_axis - self.min_error) / self.bin_width + 1e-9)
+        edges = np.clip(edges, -1, self.n_bins).astype(np.int64)
+        ced = np.zeros(x_axis.shape)
+        valid = edges >= 0
+        ced[valid] = cumulative_counts[edges[valid]] / float(n_errors)
+        return ced
+
+
+def area_under_curve_and_failure_rate(x_axis, ced):
+    r"""
+    Function that computes the Area Under the Curve (AUC) and the Failure Rate
+    (FR) of a Cumulative Error Distribution (CED) that was evaluated with
+    :func:`compute_cumulative_error`. The AUC is normalised by the maximum
+    error value of `x_axis`.
+
+    Parameters
+    ----------
+    x_axis : ``(n_bins,)`` `ndarray`
+        The error values at which the CED was evaluated.
+    ced : ``(n_bins,)`` `ndarray`
+        The CED values.
+
+    Returns
+    -------
+    auc : `float`
+        The Area Under the Curve value.
+    fr : `float`
+        The Failure Rate value.
+    """
+    if len(x_axis) == 0:
+        return 0.0, 1.0
+    if len(x_axis) == 1 or x_axis[-1] == 0:
+        return 0.0, 1.0 - ced[-1]
+    # trapezoidal integration of the curve
+    area = np.sum(np.diff(x_axis) * (ced[1:] + ced[:-1]) / 2.0)
+    return area / x_axis[-1], 1.0 - ced[-1]
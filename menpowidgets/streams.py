@@ -0,0 +1,234 @@
+r"""
+Curves whose samples get appended while they are rendered.
+"""
+
+import time
+
+import numpy as np
+
+from .decimation import IncrementalDecimation
+from .utils import _running_loop
+
+
+class CurveStream(object):
+    r"""
+    Growable ring buffers that store the samples of curves which share a
+    horizontal axis and get appended over time, e.g. the training loss and
+    validation error of a running job.
+
+    The buffers double their capacity when full, thus the cost of
+    :meth:`append` is amortised constant. If `max_length` is provided, then the
+    buffers stop growing at that length and the oldest samples get
+    overwritten. Every :meth:`append` calls the redraw function, but at most
+    once every `min_redraw_interval` seconds, so that the cost of rendering
+    does not grow with the rate of appends. The samples that are appended
+    within the interval get rendered by a redraw that is scheduled on the
+    event loop of the kernel, thus the last sample gets rendered once the
+    kernel is idle. If there is no running loop, e.g. outside of a kernel,
+    then :meth:`redraw` needs to be called after the last :meth:`append`.
+
+    If `n_bins` is provided, then the curves are also decimated while they
+    get appended with `menpowidgets.decimation.IncrementalDecimation`, so that
+    :meth:`decimated_values` does not need to process all the samples.
+
+    Parameters
+    ----------
+    n_curves : `int`
+        The number of curves.
+    max_length : `int` or ``None``, optional
+        The maximum number of samples that are kept. If ``None``, then all the
+        samples are kept.
+    min_redraw_interval : `float`, optional
+        The minimum time (in seconds) between two redraws triggered by
+        :meth:`append`.
+    redraw_function : `callable` or ``None``, optional
+        The function that renders the curves. It has no arguments. If ``None``,
+        then nothing is rendered.
+    n_bins : `int` or ``None``, optional
+        The width of the figure in pixels, for which the curves get decimated.
+        If ``None``, then the curves are not decimated.
+
+    Raises
+    ------
+    ValueError
+        n_curves must be a positive integer
+    ValueError
+        max_length must be None or a positive integer
+    """
+
+    def __init__(
+        self,
+        n_curves,
+        max_length=None,
+        min_redraw_interval=0.5,
+        redraw_function=None,
+        n_bins=None,
+    ):
+        if n_curves < 1:
+            raise ValueError("n_curves must be a positive integer")
+        if max_length is not None and max_length < 1:
+            raise ValueError("max_length must be None or a positive integer")
+        self.n_curves = n_curves
+        self.max_length = max_length
+        self.min_redraw_interval = min_redraw_interval
+        self.redraw_function = redraw_function
+        capacity = 1024 if max_length is None else min(1024, max_length)
+        # the first row stores the horizontal values and the rest the curves
+        self._buffer = np.empty((n_curves + 1, capacity))
+        self._start = 0
+        self._length = 0
+        self._n_appended = 0
+        self._n_redrawn = 0
+        self._last_redraw_time = None
+        self._loop = _running_loop()
+        self._flush_is_scheduled = False
+        self._decimation = None
+        self.set_decimation_bins(n_bins)
+
+    def __len__(self):
+        return self._length
+
+    def _grow(self, capacity):
+        buffer = np.empty((self.n_curves + 1, capacity))
+        buffer[:, : self._length] = self.values()
+        self._buffer = buffer
+        self._start = 0
+
+    def append(self, x, y_per_curve):
+        r"""
+        Method that appends a sample to the curves and redraws them, unless
+        they were redrawn less than `min_redraw_interval` seconds ago.
+
+        Parameters
+        ----------
+        x : `float`
+            The horizontal value of the sample.
+        y_per_curve : `list` of `float` or `float`
+            The value of each curve.
+
+        Raises
+        ------
+        ValueError
+            y_per_curve must have one value per curve
+        """
+        y_per_curve = np.asarray(y_per_curve, dtype=float).ravel()
+        if y_per_curve.size != self.n_curves:
+            raise ValueError("y_per_curve must have one value per curve")
+        capacity = self._buffer.shape[1]
+        if self._length == capacity:
+            if self.max_length is None or capacity < self.max_length:
+                new_capacity = 2 * capacity
+                if self.max_length is not None:
+                    new_capacity = min(new_capacity, self.max_length)
+                self._grow(new_capacity)
+                capacity = new_capacity
+            else:
+                # overwrite the oldest sample
+                self._start = (self._start + 1) % capacity
+                self._length -= 1
+        i = (self._start + self._length) % capacity
+        self._buffer[0, i] = x
+        self._buffer[1:, i] = y_per_curve
+        self._length += 1
+        if self._decimation is not None:
+            self._decimation.append(self._n_appended, x, y_per_curve)
+            if self._length < self._n_appended + 1:
+                self._decimation.discard_before(self._n_appended + 1 - self._length)
+        self._n_appended += 1
+
+        # redraw with a capped rate
+        now = time.time()
+        if (
+            self._last_redraw_time is None
+            or now - self._last_redraw_time >= self.min_redraw_interval
+        ):
+            self.redraw()
+        elif not self._flush_is_scheduled and self._loop is not None:
+            # render the samples of this interval, even if no more samples
+            # get appended
+            self._flush_is_scheduled = True
+            if _running_loop() is self._loop:
+                self._schedule_flush()
+            else:
+                self._loop.call_soon_threadsafe(self._schedule_flush)
+
+    def _schedule_flush(self):
+        delay = self._last_redraw_time + self.min_redraw_interval - time.time()
+        self._loop.call_later(max(delay, 0), self.flush)
+
+    def set_decimation_bins(self, n_bins):
+        r"""
+        Method that sets the width of the figure in pixels, for which the
+        curves get decimated. If it changes, then the stored samples get
+        decimated again.
+
+        Parameters
+        ----------
+        n_bins : `int` or ``None``
+            The width of the figure in pixels. If ``None``, then the curves are
+            not decimated.
+        """
+        if n_bins is None:
+            self._decimation = None
+            return
+        n_bins = max(int(n_bins), 1)
+        if self._decimation is not None and self._decimation.n_bins == n_bins:
+            return
+        self._decimation = IncrementalDecimation(self.n_curves, n_bins)
+        self._decimation.extend(self._n_appended - self._length, self.values())
+
+    def values(self):
+        r"""
+        Method that returns the stored samples in the order they were appended.
+
+        Returns
+        -------
+        values : ``(n_curves + 1, n_samples)`` `ndarray`
+            The first row has the horizontal values and each of the rest the
+            values of a curve. It is a view of the buffers, unless the ring
+            buffers have wrapped around.
+        """
+        capacity = self._buffer.shape[1]
+        end = self._start + self._length
+        if end <= capacity:
+            return self._buffer[:, self._start : end]
+        return np.concatenate(
+            [self._buffer[:, self._start :], self._buffer[:, : end - capacity]],
+            axis=1,
+        )
+
+    def decimated_values(self):
+        r"""
+        Method that returns the decimated samples, if the curves are decimated,
+        otherwise all the stored samples, as :meth:`values`.
+
+        Returns
+        -------
+        values : ``(n_curves + 1, n_kept)`` `ndarray`
+            The first row has the horizontal values and each of the rest the
+            values of a curve.
+        """
+        if self._decimation is None:
+            return self.values()
+        return self._decimation.values()
+
+    def redraw(self):
+        r"""
+        Method that calls the redraw function regardless of when the curves were
+        last drawn. It is useful after the last :meth:`append` outside of a
+        kernel, in order to render the samples that were appended after the
+        last redraw.
+        """
+        self._last_redraw_time = time.time()
+        self._n_redrawn = self._n_appended
+        if self.redraw_function is not None:
+            self.redraw_function()
+
+    def flush(self):
+        r"""
+        Method that redraws the curves, if samples have been appended since
+        they were last drawn.
+        """
+        self._flush_is_scheduled = False
+        if self._n_redrawn != self._n_appended:
+            self.redraw()
@@ -0,0 +1,102 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+
+from menpowidgets.decimation import (
+    IncrementalDecimation,
+    decimate_curves,
+    min_max_decimation_indices,
+)
+
+
+def test_min_max_decimation_indices_short_curve():
+    assert_equal(min_max_decimation_indices(np.arange(10.0), 5), np.arange(10))
+
+
+def test_min_max_decimation_indices_keeps_extrema():
+    rng = np.random.RandomState(0)
+    y_axis = rng.randn(1003)
+    indices = min_max_decimation_indices(y_axis, 10)
+    assert len(indices) <= 2 * 11 + 2
+    assert_equal(indices, np.unique(indices))
+    assert indices[0] == 0
+    assert indices[-1] == len(y_axis) - 1
+    assert y_axis.argmin() in indices
+    assert y_axis.argmax() in indices
+    # the extrema of every block are kept
+    block_size = int(np.ceil(len(y_axis) / 10.0))
+    for start in range(0, len(y_axis), block_size):
+        block = y_axis[start : start + block_size]
+        assert start + block.argmin() in indices
+        assert start + block.argmax() in indices
+
+
+def test_min_max_decimation_indices_envelope():
+    x = np.linspace(0, 20 * np.pi, 5000)
+    y_axis = np.sin(x)
+    indices = min_max_decimation_indices(y_axis, 50)
+    assert_allclose(y_axis[indices].min(), y_axis.min())
+    assert_allclose(y_axis[indices].max(), y_axis.max())
+
+
+def test_decimate_curves_shared_axis():
+    x_axis = np.arange(1000.0)
+    rng = np.random.RandomState(0)
+    y_axis = [rng.randn(1000), rng.randn(1000)]
+    x_kept, y_kept = decimate_curves(x_axis, y_axis, 20)
+    assert len(y_kept) == 2
+    for y, y_full in zip(y_kept, y_axis):
+        assert y.shape == x_kept.shape
+        assert_equal(y, y_full[x_kept.astype(int)])
+        assert y.max() == y_full.max()
+
+
+def test_decimate_curves_limits():
+    x_axis = np.arange(1000.0)
+    y_axis = [np.sin(x_axis)]
+    x_kept, _ = decimate_curves(x_axis, y_axis, 20, axes_x_limits=[100, 200])
+    assert x_kept[0] == 99
+    assert x_kept[-1] == 201
+
+
+def test_decimate_curves_no_curves():
+    x_kept, y_kept = decimate_curves(np.arange(10.0), [], 5)
+    assert x_kept.shape == (0,)
+    assert y_kept == []
+
+
+def test_incremental_decimation_matches_extrema():
+    rng = np.random.RandomState(0)
+    n_samples = 5000
+    y_axis = rng.randn(2, n_samples)
+    decimation = IncrementalDecimation(2, 25)
+    for i in range(n_samples):
+        decimation.append(i, float(i), y_axis[:, i])
+    values = decimation.values()
+    assert values.shape[0] == 3
+    assert values.shape[1] <= 4 * 2 * 2 * 25 + 4
+    assert values[0, 0] == 0
+    assert values[0, -1] == n_samples - 1
+    assert_equal(values[0], np.sort(values[0]))
+    assert_allclose(values[1:].min(axis=1), y_axis.min(axis=1))
+    assert_allclose(values[1:].max(axis=1), y_axis.max(axis=1))
+    assert_equal(values[1:], y_axis[:, values[0].astype(int)])
+
+
+def test_incremental_decimation_extend_and_discard():
+    rng = np.random.RandomState(1)
+    n_samples = 3000
+    x = np.arange(n_samples, dtype=float)
+    values = np.vstack([x, rng.randn(n_samples)])
+    decimation = IncrementalDecimation(1, 20)
+    decimation.extend(0, values)
+    kept = decimation.values()
+    assert_allclose(kept[1].max(), values[1].max())
+    assert_allclose(kept[1].min(), values[1].min())
+    decimation.discard_before(1000)
+    kept = decimation.values()
+    assert kept[0, 0] >= 1000
+    assert_allclose(kept[1].max(), values[1, 1000:].max())
+
+
+def test_incremental_decimation_empty():
+    assert IncrementalDecimation(3, 10).values().shape == (4, 0)
@@ -0,0 +1,96 @@
+from pathlib import Path
+
+import numpy as np
+from numpy.testing import assert_equal
+from pytest import raises
+
+from menpo.image import Image, MaskedImage
+from menpo.shape import LabelledPointUndirectedGraph, PointCloud
+
+from menpowidgets.query import ImageIndex
+
+
+def images():
+    a = Image.init_blank((10, 20), n_channels=3)
+    a.path = Path("/data/a.jpg")
+    a.landmarks["PTS"] = PointCloud(np.random.rand(68, 2))
+    b = MaskedImage.init_blank((30, 40))
+    b.path = Path("/data/b.png")
+    b.landmarks["PTS"] = PointCloud(np.random.rand(5, 2))
+    b.landmarks["face"] = LabelledPointUndirectedGraph.init_with_all_label(
+        np.random.rand(4, 2), np.eye(4, dtype=bool)
+    )
+    c = Image.init_blank((50, 60))
+    return [a, b, c]
+
+
+def test_image_index_columns():
+    index = ImageIndex(images())
+    assert index.is_complete
+    assert_equal(index.heights, [10, 30, 50])
+    assert_equal(index.widths, [20, 40, 60])
+    assert_equal(index.n_channels, [3, 1, 1])
+    assert_equal(index.masked, [False, True, False])
+    assert_equal(index.n_groups, [1, 2, 0])
+    assert_equal(index.paths, ["/data/a.jpg", "/data/b.png", ""])
+
+
+def test_image_index_empty_query():
+    assert_equal(ImageIndex(images(), lazy=True).query("  "), [0, 1, 2])
+
+
+def test_image_index_query_columns():
+    index = ImageIndex(images())
+    assert_equal(index.query("n_channels == 1"), [1, 2])
+    assert_equal(index.query("width > 20 and not masked"), [2])
+    assert_equal(index.query("masked | (height * 2 == 20)"), [0, 1])
+    assert_equal(index.query("~masked & (index != 0)"), [2])
+    assert_equal(index.query("20 <= width < 60"), [0, 1])
+    assert_equal(index.query("path == ''"), [2])
+
+
+def test_image_index_query_functions():
+    index = ImageIndex(images())
+    assert_equal(index.query("has('PTS')"), [0, 1])
+    assert_equal(index.query("not has('face')"), [0, 2])
+    assert_equal(index.query("n_points('PTS') != 68"), [1, 2])
+    assert_equal(index.query("n_points('missing') == -1"), [0, 1, 2])
+    assert_equal(index.query("has_label('face', 'all')"), [1])
+    assert_equal(index.query("has_label('PTS', 'all')"), [])
+    assert_equal(index.query("matches('*.jpg') or matches('*.png')"), [0, 1])
+
+
+def test_image_index_lazy():
+    index = ImageIndex(images(), lazy=True)
+    assert not index.is_started
+    assert_equal(index.query("width > 30"), [1, 2])
+    assert index.is_complete
+
+
+def test_image_index_invalid_queries_raise():
+    index = ImageIndex(images())
+    invalid_queries = [
+        "width >",
+        "x == 1",
+        "width + 1",
+        "width > 'a'",
+        "has(1)",
+        "has('PTS', 'a', 'b')",
+        "__import__('os')",
+        "images[0]",
+        "width.real > 0",
+        "[1, 2]",
+    ]
+    for query in invalid_queries:
+        with raises(ValueError):
+            index.query(query)
+
+
+def test_image_index_error_messages():
+    index = ImageIndex(images())
+    with raises(ValueError, match="Unknown column 'x'"):
+        index.query("x == 1")
+    with raises(ValueError, match="must be a condition"):
+        index.query("width")
+    with raises(ValueError, match="must be strings"):
+        index.query("has(1)")
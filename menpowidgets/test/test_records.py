@@ -0,0 +1,65 @@
+import pickle
+
+from pytest import raises
+
+from menpowidgets.records import OptionsRecord, freeze_options, thaw_options
+
+
+def options():
+    return {
+        "lines": {"render_lines": True, "line_colour": ["red", "blue"]},
+        "markers": {"marker_size": 5},
+        "zoom": [1.0, 1.0],
+        "limits": (0.0, 1.0),
+    }
+
+
+def test_options_record_equality_and_hash():
+    a = OptionsRecord(options())
+    b = OptionsRecord(options())
+    assert a == b
+    assert not a != b
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+
+
+def test_options_record_nested_change():
+    a = OptionsRecord(options())
+    changed = options()
+    changed["lines"]["line_colour"][1] = "green"
+    b = OptionsRecord(changed)
+    assert a != b
+    assert a.diff(b) == ("lines",)
+
+
+def test_options_record_list_differs_from_tuple():
+    assert freeze_options([1, 2]) != freeze_options((1, 2))
+    assert OptionsRecord({"a": [1, 2]}) != OptionsRecord({"a": (1, 2)})
+
+
+def test_options_record_diff():
+    a = OptionsRecord(options())
+    assert a.diff(None) == tuple(options().keys())
+    assert a.diff(a) == ()
+    b = OptionsRecord(dict(options(), zoom=[2.0, 2.0], extra=1))
+    assert set(a.diff(b)) == {"zoom", "extra"}
+
+
+def test_options_record_to_dict():
+    record = OptionsRecord(options())
+    assert record.to_dict() == options()
+    assert thaw_options(freeze_options(options())) == options()
+    assert record["lines"]["line_colour"] == freeze_options(["red", "blue"])
+
+
+def test_options_record_is_immutable():
+    record = OptionsRecord(options())
+    with raises(AttributeError):
+        record.lines = None
+    with raises(TypeError):
+        record["zoom"] = 2.0
+
+
+def test_options_record_pickle():
+    record = OptionsRecord(options())
+    assert pickle.loads(pickle.dumps(record)) == record
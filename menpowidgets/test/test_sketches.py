@@ -0,0 +1,138 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+from pytest import raises
+
+from menpowidgets.sketches import (
+    ErrorHistogramSketch,
+    area_under_curve_and_failure_rate,
+    compute_cumulative_error,
+)
+
+
+def test_compute_cumulative_error():
+    errors = np.array([0.1, 0.2, 0.2, 0.4])
+    x_axis = np.array([0.0, 0.1, 0.2, 0.3, 0.4, 0.5])
+    ced = compute_cumulative_error(errors, x_axis)
+    assert_allclose(ced, [0.0, 0.25, 0.75, 0.75, 1.0, 1.0])
+
+
+def test_compute_cumulative_error_empty():
+    ced = compute_cumulative_error(np.array([]), np.linspace(0, 1, 5))
+    assert_equal(ced, np.zeros(5))
+
+
+def test_compute_cumulative_error_non_finite_are_failures():
+    errors = np.sort(np.array([0.1, np.inf, np.nan, 0.3]))
+    ced = compute_cumulative_error(errors, np.array([0.5]))
+    assert_allclose(ced, [0.5])
+
+
+def test_area_under_curve_and_failure_rate():
+    x_axis = np.array([0.0, 0.5, 1.0])
+    ced = np.array([0.0, 0.5, 1.0])
+    auc, fr = area_under_curve_and_failure_rate(x_axis, ced)
+    assert_allclose(auc, 0.5)
+    assert_allclose(fr, 0.0)
+
+
+def test_area_under_curve_and_failure_rate_partial():
+    x_axis = np.array([0.0, 1.0, 2.0])
+    ced = np.array([0.0, 0.5, 0.5])
+    auc, fr = area_under_curve_and_failure_rate(x_axis, ced)
+    assert_allclose(auc, (0.25 + 0.5) / 2.0)
+    assert_allclose(fr, 0.5)
+
+
+def test_area_under_curve_and_failure_rate_empty():
+    assert area_under_curve_and_failure_rate(np.array([]), np.array([])) == (
+        0.0,
+        1.0,
+    )
+
+
+def test_area_under_curve_and_failure_rate_single_value():
+    auc, fr = area_under_curve_and_failure_rate(np.array([0.1]), np.array([0.75]))
+    assert auc == 0.0
+    assert_allclose(fr, 0.25)
+
+
+def test_error_histogram_sketch_exact_at_bin_edges():
+    rng = np.random.RandomState(0)
+    errors = rng.uniform(0, 0.1, size=1000)
+    x_axis = np.arange(0, 0.1 + 1e-12, 0.005)
+    sketch = ErrorHistogramSketch(0.1, n_bins=20)
+    sketch.update(errors)
+    expected = compute_cumulative_error(np.sort(errors), x_axis)
+    assert_allclose(sketch.cumulative_error(x_axis), expected)
+    assert sketch.n_errors == 1000
+    assert_allclose(sketch.max_observed, errors.max())
+
+
+def test_error_histogram_sketch_within_one_bin():
+    rng = np.random.RandomState(1)
+    errors = rng.uniform(0, 0.2, size=500)
+    sketch = ErrorHistogramSketch(0.1, n_bins=100)
+    sketch.update(errors)
+    x_axis = np.linspace(0, 0.1, 37)
+    ced = sketch.cumulative_error(x_axis)
+    sorted_errors = np.sort(errors)
+    upper = compute_cumulative_error(sorted_errors, x_axis)
+    lower = compute_cumulative_error(sorted_errors, x_axis - sketch.bin_width)
+    assert np.all(ced <= upper + 1e-12)
+    assert np.all(ced >= lower - 1e-12)
+
+
+def test_error_histogram_sketch_chunks():
+    chunks = [[0.01, 0.02], np.array([0.03, 0.5]), (e for e in [0.04])]
+    sketch = ErrorHistogramSketch.from_chunks(chunks, 0.1, n_bins=10)
+    assert sketch.n_errors == 5
+    assert sketch.max_observed == 0.5
+    # errors greater than max_error are only failures
+    assert_allclose(sketch.cumulative_error([0.1, 1.0]), [0.8, 0.8])
+
+
+def test_error_histogram_sketch_non_finite():
+    sketch = ErrorHistogramSketch(0.1, n_bins=10)
+    sketch.update([0.01, np.nan, np.inf, 0.02])
+    assert sketch.n_non_finite == 2
+    assert sketch.n_errors == 4
+    assert sketch.max_observed == 0.02
+    assert_allclose(sketch.cumulative_error([0.1]), [0.5])
+
+
+def test_error_histogram_sketch_empty():
+    sketch = ErrorHistogramSketch(0.1)
+    assert sketch.n_errors == 0
+    assert sketch.max_observed is None
+    assert_equal(sketch.cumulative_error([0.0, 0.1]), [0.0, 0.0])
+
+
+def test_error_histogram_sketch_merge():
+    a = ErrorHistogramSketch(0.1, n_bins=10)
+    a.update([0.01, 0.05, np.nan])
+    b = ErrorHistogramSketch(0.1, n_bins=10)
+    b.update([0.09, 0.2])
+    a.merge(b)
+    full = ErrorHistogramSketch(0.1, n_bins=10)
+    full.update([0.01, 0.05, np.nan, 0.09, 0.2])
+    assert_equal(a.counts, full.counts)
+    assert a.n_non_finite == 1
+    assert a.n_errors == 5
+    assert a.max_observed == 0.2
+
+
+def test_error_histogram_sketch_merge_different_binning_raises():
+    a = ErrorHistogramSketch(0.1, n_bins=10)
+    with raises(ValueError):
+        a.merge(ErrorHistogramSketch(0.1, n_bins=20))
+    with raises(ValueError):
+        a.merge(ErrorHistogramSketch(0.2, n_bins=10))
+
+
+def test_error_histogram_sketch_invalid_arguments_raise():
+    with raises(ValueError):
+        ErrorHistogramSketch(0.0)
+    with raises(ValueError):
+        ErrorHistogramSketch(0.1, min_error=0.2)
+    with raises(ValueError):
+        ErrorHistogramSketch(0.1, n_bins=0)
@@ -0,0 +1,24 @@
+from numpy.testing import assert_equal
+from pytest import raises
+
+from menpowidgets.utils import label_indices
+
+
+def test_label_indices():
+    labels = ["mouth", "jaw", "nose", "eye"]
+    assert_equal(label_indices(labels, ["nose", "mouth"]), [2, 0])
+    assert_equal(label_indices(labels, labels), [0, 1, 2, 3])
+
+
+def test_label_indices_empty_selection():
+    assert len(label_indices(["a", "b"], [])) == 0
+    assert len(label_indices([], [])) == 0
+
+
+def test_label_indices_unknown_label_raises():
+    with raises(ValueError):
+        label_indices(["a", "b"], ["c"])
+    with raises(ValueError):
+        label_indices(["b", "d"], ["c"])
+    with raises(ValueError):
+        label_indices([], ["a"])
@@ -1,6 +1,6 @@
 from collections import OrderedDict
 import ipywidgets
-from traitlets.traitlets import List, Int, Float, Dict, Bool, Unicode
+from traitlets.traitlets import List, Int, Float, Dict, Bool, Unicode, Any
 from traitlets import link, dlink
 from PIL import Image as PILImage
 from io import BytesIO
@@ -19,6 +19,7 @@ from .utils import (
     parse_int_range_command,
     parse_float_range_command,
 )
+from .montage import render_montage
 
 # Global variables to try and reduce overhead of loading the logo
 MENPO_MINIMAL_LOGO = None
@@ -375,6 +376,12 @@ class MultipleSelectionTogglesWidget(MenpoWidget):
     r"""
     Creates a widget for selecting multiple binary flags from toggle buttons.
 
+    If there are more labels than `page_size`, then only one page of toggle
+    buttons is created and the labels are browsed with a search field and
+    previous/next page buttons. The selection is stored per label, so the cost
+    of creating and updating the widget does not depend on the number of
+    labels.
+
     Parameters
     ----------
     labels : `list`
@@ -392,6 +399,8 @@ class MultipleSelectionTogglesWidget(MenpoWidget):
         If ``None``, then nothing is assigned.
     buttons_style : `str`, optional
         The style of the buttons.
+    page_size : `int`, optional
+        The maximum number of toggle buttons that are shown at once.
     """
 
     def __init__(
@@ -402,6 +411,7 @@ class MultipleSelectionTogglesWidget(MenpoWidget):
         allow_no_selection=False,
         render_function=None,
         buttons_style="",
+        page_size=50,
     ):
         # Check with labels
         if with_labels is None or len(with_labels) == 0:
@@ -410,22 +420,53 @@ class MultipleSelectionTogglesWidget(MenpoWidget):
         # Create children
         self.labels_title = ipywidgets.HTML(value=description)
         self.labels_toggles = []
-        for l in labels:
-            layout = ipywidgets.Layout(width="{}px".format((len(l) + 2) * 9))
-            self.labels_toggles.append(
-                ipywidgets.ToggleButton(
-                    description=l,
-                    value=l in with_labels,
-                    layout=layout,
-                    button_style=buttons_style,
-                )
-            )
-
-        # Group widget
-        self.box_1 = ipywidgets.HBox(self.labels_toggles)
+        self.box_1 = ipywidgets.HBox()
         self.box_1.layout.flex_flow = "row wrap"
         self.box_1.layout.align_items = "center"
-        self.container = ipywidgets.HBox([self.labels_title, self.box_1])
+        self.search_text = ipywidgets.Text(
+            value="",
+            placeholder="Search labels",
+            continuous_update=True,
+            layout=ipywidgets.Layout(width="5cm"),
+        )
+        self.previous_page_button = ipywidgets.Button(
+            icon="chevron-left",
+            description="",
+            tooltip="Previous labels",
+            layout=ipywidgets.Layout(width="40px"),
+        )
+        self.next_page_button = ipywidgets.Button(
+            icon="chevron-right",
+            description="",
+            tooltip="Next labels",
+            layout=ipywidgets.Layout(width="40px"),
+        )
+        self.select_all_button = ipywidgets.Button(
+            description="All",
+            tooltip="Select the matching labels",
+            layout=ipywidgets.Layout(width="50px"),
+        )
+        self.select_none_button = ipywidgets.Button(
+            description="None",
+            tooltip="Deselect the matching labels",
+            layout=ipywidgets.Layout(width="50px"),
+        )
+        self.page_text = ipywidgets.HTML()
+        self.pages_box = ipywidgets.HBox(
+            [
+                self.search_text,
+                self.previous_page_button,
+                self.next_page_button,
+                self.page_text,
+                self.select_all_button,
+                self.select_none_button,
+            ]
+        )
+        self.pages_box.layout.align_items = "center"
+
+        # Group widget
+        self.box_2 = ipywidgets.VBox([self.pages_box, self.box_1])
+        self.container = ipywidgets.HBox([self.labels_title, self.box_2])
         self.container.layout.align_items = "center"
 
         # Create final widget
@@ -434,24 +475,108 @@ class MultipleSelectionTogglesWidget(MenpoWidget):
         )
 
         # Set property
-        self.labels = labels
         self.buttons_style = buttons_style
         self.allow_no_selection = allow_no_selection
+        self.page_size = page_size
+        self.n_shown_toggles = 0
+        self._set_labels(labels, with_labels)
 
         # Set functionality
-        for w in self.labels_toggles:
-            w.observe(self._save_options, names="value", type="change")
-
-    def _save_options(self, _):
-        value = [w.description for w in self.labels_toggles if w.value]
-        if not self.allow_no_selection and len(value) == 0:
-            value = []
+        self.search_text.observe(self._search, names="value", type="change")
+        self.previous_page_button.on_click(lambda _: self._show_page(self.page - 1))
+        self.next_page_button.on_click(lambda _: self._show_page(self.page + 1))
+        self.select_all_button.on_click(lambda _: self._select_matching(True))
+        self.select_none_button.on_click(lambda _: self._select_matching(False))
+
+    def _set_labels(self, labels, with_labels):
+        # The selection flag of each label and the indices of the labels that
+        # match the search
+        self.labels = labels
+        self.selected_mask = self._selection_mask(with_labels)
+        self.matching = np.arange(len(labels))
+        # Create one page of toggle buttons
+        n_toggles = min(len(labels), self.page_size)
+        if n_toggles != len(self.labels_toggles):
             for w in self.labels_toggles:
                 w.unobserve(self._save_options, names="value", type="change")
-                w.value = True
+            self.labels_toggles = [
+                ipywidgets.ToggleButton(button_style=self.buttons_style)
+                for _ in range(n_toggles)
+            ]
+            for w in self.labels_toggles:
                 w.observe(self._save_options, names="value", type="change")
-                value.append(w.description)
-        self.selected_values = value
+            self.box_1.children = self.labels_toggles
+            self.n_shown_toggles = n_toggles
+        self.pages_box.layout.display = (
+            "flex" if len(labels) > self.page_size else "none"
+        )
+        self.search_text.unobserve(self._search, names="value", type="change")
+        self.search_text.value = ""
+        self.search_text.observe(self._search, names="value", type="change")
+        self._show_page(0)
+
+    def _selection_mask(self, with_labels):
+        with_labels = set(with_labels)
+        return np.fromiter(
+            (l in with_labels for l in self.labels), dtype=bool, count=len(self.labels)
+        )
+
+    def _show_page(self, page):
+        # Assign the labels of the page to the toggle buttons
+        n_pages = max(int(np.ceil(len(self.matching) / float(self.page_size))), 1)
+        self.page = min(max(page, 0), n_pages - 1)
+        start = self.page * self.page_size
+        self.page_indices = self.matching[start : start + self.page_size]
+        for k, w in enumerate(self.labels_toggles):
+            w.unobserve(self._save_options, names="value", type="change")
+            if k < len(self.page_indices):
+                l = self.labels[self.page_indices[k]]
+                w.description = l
+                w.value = bool(self.selected_mask[self.page_indices[k]])
+                w.layout.width = "{}px".format((len(l) + 2) * 9)
+                # only show the toggles that were hidden by a shorter page,
+                # so that toggles hidden by the owner widget remain hidden
+                if k >= self.n_shown_toggles:
+                    w.layout.display = "flex"
+            else:
+                w.layout.display = "none"
+            w.observe(self._save_options, names="value", type="change")
+        self.n_shown_toggles = len(self.page_indices)
+        self.previous_page_button.disabled = self.page == 0
+        self.next_page_button.disabled = self.page == n_pages - 1
+        self.page_text.value = "{}-{} of {}".format(
+            start + 1 if len(self.page_indices) > 0 else 0,
+            start + len(self.page_indices),
+            len(self.matching),
+        )
+
+    def _search(self, change):
+        query = change["new"].strip().lower()
+        if len(query) == 0:
+            self.matching = np.arange(len(self.labels))
+        else:
+            self.matching = np.array(
+                [k for k, l in enumerate(self.labels) if query in l.lower()], dtype=int
+            )
+        self._show_page(0)
+
+    def _select_matching(self, value):
+        self.selected_mask[self.matching] = value
+        self._save_selection()
+        self._show_page(self.page)
+
+    def _save_options(self, change):
+        k = self.labels_toggles.index(change["owner"])
+        self.selected_mask[self.page_indices[k]] = change["new"]
+        self._save_selection()
+
+    def _save_selection(self):
+        if not self.allow_no_selection and not self.selected_mask.any():
+            self.selected_mask[:] = True
+            self._show_page(self.page)
+        self.selected_values = [
+            self.labels[k] for k in np.flatnonzero(self.selected_mask)
+        ]
 
     def set_widget_state(self, labels, with_labels=None, allow_callback=True):
         r"""
@@ -478,10 +603,8 @@ class MultipleSelectionTogglesWidget(MenpoWidget):
         # Update widget
         if set(labels) == set(self.labels):
             if set(with_labels) != set(self.selected_values):
-                for w in self.labels_toggles:
-                    w.unobserve(self._save_options, names="value", type="change")
-                    w.value = w.description in with_labels
-                    w.observe(self._save_options, names="value", type="change")
+                self.selected_mask = self._selection_mask(with_labels)
+                self._show_page(self.page)
 
                 # temporarily remove render callback
                 render_function = self._render_function
@@ -494,20 +617,8 @@ class MultipleSelectionTogglesWidget(MenpoWidget):
                 self.add_render_function(render_function)
         else:
             self.box_1.layout.visibility = "hidden"
-            self.labels_toggles = []
-            for l in labels:
-                layout = ipywidgets.Layout(width="{}px".format((len(l) + 2) * 9))
-                w = ipywidgets.ToggleButton(
-                    description=l,
-                    value=l in with_labels,
-                    layout=layout,
-                    button_style=self.buttons_style,
-                )
-                w.observe(self._save_options, names="value", type="change")
-                self.labels_toggles.append(w)
-            self.box_1.children = self.labels_toggles
+            self._set_labels(labels, with_labels)
             self.box_1.layout.visibility = "visible"
-            self.labels = labels
 
             # temporarily remove render callback
             render_function = self._render_function
@@ -656,7 +767,7 @@ class SlicingCommandWidget(MenpoWidget):
 
         # Create final widget
         super(SlicingCommandWidget, self).__init__(
-            [self.container], List, indices, render_function=render_function
+            [self.container], Any, indices, render_function=render_function
         )
 
         # Assign properties
@@ -667,37 +778,34 @@ class SlicingCommandWidget(MenpoWidget):
             self.error_msg.value = ""
             self.error_msg.layout.display = "none"
             try:
-                self.selected_values = parse_slicing_command(
-                    str(self.cmd_text.value), self.length
-                )
+                # the parsed indices are kept lazy, e.g. as a range
+                indices = parse_slicing_command(str(self.cmd_text.value), self.length)
+                self.selected_values = indices
                 self.state_icon.value = (
                     '<i class="fa fa-check" style="color:green"></i>'
                 )
 
                 # set single slider visibility and value
-                vis = self._single_slider_visible(self.selected_values)
+                vis = self._single_slider_visible(indices)
                 self.single_slider.layout.display = vis
                 if vis == "inline":
                     self.single_slider.unobserve(
                         single_slider_value, names="value", type="change"
                     )
-                    self.single_slider.value = self.selected_values[0]
+                    self.single_slider.value = indices[0]
                     self.single_slider.observe(
                         single_slider_value, names="value", type="change"
                     )
 
                 # set multiple slider visibility and value
-                vis, step = self._multiple_slider_visible(self.selected_values)
+                vis, step = self._multiple_slider_visible(indices)
                 self.multiple_slider.layout.display = vis
                 if vis == "inline":
                     self.multiple_slider.step = step
                     self.multiple_slider.unobserve(
                         multiple_slider_value, names="value", type="change"
                     )
-                    self.multiple_slider.value = (
-                        self.selected_values[0],
-                        self.selected_values[-1],
-                    )
+                    self.multiple_slider.value = (indices[0], indices[-1])
                     self.multiple_slider.observe(
                         multiple_slider_value, names="value", type="change"
                     )
@@ -722,8 +830,8 @@ class SlicingCommandWidget(MenpoWidget):
 
         def multiple_slider_value(change):
             value = change["new"]
-            self.selected_values = list(
-                range(value[0], value[1] + 1, self.multiple_slider.step)
+            self.selected_values = range(
+                value[0], value[1] + 1, self.multiple_slider.step
             )
             self.cmd_text.value = "{}:{}:{}".format(
                 value[0], value[1] + 1, self.multiple_slider.step
@@ -797,22 +905,19 @@ class SlicingCommandWidget(MenpoWidget):
         self.selected_values = indices
 
         # update single slider
-        vis = self._single_slider_visible(self.selected_values)
+        vis = self._single_slider_visible(indices)
         self.single_slider.layout.display = vis
         self.single_slider.max = self.length - 1
         if vis == "inline":
-            self.single_slider.value = self.selected_values[0]
+            self.single_slider.value = indices[0]
 
         # update multiple slider
-        vis, step = self._multiple_slider_visible(self.selected_values)
+        vis, step = self._multiple_slider_visible(indices)
         self.multiple_slider.layout.display = vis
         self.multiple_slider.max = self.length - 1
         if vis == "inline":
             self.multiple_slider.step = step
-            self.multiple_slider.value = (
-                self.selected_values[0],
-                self.selected_values[-1],
-            )
+            self.multiple_slider.value = (indices[0], indices[-1])
 
         # update command text
         self.cmd_text.value = slice_options["command"]
@@ -1252,6 +1357,7 @@ class ColourSelectionWidget(MenpoWidget):
             tmp[idx] = str(self.colour_widget.value)
             self.selected_values = tmp
 
+        self._save_colour = save_colour
         self.colour_widget.observe(save_colour, names="value", type="change")
 
     def set_widget_state(self, colours_list, labels=None, allow_callback=True):
@@ -1387,14 +1493,12 @@ class ColourSelectionWidget(MenpoWidget):
         render_fun = self._render_function
         self.remove_render_function()
 
-        # Keep previously selected label
-        previous_value = self.label_dropdown.value
-        for k, c in enumerate(colours_list):
-            self.label_dropdown.value = k
-            self.colour_widget.value = c
-
-        # Select previous label
-        self.label_dropdown.value = previous_value
+        # Assign all the colours at once and show the colour of the selected
+        # label (the colour picker callback would copy the whole list per label)
+        self.colour_widget.unobserve(self._save_colour, names="value", type="change")
+        self.selected_values = [str(c) for c in colours_list]
+        self.colour_widget.value = self.selected_values[self.label_dropdown.value]
+        self.colour_widget.observe(self._save_colour, names="value", type="change")
 
         # Add render function
         self.add_render_function(render_fun)
@@ -4672,6 +4776,280 @@ class GridOptionsWidget(MenpoWidget):
                 self.call_render_function(old_value, self.selected_values)
 
 
+class ImageFilterWidget(MenpoWidget):
+    r"""
+    Creates a widget for filtering a `list` of images with a query over their
+    metadata (see `menpowidgets.query.ImageIndex.query`). The applied query is
+    the `selected_values` and the indices of the matching images are stored
+    in `indices`. A query that is invalid or matches no image is reported and
+    not applied. The first query starts the indexing of a lazy index. While
+    the images are being indexed, a query only matches the indexed ones and
+    the status reports the indexing progress.
+
+    Parameters
+    ----------
+    image_index : `menpowidgets.query.ImageIndex`
+        The metadata index of the images.
+    render_function : `callable` or ``None``, optional
+        The render function that is executed when a query gets applied.
+        If ``None``, then nothing is assigned.
+    description : `str`, optional
+        The description of the query text box.
+    width : `int`, optional
+        The width of the query text box in pixels.
+    """
+
+    def __init__(
+        self, image_index, render_function=None, description="Filter", width=260
+    ):
+        # Create children
+        self.query_description = ipywidgets.HTML(value=description)
+        self.query_text = ipywidgets.Text(
+            value="",
+            placeholder="e.g. n_channels == 1 and not has('PTS')",
+            continuous_update=False,
+            layout=ipywidgets.Layout(width="{}px".format(width)),
+        )
+        self.status = ipywidgets.HTML(value="")
+        self.container = ipywidgets.HBox(
+            [self.query_description, self.query_text, self.status]
+        )
+        self.container.layout.align_items = "center"
+
+        # Create final widget
+        super(ImageFilterWidget, self).__init__(
+            [self.container], Unicode, "", render_function=render_function
+        )
+
+        # Assign properties
+        self.image_index = image_index
+        self.indices = np.arange(image_index.n_images)
+        self._set_status()
+        image_index.add_done_callback(self._set_status)
+
+        # Set functionality
+        def apply_query(change):
+            try:
+                indices = self.image_index.query(change["new"])
+                if len(indices) == 0:
+                    if not self.image_index.is_complete:
+                        raise ValueError(
+                            "No images match yet ({} of {} indexed)".format(
+                                self.image_index.n_indexed, self.image_index.n_images
+                            )
+                        )
+                    raise ValueError("No images match")
+            except ValueError as e:
+                self.status.value = (
+                    '<i class="fa fa-times" style="color:red"></i> '
+                    '<em style="color:#FF0000">{}</em>'.format(e)
+                )
+                return
+            self.indices = indices
+            self._set_status()
+            self.selected_values = change["new"]
+
+        self.query_text.observe(apply_query, names="value", type="change")
+
+    def _set_status(self):
+        status = "{} of {}".format(len(self.indices), self.image_index.n_images)
+        if self.image_index.is_started and not self.image_index.is_complete:
+            status += " ({} indexed)".format(self.image_index.n_indexed)
+        self.status.value = "<em>{}</em>".format(status)
+
+
+class MontageWidget(MenpoWidget):
+    r"""
+    Creates a widget that shows the montage page of an item, i.e. the page of
+    thumbnails that includes it (see `menpowidgets.montage.MontagePages`). The
+    pages are rendered with `menpowidgets.montage.render_montage` and the
+    neighbouring pages get composed in the background. Clicking on a tile sets
+    its item index to the `selected_values`.
+
+    Parameters
+    ----------
+    pages : `menpowidgets.montage.MontagePages`
+        The montage pages.
+    render_function : `callable` or ``None``, optional
+        The render function that is executed when a tile gets clicked.
+        If ``None``, then nothing is assigned.
+    figure_width : `float`, optional
+        The width of the rendered pages in inches.
+    marker_size : `float`, optional
+        The size of the markers of the overlaid points.
+    marker_colour : `str`, optional
+        The colour of the markers of the overlaid points.
+    """
+
+    def __init__(
+        self,
+        pages,
+        render_function=None,
+        figure_width=7,
+        marker_size=10,
+        marker_colour="red",
+    ):
+        from ipyevents import Event
+
+        # Create children
+        self.page_text = ipywidgets.HTML(value="")
+        self.image_wid = ipywidgets.Image(format="png")
+        self.container = ipywidgets.VBox([self.page_text, self.image_wid])
+        self.container.layout.align_items = "center"
+
+        # Create final widget
+        super(MontageWidget, self).__init__(
+            [self.container], Int, -1, render_function=render_function
+        )
+
+        # Assign properties
+        self.pages = pages
+        self.figure_width = figure_width
+        self.marker_size = marker_size
+        self.marker_colour = marker_colour
+        self.page = None
+        self.figure = None
+        self.key = None
+
+        # Set functionality
+        self.click_events = Event(source=self.image_wid, watched_events=["click"])
+        self.click_events.on_dom_event(self._select_tile)
+
+    def _select_tile(self, event):
+        if self.page is None:
+            return
+        # The atlas fills the figure, thus the image pixels only get scaled
+        atlas_width = self.pages.grid_shape[1] * self.pages.tile_shape[1]
+        scale = atlas_width / float(self.figure.bbox.width)
+        index = self.pages.index_at(
+            self.page, event["dataX"] * scale, event["dataY"] * scale
+        )
+        if index is not None:
+            self.selected_values = index
+
+    def link_index_widget(self, index_wid, render_function):
+        r"""
+        Method that links the montage to the widget that selects the item
+        index of a browsing widget and creates the ``Grid`` toggle of the grid
+        mode. In grid mode, the index widget moves by pages. Clicking on a tile
+        turns the grid mode off and selects the clicked item.
+
+        Parameters
+        ----------
+        index_wid : `menpowidgets.options.AnimationOptionsWidget`
+            The widget that selects the item index.
+        render_function : `callable`
+            The render function of the browsing widget. It is called when the
+            grid mode gets toggled and when the clicked item is the selected
+            one.
+
+        Returns
+        -------
+        grid_switch : `SwitchWidget`
+            The toggle of the grid mode. It is also stored in
+            `self.grid_switch`.
+        """
+        self.index_wid = index_wid
+        self.grid_render_function = render_function
+        self.grid_switch = SwitchWidget(
+            False,
+            description="Grid",
+            switch_type="toggle",
+            render_function=self._toggle_grid,
+        )
+        self.grid_switch.layout.margin = "0px 0px 0px 10px"
+        self.replace_render_function(self._select_item)
+        return self.grid_switch
+
+    def set_index(self, index, allow_callback=True):
+        r"""
+        Method that selects an item in the linked index widget (see
+        :meth:`link_index_widget`), with the number of items of the current
+        pages and a step of a page in grid mode.
+
+        Parameters
+        ----------
+        index : `int`
+            The index of the item.
+        allow_callback : `bool`, optional
+            If ``True``, it allows triggering of any callback functions.
+        """
+        step = self.pages.page_size if self.grid_switch.selected_values else 1
+        self.index_wid.set_widget_state(
+            {"min": 0, "max": self.pages.n_items - 1, "step": step, "index": index},
+            allow_callback=allow_callback,
+        )
+
+    def _toggle_grid(self, change):
+        self.set_index(self.index_wid.selected_values, allow_callback=False)
+        self.grid_render_function({})
+
+    def _select_item(self, change):
+        self.grid_switch.set_widget_state(False, allow_callback=False)
+        if change["new"] == self.index_wid.selected_values:
+            self.set_index(change["new"], allow_callback=False)
+            self.grid_render_function({})
+        else:
+            self.set_index(change["new"])
+
+    def set_pages(self, pages):
+        r"""
+        Method that replaces the montage pages, e.g. after the browsed items
+        have been filtered.
+
+        Parameters
+        ----------
+        pages : `menpowidgets.montage.MontagePages`
+            The montage pages.
+        """
+        self.pages.clear()
+        self.pages = pages
+        self.page = None
+
+    def show(self, index, key=None):
+        r"""
+        Method that shows the page of an item and composes its neighbouring
+        pages in the background.
+
+        Parameters
+        ----------
+        index : `int`
+            The index of the item.
+        key : `hashable` or ``None``, optional
+            The options that the tiles depend on. If they are different than
+            the ones of the previous call, then the cached pages are dropped.
+        """
+        if key != self.key:
+            self.pages.clear()
+            self.page = None
+            self.key = key
+        page = self.pages.page_of(index)
+        if page != self.page:
+            atlas, points = self.pages.get(page)
+            self.figure = render_montage(
+                atlas,
+                points,
+                figure_width=self.figure_width,
+                marker_size=self.marker_size,
+                marker_colour=self.marker_colour,
+            )
+            buffer = BytesIO()
+            self.figure.savefig(buffer, format="png", dpi=self.figure.dpi)
+            self.image_wid.value = buffer.getvalue()
+            indices = self.pages.page_indices(page)
+            self.page_text.value = "Page {} of {} (items {}-{})".format(
+                page + 1, self.pages.n_pages, indices[0], indices[-1]
+            )
+            self.page = page
+        self.pages.prefetch([page + 1, page - 1])
+
+        # reset the selection, so that the same tile can be clicked again
+        render_function = self._render_function
+        self.remove_render_function()
+        self.selected_values = -1
+        self.add_render_function(render_function)
+
+
 class CameraWidget(ipywidgets.DOMWidget):
     r"""
     Creates a webcam widget.
@@ -4718,6 +5096,141 @@ class CameraWidget(ipywidgets.DOMWidget):
         self.snapshots.append(Image.init_from_channels_at_back(np.array(im)[..., :3]))
 
 
+class MeshViewWidget(ipywidgets.DOMWidget):
+    r"""
+    Creates a widget that renders a 3D mesh, point graph or point cloud in the
+    browser with WebGL, as an alternative to Mayavi. The vertices, triangles,
+    edges and per-vertex colours are sent to the browser as binary
+    ``float32``/``uint32`` buffers and the camera (rotation with mouse drag,
+    zoom with mouse wheel) is handled client-side. Every call to
+    :meth:`set_mesh` only sends the buffers that changed since the previous
+    call, e.g. only the vertices when the shape of a model instance changes.
+
+    Parameters
+    ----------
+    width : `int`, optional
+        The width of the canvas in pixels.
+    height : `int`, optional
+        The height of the canvas in pixels.
+    """
+
+    _view_name = Unicode("MeshView").tag(sync=True)
+    _view_module = Unicode("meshview").tag(sync=True)
+    width = Int(640).tag(sync=True)
+    height = Int(480).tag(sync=True)
+    mesh_type = Unicode("surface").tag(sync=True)
+    colour = Unicode("red").tag(sync=True)
+    alpha = Float(1.0).tag(sync=True)
+    point_size = Float(4.0).tag(sync=True)
+    render_colours = Bool(True).tag(sync=True)
+
+    # The names and dtypes of the sent buffers
+    buffer_dtypes = OrderedDict(
+        [
+            ("points", np.float32),
+            ("trilist", np.uint32),
+            ("edges", np.uint32),
+            ("colours", np.float32),
+        ]
+    )
+    javascript_exported = False
+
+    def __init__(self, width=640, height=480):
+        # Publish javascript - only occurs once on construction of first
+        # mesh view widget
+        if not MeshViewWidget.javascript_exported:
+            import os.path
+            from pathlib import Path
+            from IPython.display import display, Javascript
+
+            menpowidgets_path = Path(os.path.abspath(__file__)).parent
+            with open(str(menpowidgets_path / "js" / "meshview.js"), "r") as f:
+                display(Javascript(data=f.read()))
+            MeshViewWidget.javascript_exported = True
+
+        super(MeshViewWidget, self).__init__()
+        self.width = width
+        self.height = height
+        # The last sent array per buffer name
+        self.arrays = {}
+        self.on_msg(self._handle_message)
+
+    def mesh_message(self, points, trilist=None, edges=None, colours=None):
+        r"""
+        Method that returns the message that updates the rendered object to
+        the provided arrays, without sending it. Only the arrays that are
+        different from the ones of the previous message are included and they
+        are stored as the current state of the widget.
+
+        Parameters
+        ----------
+        points : ``(n_points, 3)`` `ndarray`
+            The vertices.
+        trilist : ``(n_tris, 3)`` `ndarray` or ``None``, optional
+            The triangles.
+        edges : ``(n_edges, 2)`` `ndarray` or ``None``, optional
+            The edges, which are rendered if there are no triangles.
+        colours : ``(n_points, 3)`` `ndarray` or ``None``, optional
+            The per-vertex colours in the range ``[0, 1]``.
+
+        Returns
+        -------
+        content : `dict`
+            The content of the message, i.e. the names and dtypes of the sent
+            buffers.
+        buffers : `list` of `memoryview`
+            The binary buffers, in the order of ``content['names']``.
+        """
+        values = {
+            "points": points,
+            "trilist": trilist,
+            "edges": edges,
+            "colours": colours,
+        }
+        names = []
+        for name, dtype in self.buffer_dtypes.items():
+            if values[name] is None:
+                array = np.empty(0, dtype=dtype)
+            else:
+                array = np.ascontiguousarray(values[name], dtype=dtype).ravel()
+            if name in self.arrays and np.array_equal(self.arrays[name], array):
+                continue
+            self.arrays[name] = array
+            names.append(name)
+        return self._update_message(names)
+
+    def set_mesh(self, points, trilist=None, edges=None, colours=None):
+        r"""
+        Method that updates the rendered object. Only the buffers that changed
+        are sent to the browser. See :meth:`mesh_message` for the parameters.
+        """
+        content, buffers = self.mesh_message(
+            points, trilist=trilist, edges=edges, colours=colours
+        )
+        if len(buffers) > 0:
+            self.send(content, buffers=buffers)
+
+    def state_message(self):
+        r"""
+        Method that returns the message with all the current buffers, which is
+        sent when a new view of the widget gets created.
+        """
+        return self._update_message(list(self.arrays.keys()))
+
+    def _update_message(self, names):
+        content = {
+            "method": "update",
+            "names": names,
+            "dtypes": {n: np.dtype(d).name for n, d in self.buffer_dtypes.items()},
+        }
+        return content, [memoryview(self.arrays[n]) for n in names]
+
+    def _handle_message(self, _, content, buffers):
+        if content.get("method") == "request_state" and len(self.arrays) > 0:
+            state_content, state_buffers = self.state_message()
+            self.send(state_content, buffers=state_buffers)
+
+
 class TriMeshOptionsWidget(MenpoWidget):
     r"""
     Creates a widget for selecting trimesh rendering options.
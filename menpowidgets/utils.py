@@ -5,6 +5,9 @@ import binascii
 import nest_asyncio
 import numpy as np
 
+from .numbering import numbered_points, render_culled_numbering
+from .reductions import reduced_image
+
 
 def do_one_iteration(kernel):
     nest_asyncio.apply()
@@ -395,15 +398,16 @@ def parse_slicing_command_with_comma(cmd, length):
 def parse_slicing_command_with_one_colon(cmd, length):
     r"""
     Function that parses a command for slicing which contains exactly one colon
-    (``:``). The function returns a `list` with the integer indices, after
-    interpreting the slicing command. It also ignores any redundant whitespaces
-    that may exist in the command. For example ::
+    (``:``). The function returns a `range` with the integer indices, after
+    interpreting the slicing command, so that no `list` gets allocated. It also
+    ignores any redundant whitespaces that may exist in the command. For
+    example ::
 
         parse_slicing_command_with_one_colon(:3, 10)
 
     returns ::
 
-        '[0, 1, 2]'
+        'range(0, 3)'
 
     Parameters
     ----------
@@ -414,9 +418,9 @@ def parse_slicing_command_with_one_colon(cmd, length):
 
     Returns
     -------
-    cmd_list : `list`
-        The list that can be used for slicing after interpreting and evaluating
-        the provided command.
+    cmd_range : `range`
+        The indices that can be used for slicing after interpreting and
+        evaluating the provided command.
 
     Raises
     ------
@@ -425,8 +429,8 @@ def parse_slicing_command_with_one_colon(cmd, length):
     ValueError
         Command must contain positive or negative integers.
     """
-    # this is necessary in order to return ranges with negative slices
-    tmp_list = list(range(length))
+    # slicing a range interprets negative values as slicing a list would
+    tmp_list = range(length)
 
     if cmd.startswith(":"):
         # cmd has the form ":3" or ":"
@@ -489,15 +493,16 @@ def parse_slicing_command_with_one_colon(cmd, length):
 def parse_slicing_command_with_two_colon(cmd, length):
     r"""
     Function that parses a command for slicing which contains exactly two colons
-    (``:``). The function returns a `list` with the integer indices, after
-    interpreting the slicing command. It also ignores any redundant whitespaces
-    that may exist in the command. For example ::
+    (``:``). The function returns a `range` with the integer indices, after
+    interpreting the slicing command, so that no `list` gets allocated. It also
+    ignores any redundant whitespaces that may exist in the command. For
+    example ::
 
         parse_slicing_command_with_two_colon(::3, 10)
 
     returns ::
 
-        '[0, 3, 6, 9]'
+        'range(0, 10, 3)'
 
     Parameters
     ----------
@@ -508,9 +513,9 @@ def parse_slicing_command_with_two_colon(cmd, length):
 
     Returns
     -------
-    cmd_list : `list`
-        The list that can be used for slicing after interpreting and evaluating
-        the provided command.
+    cmd_range : `range`
+        The indices that can be used for slicing after interpreting and
+        evaluating the provided command.
 
     Raises
     ------
@@ -519,8 +524,8 @@ def parse_slicing_command_with_two_colon(cmd, length):
     ValueError
         Command must contain positive or negative integers.
     """
-    # this is necessary in order to return ranges with negative slices
-    tmp_list = list(range(length))
+    # slicing a range interprets negative values as slicing a list would
+    tmp_list = range(length)
 
     if cmd.startswith("::"):
         # cmd has the form "::3" or "::"
@@ -582,9 +587,12 @@ def parse_slicing_command(cmd, length):
     Function that parses a command for slicing. It is able to recognize any
     slicing pattern of Python and detect pattern errors. Some characteristic
     examples are ":3", ":-2", "3:", "::3", "3::", "1:8", "1:8:2", "1, 5, -3",
-    "range(10)", "range("1, 10, 2)" etc. The function returns a `list` with the
-    integer indices, after interpreting the slicing command. It also ignores any
-    redundant whitespaces that may exist in the command.
+    "range(10)", "range("1, 10, 2)" etc. The function returns the integer
+    indices, after interpreting the slicing command. The commands with colons
+    (and ranges) return a lazy `range`, thus their cost does not depend on
+    `length`, whereas the commands with commas and single indices return a
+    `list`. It also ignores any redundant whitespaces that may exist in the
+    command.
 
     Parameters
     ----------
@@ -595,9 +603,9 @@ def parse_slicing_command(cmd, length):
 
     Returns
     -------
-    cmd_list : `list`
-        The list that can be used for slicing after interpreting and evaluating
-        the provided command.
+    cmd_list : `list` or `range`
+        The indices that can be used for slicing after interpreting and
+        evaluating the provided command.
 
     Raises
     ------
@@ -662,11 +670,12 @@ def parse_slicing_command(cmd, length):
 def list_has_constant_step(l):
     r"""
     Function that checks if a list of integers has a constant step between them
-    and returns the step.
+    and returns the step. The check is done in constant time for `range`
+    objects and vectorized for `ndarray` objects.
 
     Parameters
     ----------
-    l : `list`
+    l : `list` or `range` or `ndarray`
         The list to check.
 
     Returns
@@ -678,6 +687,14 @@ def list_has_constant_step(l):
     """
     if len(l) <= 1:
         return False, 1
+    if isinstance(l, range):
+        return True, l.step
+    if isinstance(l, np.ndarray):
+        steps = np.diff(l)
+        if np.all(steps == steps[0]):
+            return True, int(steps[0])
+        else:
+            return False, 1
     step = l[1] - l[0]
     s = step
     i = 2
@@ -690,6 +707,25 @@ def list_has_constant_step(l):
         return False, 1
 
 
+def figure_to_rgb(figure):
+    r"""
+    Function that draws a Matplotlib figure on its canvas and returns the
+    rendered pixels, without displaying the figure.
+
+    Parameters
+    ----------
+    figure : `matplotlib.figure.Figure`
+        The figure.
+
+    Returns
+    -------
+    frame : ``(height, width, 3)`` `ndarray`
+        The ``uint8`` RGB pixels.
+    """
+    figure.canvas.draw()
+    return np.ascontiguousarray(np.asarray(figure.canvas.buffer_rgba())[..., :3])
+
+
 def sample_colours_from_colourmap(n_colours, colour_map):
     import matplotlib.pyplot as plt
 
@@ -736,6 +772,65 @@ def extract_groups_labels_from_image(image):
     return groups_keys, labels_keys
 
 
+def label_indices(labels, with_labels):
+    r"""
+    Function that returns the indices of the selected labels in the `list` of
+    all the labels. The labels are sorted once and the selected ones are
+    looked up with a binary search, thus the mapping is vectorised rather than
+    quadratic in the number of labels.
+
+    Parameters
+    ----------
+    labels : `list` of `str`
+        All the labels.
+    with_labels : `list` of `str`
+        The selected labels.
+
+    Returns
+    -------
+    indices : ``(n_selected,)`` `ndarray` of `int`
+        The index of each selected label.
+
+    Raises
+    ------
+    ValueError
+        A selected label is not one of the labels.
+    """
+    labels = np.asarray(labels, dtype=object)
+    with_labels = np.asarray(with_labels, dtype=object)
+    order = np.argsort(labels, kind="stable")
+    positions = np.searchsorted(labels, with_labels, sorter=order)
+    positions = np.minimum(positions, max(len(labels) - 1, 0))
+    indices = order[positions] if len(labels) > 0 else positions
+    if len(with_labels) > 0 and (
+        len(labels) == 0 or np.any(labels[indices] != with_labels)
+    ):
+        raise ValueError("with_labels should be a subset of the labels")
+    return indices
+
+
+def select_label_colours(options, labels, keys):
+    r"""
+    Function that keeps the colours of the selected labels, i.e. of
+    ``options['with_labels']``, in the per label colour options.
+
+    Parameters
+    ----------
+    options : `dict`
+        The render options. The colour options are replaced in place.
+    labels : `list` of `str`
+        All the labels. The colour options have one colour per label.
+    keys : `list` of `str`
+        The colour options, e.g. ``['line_colour', 'marker_face_colour']``.
+    """
+    indices = label_indices(labels, options["with_labels"])
+    for key in keys:
+        # The trailing None makes a 1D object array even if the colours are
+        # RGB sequences of the same length
+        colours = np.array(list(options[key]) + [None], dtype=object)[:-1]
+        options[key] = colours[indices].tolist()
+
+
 def render_image(
     image,
     renderer,
@@ -793,11 +888,25 @@ def render_image(
     interpolation,
     alpha,
     cmap_name,
+    numbers_min_distance=None,
+    channels_view="channels",
+    force_draw=True,
 ):
+    # Render the cached reduction of the channels instead of the channels
+    if channels_view != "channels":
+        image = reduced_image(image, channels_view, channels)
+        channels = None
+
     # This makes the code shorter for dealing with masked images vs non-masked
     # images
     mask_arguments = {"masked": masked_enabled} if image_is_masked else {}
 
+    # The culled numbering is rendered once the axes limits are set, instead
+    # of a Text artist per point by menpo
+    culled_numbering = render_numbering and numbers_min_distance is not None
+    if culled_numbering:
+        render_numbering = False
+
     # plot
     if render_landmarks and group is not None:
         renderer = image.view_landmarks(
@@ -876,8 +985,27 @@ def render_image(
             **mask_arguments
         )
 
-    # show plot
-    renderer.force_draw()
+    if culled_numbering and render_landmarks and group is not None:
+        points, numbers = numbered_points(
+            image.landmarks[group], with_labels=with_labels, image_view=True
+        )
+        render_culled_numbering(
+            renderer.figure.gca(),
+            points,
+            numbers=numbers,
+            min_distance=numbers_min_distance,
+            numbers_horizontal_align=numbers_horizontal_align,
+            numbers_vertical_align=numbers_vertical_align,
+            numbers_font_name=numbers_font_name,
+            numbers_font_size=numbers_font_size,
+            numbers_font_style=numbers_font_style,
+            numbers_font_weight=numbers_font_weight,
+            numbers_font_colour=numbers_font_colour,
+        )
+
+    # show plot, unless it gets shown as a draft
+    if force_draw:
+        renderer.force_draw()
 
     return renderer
 
@@ -983,3 +1111,205 @@ def render_patches(
     renderer.force_draw()
 
     return renderer
+
+
+def render_object_view(obj, renderer, **kwargs):
+    r"""
+    Function that renders an object with its ``view()`` method on the figure
+    of the provided renderer. It is the render function of the export jobs of
+    objects that are rendered without any preprocessing, e.g. shapes.
+
+    Parameters
+    ----------
+    obj : `object`
+        The object to render, e.g. a `menpo.shape.PointCloud`.
+    renderer : `menpo.visualize.Renderer` or subclass
+        The renderer object whose figure is used.
+    kwargs : `dict`
+        The options that are passed to ``view()``.
+
+    Returns
+    -------
+    renderer : `menpo.visualize.Renderer` or subclass
+        The renderer object.
+    """
+    return obj.view(figure_id=renderer.figure_id, new_figure=False, **kwargs)
+
+
+def blank_renderer():
+    r"""
+    Function that creates a renderer object on a new Matplotlib figure, so that
+    the render functions can draw on its figure without a widget.
+
+    Returns
+    -------
+    renderer : `menpo.visualize.viewmatplotlib.MatplotlibImageViewer2d`
+        The renderer object.
+    """
+    from menpo.visualize.viewmatplotlib import MatplotlibImageViewer2d
+
+    return MatplotlibImageViewer2d(
+        figure_id=None, new_figure=True, image=np.zeros((10, 10))
+    )
+
+
+def render_mesh_view(renderer, shape, options):
+    r"""
+    Function that renders a 3D shape on a `menpowidgets.tools.MeshViewWidget`.
+
+    Parameters
+    ----------
+    renderer : `menpowidgets.tools.MeshViewWidget`
+        The WebGL renderer.
+    shape : `menpo.shape.PointCloud` or subclass
+        The 3D object to render. A `menpo.shape.TriMesh` is rendered as a
+        mesh, with the per-vertex colours of a `menpo.shape.ColouredTriMesh`
+        or the texture of a `menpo.shape.TexturedTriMesh` sampled at its
+        vertices. Any other object is rendered with points and edges.
+    options : `dict`
+        The rendering options, i.e. the selected values of a
+        `menpowidgets.options.Mesh3DOptionsWidget` for meshes or the markers
+        and lines options of a `menpowidgets.options.Shape3DOptionsWidget`
+        for the rest of the objects.
+
+    Returns
+    -------
+    renderer : `menpowidgets.tools.MeshViewWidget`
+        The renderer object.
+    """
+    from matplotlib.colors import to_hex
+    from menpo.shape import TriMesh, ColouredTriMesh, TexturedTriMesh
+
+    trilist = None
+    edges = None
+    colours = None
+    if isinstance(shape, TriMesh):
+        trilist = shape.trilist
+        mesh_type = options.get("mesh_type", "surface")
+        if mesh_type not in ("surface", "points"):
+            mesh_type = "wireframe"
+        colour = options.get("colour", "red")
+        if isinstance(shape, ColouredTriMesh):
+            colours = shape.colours
+        elif isinstance(shape, TexturedTriMesh):
+            colours = shape.texture.sample(shape.tcoords_pixel_scaled()).T
+        if colours is not None and colours.shape[1] == 1:
+            colours = np.repeat(colours, 3, axis=1)
+    else:
+        if options["render_lines"] and hasattr(shape, "edges"):
+            edges = shape.edges
+        mesh_type = "points" if options["render_markers"] else "wireframe"
+        colour = options[
+            "marker_colour" if options["render_markers"] else "line_colour"
+        ]
+        if isinstance(colour, list):
+            colour = colour[0]
+
+    renderer.mesh_type = mesh_type
+    renderer.colour = to_hex(colour)
+    renderer.alpha = float(options.get("alpha", 1.0))
+    renderer.render_colours = colours is not None and options.get(
+        "render_texture", True
+    )
+    renderer.set_mesh(shape.points, trilist=trilist, edges=edges, colours=colours)
+    return renderer
+
+
+def is_masked_image(image):
+    r"""
+    Function that checks if an image is a `menpo.image.MaskedImage`.
+
+    Parameters
+    ----------
+    image : `menpo.image.Image` or subclass
+        The image.
+
+    Returns
+    -------
+    is_masked : `bool`
+        ``True`` if the image is masked.
+    """
+    from menpo.image import MaskedImage
+
+    return isinstance(image, MaskedImage)
+
+
+def figure_to_png(figure):
+    r"""
+    Function that encodes a Matplotlib figure as PNG.
+
+    Parameters
+    ----------
+    figure : `matplotlib.figure.Figure`
+        The figure.
+
+    Returns
+    -------
+    png : `bytes`
+        The encoded figure.
+    """
+    from io import BytesIO
+
+    buffer = BytesIO()
+    figure.savefig(buffer, format="png", dpi=figure.dpi)
+    return buffer.getvalue()
+
+
+def png_to_rgb(png):
+    r"""
+    Function that decodes a PNG frame to an RGB array.
+
+    Parameters
+    ----------
+    png : `bytes`
+        The encoded frame.
+
+    Returns
+    -------
+    frame : ``(height, width, 3)`` `uint8` `ndarray`
+        The RGB pixels.
+    """
+    from io import BytesIO
+    from PIL import Image as PILImage
+
+    return np.asarray(PILImage.open(BytesIO(png)).convert("RGB"))
+
+
+def _running_loop():
+    # The event loop of the kernel, if the code runs within it
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def loop_thread_callback(function):
+    r"""
+    Function that wraps a callback, so that it runs on the thread of the event
+    loop that is running when it gets wrapped, e.g. the kernel's, even if it
+    gets called from another thread, e.g. a thread of
+    `menpowidgets.workers.RenderPool`. Thus the callback can set the values of
+    widgets, which are synced by the kernel's thread. If there is no running
+    loop, then the callback is returned as is.
+
+    Parameters
+    ----------
+    function : `callable`
+        The callback.
+
+    Returns
+    -------
+    callback : `callable`
+        The wrapped callback. It returns ``None``.
+    """
+    loop = _running_loop()
+    if loop is None:
+        return function
+
+    def callback(*args):
+        if _running_loop() is loop:
+            function(*args)
+        else:
+            loop.call_soon_threadsafe(function, *args)
+
+    return callback
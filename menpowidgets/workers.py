@@ -0,0 +1,364 @@
+r"""
+Rendering and exporting of figures in worker processes.
+"""
+
+from collections import OrderedDict
+import weakref
+
+import numpy as np
+
+from .utils import blank_renderer, is_masked_image
+
+
+def init_export_worker():
+    r"""
+    Function that initializes an export worker process, so that it renders
+    with the non-interactive Agg backend of Matplotlib.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def save_figure_job(render_function, kwargs, filename, save_kwargs):
+    r"""
+    Function that renders a figure and saves it to file. It runs in the worker
+    processes of the batch export of
+    `menpowidgets.options.SaveMatplotlibFigureOptionsWidget`, thus all its
+    arguments must be picklable.
+
+    Parameters
+    ----------
+    render_function : `callable`
+        A module-level function that renders the figure. It is called as
+        ``render_function(renderer=renderer, **kwargs)`` and returns the
+        renderer object, e.g. :func:`menpowidgets.utils.render_image` or
+        :func:`menpowidgets.utils.render_object_view`.
+    kwargs : `dict`
+        The arguments of `render_function`.
+    filename : `str`
+        The path of the saved file.
+    save_kwargs : `dict`
+        The options that are passed to the ``save_figure()`` method of the
+        renderer, apart from the filename.
+
+    Returns
+    -------
+    filename : `str`
+        The path of the saved file.
+    """
+    import matplotlib.pyplot as plt
+
+    renderer = blank_renderer()
+    try:
+        renderer = render_function(renderer=renderer, **kwargs)
+        renderer.save_figure(filename=filename, **save_kwargs)
+    finally:
+        # The figures are created with pyplot, so they must be closed in
+        # order not to accumulate in the worker
+        plt.close("all")
+    return filename
+
+
+def share_array(array):
+    r"""
+    Function that copies an array to a new block of shared memory, so that
+    other processes can read it without pickling it.
+
+    Parameters
+    ----------
+    array : `ndarray`
+        The array.
+
+    Returns
+    -------
+    segment : `multiprocessing.shared_memory.SharedMemory`
+        The shared memory block. It must be kept open while the array is
+        used and unlinked afterwards.
+    handle : (`str`, `tuple`, `str`)
+        The picklable name, shape and dtype of the array (see
+        :func:`attach_array`).
+    """
+    from multiprocessing import shared_memory
+
+    array = np.ascontiguousarray(array)
+    segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+    return segment, (segment.name, array.shape, array.dtype.str)
+
+
+def attach_array(handle):
+    r"""
+    Function that attaches to an array shared with :func:`share_array`.
+
+    Parameters
+    ----------
+    handle : (`str`, `tuple`, `str`)
+        The name, shape and dtype of the array.
+
+    Returns
+    -------
+    segment : `multiprocessing.shared_memory.SharedMemory`
+        The shared memory block. It must be closed (not unlinked) when the
+        array is not used anymore.
+    array : `ndarray`
+        The array, which is a view of the shared memory.
+    """
+    from multiprocessing import shared_memory
+
+    # The processes of a pool share the resource tracker of the process that
+    # created the block, which unregisters it when unlinking it
+    name, shape, dtype = handle
+    segment = shared_memory.SharedMemory(name=name)
+    return segment, np.ndarray(shape, dtype=dtype, buffer=segment.buf)
+
+
+def _unlink_segments(segments):
+    for segment in segments:
+        segment.close()
+        try:
+            segment.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SharedImages(object):
+    r"""
+    Class that shares the pixels, mask and landmark points of images through
+    shared memory with the processes of a `RenderPool`. The arrays of the
+    most recently shared images are kept, so that rendering an image again
+    with other options does not copy them again. An image is shared again if
+    its pixels or landmarks objects have been replaced.
+
+    Parameters
+    ----------
+    n_cached_images : `int`, optional
+        The number of images whose shared arrays are kept.
+    """
+
+    def __init__(self, n_cached_images=8):
+        self.n_cached_images = n_cached_images
+        self._images = OrderedDict()
+        # Unlink the shared memory when the object gets collected, or at exit
+        self._segments = []
+        self._finalizer = weakref.finalize(self, _unlink_segments, self._segments)
+
+    @staticmethod
+    def _version(image):
+        return (id(image.pixels), id(getattr(image, "mask", None))) + tuple(
+            (g, id(image.landmarks[g]), id(image.landmarks[g].points))
+            for g in image.landmarks.group_labels
+        )
+
+    def share(self, image):
+        r"""
+        Method that shares an image.
+
+        Parameters
+        ----------
+        image : `menpo.image.Image` or `menpo.image.MaskedImage`
+            The image.
+
+        Returns
+        -------
+        handle : `tuple`
+            The picklable handle of the image (see :func:`attach_image`).
+        """
+        import copy
+
+        version = self._version(image)
+        entry = self._images.get(id(image))
+        # The image is referenced by the entry, so its id is not reused
+        if entry is not None and entry[0] is image and entry[1] == version:
+            self._images.move_to_end(id(image))
+            return entry[3]
+
+        segments = []
+        segment, pixels = share_array(image.pixels)
+        segments.append(segment)
+        mask = None
+        if is_masked_image(image):
+            segment, mask = share_array(image.mask.pixels[0])
+            segments.append(segment)
+        landmarks = []
+        for group in image.landmarks.group_labels:
+            # The landmarks are pickled without their points
+            skeleton = copy.copy(image.landmarks[group])
+            segment, points = share_array(skeleton.points)
+            segments.append(segment)
+            skeleton.points = None
+            landmarks.append((group, skeleton, points))
+        handle = (pixels, mask, landmarks)
+
+        if entry is not None:
+            self._release(id(image))
+        self._images[id(image)] = (image, version, segments, handle)
+        self._segments.extend(segments)
+        while len(self._images) > self.n_cached_images:
+            self._release(next(iter(self._images)))
+        return handle
+
+    def _release(self, key):
+        _, _, segments, _ = self._images.pop(key)
+        for segment in segments:
+            self._segments.remove(segment)
+        _unlink_segments(segments)
+
+    def close(self):
+        r"""
+        Method that unlinks the shared memory of all the images. The images
+        get shared again if they are requested afterwards.
+        """
+        self._images.clear()
+        _unlink_segments(self._segments)
+        del self._segments[:]
+
+
+def attach_image(handle):
+    r"""
+    Function that rebuilds an image shared with `SharedImages`, on top of its
+    shared memory.
+
+    Parameters
+    ----------
+    handle : `tuple`
+        The handle of the image.
+
+    Returns
+    -------
+    image : `menpo.image.Image` or `menpo.image.MaskedImage`
+        The image. Its pixels are a view of the shared memory.
+    segments : `list` of `multiprocessing.shared_memory.SharedMemory`
+        The shared memory blocks, which must be closed when the image is not
+        used anymore.
+    """
+    from menpo.image import Image, MaskedImage
+
+    pixels_handle, mask_handle, landmarks = handle
+    segment, pixels = attach_array(pixels_handle)
+    segments = [segment]
+    if mask_handle is not None:
+        segment, mask = attach_array(mask_handle)
+        segments.append(segment)
+        image = MaskedImage(pixels, mask=mask, copy=False)
+    else:
+        image = Image(pixels, copy=False)
+    for group, skeleton, points_handle in landmarks:
+        segment, skeleton.points = attach_array(points_handle)
+        segments.append(segment)
+        image.landmarks[group] = skeleton
+    return image, segments
+
+
+def close_segments(segments):
+    r"""
+    Function that closes attached shared memory blocks. The blocks whose
+    arrays are still referenced stay open until they get collected.
+
+    Parameters
+    ----------
+    segments : `list` of `multiprocessing.shared_memory.SharedMemory`
+        The shared memory blocks.
+    """
+    import gc
+
+    gc.collect()
+    for segment in segments:
+        try:
+            segment.close()
+        except BufferError:
+            pass
+
+
+class RenderPool(object):
+    r"""
+    Class that renders frames in a pool of worker processes, so that the
+    kernel keeps processing widget messages while heavy figures render. Only
+    the latest request matters: submitting a request cancels the ones that
+    have not started yet and the results of the ones that were running are
+    dropped. The processes are spawned on the first request.
+
+    Parameters
+    ----------
+    n_workers : `int`, optional
+        The number of worker processes.
+    """
+
+    def __init__(self, n_workers=1):
+        if n_workers < 1:
+            raise ValueError("n_workers must be a positive integer")
+        self.n_workers = n_workers
+        self._executor = None
+        self._latest = None
+        self._pending = set()
+
+    def submit(self, callback, render_function, *args):
+        r"""
+        Method that submits a request.
+
+        Parameters
+        ----------
+        callback : `callable`
+            The function that gets called with the `concurrent.futures.Future`
+            of the request once it is done, unless a newer request has been
+            submitted. It runs in a thread of the pool, unless it is wrapped
+            with :func:`menpowidgets.utils.loop_thread_callback`.
+        render_function : `callable`
+            A module-level function that renders the frame, e.g.
+            :func:`menpowidgets.render.render_image_frame`.
+        args : `tuple`
+            The picklable arguments of `render_function`.
+
+        Returns
+        -------
+        future : `concurrent.futures.Future`
+            The future of the request.
+        """
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        if self._executor is None:
+            # Spawn the workers, since forking a kernel with running threads
+            # is not safe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_export_worker,
+            )
+        # The running requests cannot be cancelled, but their results are
+        # dropped
+        for future in list(self._pending):
+            future.cancel()
+        future = self._executor.submit(render_function, *args)
+        self._pending.add(future)
+        self._latest = future
+
+        def done(f):
+            self._pending.discard(f)
+            if f is self._latest and not f.cancelled():
+                callback(f)
+
+        future.add_done_callback(done)
+        return future
+
+    def wait(self):
+        r"""
+        Method that waits for the latest request.
+
+        Returns
+        -------
+        result : `object` or ``None``
+            The result of the latest request or ``None`` if there is none.
+        """
+        return None if self._latest is None else self._latest.result()
+
+    def shutdown(self):
+        r"""
+        Method that stops the worker processes. They get spawned again on the
+        next request.
+        """
+        if self._executor is not None:
+            for future in list(self._pending):
+                future.cancel()
+            self._executor.shutdown(wait=False)
+            self._executor = None